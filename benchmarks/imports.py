@@ -0,0 +1,51 @@
+"""Wykop import time benchmark.
+
+Measures cold start of fresh interpreter importing wykop clients
+(interpreter startup subtracted) and lists heavy modules loaded.
+
+Usage: python benchmarks/imports.py [repeat]
+"""
+import os
+import subprocess
+import sys
+import time
+
+CASES = [
+    ('import wykop', 'import wykop'),
+    ('v2 client', 'from wykop import WykopAPIv2'),
+    ('v1 client', 'from wykop import WykopAPI'),
+    ('v2 request', 'from wykop import WykopAPIv2; '
+                   'WykopAPIv2("appkey", "secretkey").get_user_agent()'),
+]
+HEAVY_MODULES = [
+    'pkg_resources', 'requests', 'wykop.api.v1.clients',
+    'wykop.api.v2.clients', 'multiprocessing.pool', 'urllib.request',
+]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    started = time.time()
+    output = subprocess.check_output(
+        [sys.executable, '-c', code], env=env)
+    return time.time() - started, output
+
+
+def measure(code, repeat):
+    return min(run(code)[0] for _ in range(repeat))
+
+
+def main(repeat=10):
+    startup = measure('pass', repeat)
+    for name, code in CASES:
+        elapsed = measure(code, repeat) - startup
+        _, output = run(
+            code + '; import sys; print(",".join(name for name in %r '
+            'if name in sys.modules))' % (HEAVY_MODULES, ))
+        print("%-12s %6.1f ms  loaded: %s" % (
+            name, elapsed * 1000, output.decode().strip() or '-'))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,91 @@
+"""Wykop API models benchmark.
+
+Compares memory held by and construction time of decoded entries as
+`WykopAPIResponse` dicts and as typed `Entry` models, with all fields
+and projected to a few ones.
+
+Usage: python benchmarks/models.py [entries] [number]
+"""
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+from wykop.api.exceptions import default_exception_resolver
+from wykop.api.models import Entry, TypedWrapper, WykopAPIResponse, wrap
+from wykop.api.parsers.json import JSONParser
+
+FIELDS = ['id', 'date', 'author.login', 'vote_count']
+
+
+def get_author(i):
+    return {
+        'login': 'user%d' % i,
+        'color': i % 6,
+        'sex': 'male',
+        'avatar': 'https://www.wykop.pl/cdn/c3397993/user%d.jpg' % i,
+    }
+
+
+def get_entry(i):
+    return {
+        'id': i,
+        'date': '2020-01-01 12:00:00',
+        'body': 'lorem ipsum dolor sit amet %d' % i,
+        'author': get_author(i),
+        'blocked': False,
+        'favorite': False,
+        'vote_count': i % 50,
+        'comments_count': 0,
+        'status': 'visible',
+        'embed': None,
+        'user_vote': 0,
+        'can_comment': True,
+        'app': None,
+        'violation_url': 'https://a2.wykop.pl/violations/%d' % i,
+    }
+
+
+def get_payload(entries):
+    return json.dumps({'data': [get_entry(i) for i in range(entries)]})
+
+
+def measure_memory(parse, payload):
+    gc.collect()
+    tracemalloc.start()
+    response = parse(payload)
+    # dict model is built on access
+    for entry in response.data:
+        entry.author
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, response
+
+
+def main(entries=10000, number=10):
+    payload = get_payload(entries)
+    parsers = [
+        ('dict', JSONParser(
+            default_exception_resolver, object_hook=WykopAPIResponse)),
+        ('typed', JSONParser(
+            default_exception_resolver, backend='json',
+            wrapper=TypedWrapper(Entry))),
+        ('typed (fastest backend)', JSONParser(
+            default_exception_resolver, wrapper=TypedWrapper(Entry))),
+        ('dict (projected)', JSONParser(
+            default_exception_resolver, wrapper=wrap, fields=FIELDS)),
+        ('typed (projected)', JSONParser(
+            default_exception_resolver, wrapper=TypedWrapper(Entry),
+            fields=FIELDS)),
+    ]
+    for name, parser in parsers:
+        size, _ = measure_memory(parser.parse, payload)
+        elapsed = timeit.timeit(
+            lambda: parser.parse(payload), number=number) / number
+        print("%-24s memory: %6.2f MiB (%4d B/entry)  parse: %6.2f ms" % (
+            name, size / 1024.0 / 1024, size // entries, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
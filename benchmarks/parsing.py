@@ -0,0 +1,110 @@
+"""Wykop API response parsing benchmark.
+
+Parses large link comments page (and reads few fields of each comment)
+with `object_hook` parser, with each installed JSON backend and with lazy
+parser (decoding comments on access). Response body bytes are parsed as
+read by requester and after decoding to text (as requesters used to).
+Memory kept by parsed response is measured with `tracemalloc`.
+
+Usage: python benchmarks/parsing.py [number] [comments]
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+
+from wykop.api.exceptions import default_exception_resolver
+from wykop.api.models import WykopAPIResponse, wrap
+from wykop.api.parsers.backends import JSON_BACKENDS
+from wykop.api.parsers.json import JSONParser
+from wykop.utils import force_text
+
+
+def get_author(i):
+    return {
+        'login': 'user%d' % i,
+        'color': i % 6,
+        'sex': 'male',
+        'avatar': 'https://www.wykop.pl/cdn/c3397993/user%d.jpg' % i,
+        'signup_at': '2015-01-01 10:00:00',
+    }
+
+
+def get_comment(i):
+    return {
+        'id': i,
+        'date': '2020-01-01 12:00:00',
+        'author': get_author(i),
+        'vote_count': i % 50,
+        'vote_count_plus': i % 50,
+        'body': 'lorem ipsum dolor sit amet ' * 8,
+        'parent_id': i - i % 5,
+        'can_vote': True,
+        'user_vote': 0,
+        'blocked': False,
+        'deleted': False,
+        'type': 'link_comment',
+        'embed': None if i % 3 else {
+            'type': 'image',
+            'url': 'https://www.wykop.pl/cdn/c3201142/%d.jpg' % i,
+            'preview': 'https://www.wykop.pl/cdn/c3201142/%d,w104.jpg' % i,
+            'plus18': False,
+            'animated': False,
+        },
+        'violation_url': 'https://a2.wykop.pl/violations/%d' % i,
+    }
+
+
+def get_payload(comments):
+    return json.dumps({
+        'data': [get_comment(i) for i in range(comments)],
+        'pagination': {'next': 'https://a2.wykop.pl/links/comments/2'},
+    })
+
+
+def read(response):
+    for comment in response.data:
+        comment.id, comment.author.login, comment.vote_count
+
+
+def get_kept_memory(parse):
+    tracemalloc.start()
+    response = parse()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del response
+    return kept
+
+
+def main(number=20, comments=2000):
+    payload = get_payload(comments)
+    parsers = [('object_hook', JSONParser(
+        default_exception_resolver, object_hook=WykopAPIResponse))]
+    for backend in JSON_BACKENDS:
+        try:
+            parser = JSONParser(
+                default_exception_resolver, backend=backend, wrapper=wrap)
+        except ImportError:
+            continue
+        parsers.append((backend, parser))
+    parsers.append(('lazy', JSONParser(
+        default_exception_resolver, wrapper=wrap, lazy=True)))
+
+    body = payload.encode('utf-8')
+    print("payload: %d comments, %d KiB" % (comments, len(body) // 1024))
+    for name, parser in parsers:
+        parse_text = timeit.timeit(
+            lambda: parser.parse(force_text(body)), number=number)
+        parse = timeit.timeit(
+            lambda: parser.parse(body), number=number)
+        parse_read = timeit.timeit(
+            lambda: read(parser.parse(body)), number=number)
+        kept = get_kept_memory(lambda: parser.parse(body))
+        print("%-12s parse text: %6.2f ms  parse: %6.2f ms  "
+              "parse and read: %6.2f ms  kept: %5d KiB" % (
+                  name, parse_text / number * 1000, parse / number * 1000,
+                  parse_read / number * 1000, kept // 1024))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
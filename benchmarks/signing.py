@@ -0,0 +1,45 @@
+"""Wykop API request signing benchmark.
+
+Compares signing cost per request of precomputed secret key hash with
+hashing secret key, URL and parameters from scratch.
+
+Usage: python benchmarks/signing.py [number]
+"""
+import hashlib
+import sys
+import timeit
+
+from wykop.api.clients import BaseWykopAPI
+from wykop.utils import force_bytes
+
+URL = 'https://a2.wykop.pl/Entries/Entry/12345/appkey/abc/'
+POST_PARAMS = {'body': u'zażółć gęślą jaźń', 'embed': 'https://wykop.pl'}
+
+
+def sign_from_scratch(api, url, **post_params):
+    post_params_values = api.get_post_params_values(**post_params)
+    return hashlib.md5(
+        force_bytes(api.secretkey) + force_bytes(url) +
+        force_bytes(",".join(post_params_values))).hexdigest()
+
+
+def main(number=100000):
+    api = BaseWykopAPI('appkey', 'secretkey')
+    cases = [
+        ('no params', {}),
+        ('post params', POST_PARAMS),
+    ]
+    for name, post_params in cases:
+        assert api.get_api_sign(URL, **post_params) == \
+            sign_from_scratch(api, URL, **post_params)
+        before = timeit.timeit(
+            lambda: sign_from_scratch(api, URL, **post_params),
+            number=number)
+        after = timeit.timeit(
+            lambda: api.get_api_sign(URL, **post_params), number=number)
+        print("%-12s before: %.2f us  after: %.2f us" % (
+            name, before / number * 1e6, after / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
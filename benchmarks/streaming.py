@@ -0,0 +1,89 @@
+"""Wykop API streaming parsing benchmark.
+
+Compares peak memory and time to first item of parsing whole large
+response (as read by requester) against parsing it incrementally from
+chunks, processing items one by one.
+
+Usage: python benchmarks/streaming.py [entries]
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from wykop.api.parsers import default_parser
+from wykop.utils import force_text
+
+CHUNK_SIZE = 64 * 1024
+
+
+def get_entry(i):
+    return {
+        'id': i,
+        'date': '2020-01-01 12:00:00',
+        'body': 'lorem ipsum dolor sit amet %d' % i,
+        'author': {
+            'login': 'user%d' % i,
+            'color': i % 6,
+            'avatar': 'https://www.wykop.pl/cdn/c3397993/user%d.jpg' % i,
+        },
+        'vote_count': i % 50,
+        'status': 'visible',
+        'violation_url': 'https://a2.wykop.pl/violations/%d' % i,
+    }
+
+
+def get_chunks(entries):
+    body = json.dumps(
+        {'data': [get_entry(i) for i in range(entries)]}).encode('utf-8')
+    return [
+        body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+
+def parse_whole(chunks):
+    # requester reads whole body and decodes it
+    response = default_parser.parse(force_text(b''.join(chunks)))
+    for item in response.data:
+        yield item
+
+
+def parse_stream(chunks):
+    return default_parser.parse_stream(iter(chunks))
+
+
+def consume(parse, chunks):
+    start = time.time()
+    first = None
+    for item in parse(chunks):
+        if first is None:
+            first = time.time() - start
+        item.author.login
+    return first, time.time() - start
+
+
+def measure(parse, chunks):
+    gc.collect()
+    first, elapsed = consume(parse, chunks)
+    # timed without tracing, which slows allocations down
+    tracemalloc.start()
+    consume(parse, chunks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, first, elapsed
+
+
+def main(entries=50000):
+    chunks = get_chunks(entries)
+    size = sum(len(chunk) for chunk in chunks)
+    print("response: %.2f MiB in %d chunks" % (
+        size / 1024.0 / 1024, len(chunks)))
+    for name, parse in [('whole', parse_whole), ('stream', parse_stream)]:
+        peak, first, elapsed = measure(parse, chunks)
+        print("%-8s peak memory: %7.2f MiB  first item: %8.2f ms  "
+              "total: %7.2f ms" % (
+                  name, peak / 1024.0 / 1024, first * 1000, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
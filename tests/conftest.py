@@ -0,0 +1,10 @@
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 7):
+    # asyncio tests use asyncio.run and mock.AsyncMock (mock 4.0+)
+    collect_ignore += [
+        'unit/api/aio',
+        'functional/test_api_v2_aio.py',
+    ]
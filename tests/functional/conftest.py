@@ -32,3 +32,16 @@ def wykop_api_v2():
     api = WykopAPIv2(appkey, secretkey)
     api._domain = 'api.test.com'
     return api
+
+
+@pytest.fixture
+def async_wykop_api_v2():
+    from wykop.api.aio.requesters.executor import ExecutorRequester
+    from wykop.api.aio.v2 import AsyncWykopAPIv2
+
+    appkey = '123456app'
+    secretkey = '654321secret'
+    requester = ExecutorRequester(RequestsRequester())
+    api = AsyncWykopAPIv2(appkey, secretkey, requester=requester)
+    api._domain = 'api.test.com'
+    return api
@@ -2,6 +2,8 @@ import json
 import mock
 import responses
 
+from wykop.api.requesters.urllib import UrllibRequester
+
 
 class FileMock(object):
 
@@ -202,9 +204,9 @@ class TestWykopAPIv2(object):
 
         response = wykop_api_v2.request(rtype, rmethod, parser=None)
 
-        assert response == body
+        assert response == body.encode('utf-8')
 
-    @mock.patch('wykop.api.requesters.urllib.urlopen')
+    @mock.patch.object(UrllibRequester, '_urlopen')
     def test_urllib_requester(
             self, mocked_urlopen, wykop_api_v2, urllib_requester):
         rtype = 'rtype'
@@ -213,7 +215,7 @@ class TestWykopAPIv2(object):
             'data': 'data'
         }
         body = json.dumps(body_dict)
-        mocked_urlopen.return_value = FileMock(body)
+        mocked_urlopen.return_value = (200, body)
 
         response = wykop_api_v2.request(
             rtype, rmethod, requester=urllib_requester)
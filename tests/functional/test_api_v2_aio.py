@@ -0,0 +1,39 @@
+import asyncio
+import json
+
+import responses
+
+
+class TestAsyncWykopAPIv2(object):
+
+    @responses.activate
+    def test_get_entry(self, async_wykop_api_v2):
+        body_dict = {
+            'data': {
+                'id': 1,
+            },
+        }
+        body = json.dumps(body_dict)
+
+        api_params = 'appkey/123456app/entry/1/format/json'
+        url = '{protocol}://{domain}/entries/{api_params}'.format(
+            protocol=async_wykop_api_v2._protocol,
+            domain=async_wykop_api_v2._domain,
+            api_params=api_params,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=body,
+            status=200,
+            content_type='application/json',
+        )
+
+        async def get_entries():
+            async with async_wykop_api_v2 as api:
+                return await asyncio.gather(
+                    api.get_entry(1), api.get_entry(1))
+
+        result = asyncio.run(get_entries())
+
+        assert result == [body_dict, body_dict]
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from wykop.api.exceptions import APITimeoutError
+from wykop.api.requesters.urllib import UrllibRequester
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.clients.add(self.client_address)
+        body = b'{"data": "data"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.posts += 1
+        self.rfile.read(int(self.headers['Content-Length']))
+        # hangs on second request of connection
+        if self.server.posts > 1:
+            self.server.release.wait()
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    httpd.clients = set()
+    httpd.posts = 0
+    httpd.release = threading.Event()
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield httpd
+    httpd.release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestUrllibRequester(object):
+
+    def test_keep_alive(self, server, urllib_requester):
+        url = 'http://127.0.0.1:{0}/entries'.format(server.server_port)
+
+        responses = [urllib_requester.make_request(url) for _ in range(3)]
+        urllib_requester.close()
+
+        assert responses == [b'{"data": "data"}'] * 3
+        assert len(server.clients) == 1
+
+    def test_timed_out_post_not_resent(self, server):
+        url = 'http://127.0.0.1:{0}/entries'.format(server.server_port)
+        requester = UrllibRequester(timeout=0.5)
+        requester.make_request(url, data={'body': 'first'})
+
+        with pytest.raises(APITimeoutError):
+            requester.make_request(url, data={'body': 'second'})
+        requester.close()
+
+        assert server.posts == 2
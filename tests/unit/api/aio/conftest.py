@@ -0,0 +1,24 @@
+import pytest
+
+from wykop.api.aio.v1 import AsyncWykopAPIv1
+from wykop.api.aio.v2 import AsyncWykopAPIv2
+
+
+@pytest.fixture
+def async_wykop_api_v2():
+    return AsyncWykopAPIv2(
+        'sentinel.appkey',
+        'sentinel.secretkey',
+        output='sentinel.output',
+        response_format='sentinel.format',
+    )
+
+
+@pytest.fixture
+def async_wykop_api_v1():
+    return AsyncWykopAPIv1(
+        'sentinel.appkey',
+        'sentinel.secretkey',
+        output='sentinel.output',
+        response_format='sentinel.format',
+    )
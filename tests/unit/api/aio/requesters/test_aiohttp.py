@@ -0,0 +1,44 @@
+from collections import namedtuple
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from aiohttp import FormData  # noqa: E402
+
+from wykop.api.aio.requesters.aiohttp import AiohttpRequester  # noqa: E402
+
+MockFile = namedtuple('MockFile', ['name', ])
+
+
+class TestAiohttpRequesterGetMethod(object):
+
+    @pytest.mark.parametrize("data,files,method", [
+        (None, None, 'GET'),
+        ({'test': 'data'}, None, 'POST'),
+        (None, {'testfile': MockFile('testfile')}, 'POST'),
+    ])
+    def test_method(self, data, files, method):
+        requester = AiohttpRequester()
+
+        result = requester._get_method(data, files)
+
+        assert result == method
+
+
+class TestAiohttpRequesterGetData(object):
+
+    def test_no_files(self):
+        requester = AiohttpRequester()
+
+        result = requester._get_data({'test': b'data'}, {})
+
+        assert result == {'test': 'data'}
+
+    def test_files(self):
+        requester = AiohttpRequester()
+
+        result = requester._get_data(
+            {'test': b'data'}, {'testfile': MockFile('testfile.png')})
+
+        assert isinstance(result, FormData)
@@ -0,0 +1,50 @@
+import asyncio
+
+import mock
+
+from wykop.api.aio.requesters.executor import ExecutorRequester
+from wykop.api.timeouts import deadline_at
+
+
+class TestExecutorRequesterMakeRequest(object):
+
+    def test_delegated(self):
+        url = mock.sentinel.url
+        data = mock.sentinel.data
+        headers = mock.sentinel.headers
+        files = mock.sentinel.files
+        response = mock.sentinel.response
+        sync_requester = mock.Mock(timeout=None)
+        sync_requester.make_request.return_value = response
+        requester = ExecutorRequester(sync_requester, max_workers=2)
+
+        result = asyncio.run(requester.make_request(
+            url, data=data, headers=headers, files=files))
+
+        sync_requester.make_request.assert_called_once_with(
+            url, data=data, headers=headers, files=files, timeout=None)
+        assert result == response
+
+    @mock.patch('wykop.api.timeouts.clock')
+    def test_deadline(self, mocked_clock):
+        mocked_clock.return_value = 100
+        sync_requester = mock.Mock(timeout=(5, 30))
+        requester = ExecutorRequester(sync_requester, max_workers=2)
+
+        async def make_request():
+            with deadline_at(110):
+                return await requester.make_request(mock.sentinel.url)
+
+        asyncio.run(make_request())
+
+        sync_requester.make_request.assert_called_once_with(
+            mock.sentinel.url, data=None, headers=None, files=None,
+            timeout=(5, 10))
+
+    def test_close(self):
+        requester = ExecutorRequester(mock.Mock())
+        executor = requester.executor
+
+        asyncio.run(requester.close())
+
+        assert requester.executor is not executor
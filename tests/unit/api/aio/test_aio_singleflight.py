@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from wykop.api.aio.singleflight import AsyncSingleFlight
+from wykop.api.exceptions import DeadlineExceededError, WykopAPIError
+from wykop.api.timeouts import deadline
+
+
+class TestAsyncSingleFlight(object):
+
+    def test_shared(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        async def call_concurrently():
+            return await asyncio.gather(
+                *[single_flight.call('key', func) for _ in range(5)])
+
+        result = asyncio.run(call_concurrently())
+
+        assert result == ['result'] * 5
+        assert len(calls) == 1
+        assert len(single_flight) == 0
+
+    def test_error_shared(self):
+        single_flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise WykopAPIError(1, 'error')
+
+        async def call_concurrently():
+            return await asyncio.gather(
+                *[single_flight.call('key', func) for _ in range(2)],
+                return_exceptions=True)
+
+        result = asyncio.run(call_concurrently())
+
+        assert result[0] is result[1]
+        assert isinstance(result[0], WykopAPIError)
+
+    def test_cancelled_caller(self):
+        single_flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        async def cancel_first():
+            first = asyncio.ensure_future(single_flight.call('key', func))
+            second = asyncio.ensure_future(single_flight.call('key', func))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(cancel_first()) == 'result'
+
+    def test_leader_deadline_not_shared(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.02)
+                raise DeadlineExceededError(0, 'Deadline exceeded')
+            return 'result'
+
+        async def lead():
+            with deadline(0.01):
+                return await single_flight.call('key', func)
+
+        async def call_concurrently():
+            return await asyncio.gather(
+                lead(), single_flight.call('key', func),
+                return_exceptions=True)
+
+        result = asyncio.run(call_concurrently())
+
+        assert isinstance(result[0], DeadlineExceededError)
+        assert result[1] == 'result'
+        assert len(calls) == 2
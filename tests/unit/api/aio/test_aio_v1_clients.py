@@ -0,0 +1,102 @@
+import asyncio
+from inspect import iscoroutinefunction
+
+import mock
+import pytest
+
+from wykop.api.aio.v1 import AsyncWykopAPIv1, AsyncRotatingKeysWykopAPI
+from wykop.api.exceptions import DailtyRequestLimitError
+from wykop.api.v1.clients import WykopAPIv1
+
+
+class TestAsyncWykopAPIv1Init(object):
+
+    @mock.patch.object(AsyncWykopAPIv1, 'authenticate')
+    def test_not_authenticated(self, mocked_authenticate):
+        api = AsyncWykopAPIv1(
+            'appkey', 'secretkey', login='login', accountkey='accountkey')
+
+        mocked_authenticate.assert_not_called()
+        assert api.login == 'login'
+        assert api.accountkey == 'accountkey'
+
+
+class TestAsyncWykopAPIv1LoginRequired(object):
+
+    def test_all_wrapped(self):
+        for name in dir(WykopAPIv1):
+            method = getattr(WykopAPIv1, name)
+            if not hasattr(method, '__wrapped__'):
+                continue
+
+            assert iscoroutinefunction(getattr(AsyncWykopAPIv1, name)), name
+
+
+class TestAsyncWykopAPIv1Request(object):
+
+    def test_awaited(self, async_wykop_api_v1):
+        response = '{"id": 1}'
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(return_value=response)
+
+        result = asyncio.run(async_wykop_api_v1.request(
+            'entries', 'index', [1], requester=requester))
+
+        assert requester.make_request.await_count == 1
+        assert result == {'id': 1}
+
+
+class TestAsyncRotatingKeysWykopAPIRequest(object):
+
+    @pytest.fixture
+    def key_pairs(self):
+        return [
+            ('appkey1', 'secretkey1'),
+            ('appkey2', 'secretkey2'),
+            ('appkey3', 'secretkey3'),
+        ]
+
+    @pytest.fixture
+    def api(self, key_pairs):
+        return AsyncRotatingKeysWykopAPI(key_pairs)
+
+    def fake_request(self, api, exhausted):
+        def request(*args, **kwargs):
+            appkey = kwargs['keys'][0]
+
+            async def respond():
+                await asyncio.sleep(0)
+                if appkey in exhausted:
+                    raise DailtyRequestLimitError()
+                return appkey
+            return respond()
+        return request
+
+    def test_no_rotate_keys(self, api):
+        with mock.patch.object(
+                WykopAPIv1, 'request', self.fake_request(api, [])):
+            result = asyncio.run(api.request('rtype', 'rmethod'))
+
+        assert result == 'appkey1'
+
+    def test_rotate_keys_once(self, api):
+        async def gather():
+            return await asyncio.gather(
+                *[api.request('rtype', 'rmethod') for _ in range(5)])
+
+        with mock.patch.object(
+                WykopAPIv1, 'request', self.fake_request(api, ['appkey1'])):
+            result = asyncio.run(gather())
+
+        assert result == ['appkey2'] * 5
+        # keys are not set on shared client
+        assert (api.appkey, api.secretkey) == ('appkey1', 'secretkey1')
+
+    def test_rotate_keys_repeat(self, api):
+        exhausted = ['appkey1', 'appkey2']
+
+        with mock.patch.object(
+                WykopAPIv1, 'request', self.fake_request(api, exhausted)):
+            result = asyncio.run(api.request('rtype', 'rmethod'))
+
+        assert result == 'appkey3'
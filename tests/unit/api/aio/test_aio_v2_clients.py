@@ -0,0 +1,264 @@
+import asyncio
+from inspect import iscoroutinefunction
+
+import mock
+import pytest
+
+from wykop.api.aio.requesters import default_async_requester
+from wykop.api.aio.v2 import AsyncWykopAPIv2
+from wykop.api.batch import BatchResult
+from wykop.api.caches.memory import MemoryCache
+from wykop.api.exceptions import (
+    DeadlineExceededError, InvalidUserKeyError, WykopAPIError,
+    UnreachableAPIError,
+)
+from wykop.api.parsers import JSONParser, default_parser
+from wykop.api.ratelimiters import RateLimiter
+from wykop.api.retries import RetryPolicy
+from wykop.api.timeouts import deadline
+from wykop.api.v2.clients import WykopAPIv2
+
+
+class TestAsyncWykopAPIv2Init(object):
+
+    def test_default_requester(self, async_wykop_api_v2):
+        assert async_wykop_api_v2.requester == default_async_requester
+
+
+class TestAsyncWykopAPIv2Close(object):
+
+    def test_requester_closed(self):
+        requester = mock.Mock()
+        requester.close = mock.AsyncMock()
+
+        async def use_client():
+            async with AsyncWykopAPIv2('appkey', 'secretkey',
+                                       requester=requester):
+                pass
+
+        asyncio.run(use_client())
+
+        requester.close.assert_awaited_once_with()
+
+    @mock.patch.object(
+        type(default_async_requester), 'close', new_callable=mock.AsyncMock)
+    def test_default_requester_not_closed(self, mocked_close):
+        async def use_client():
+            async with AsyncWykopAPIv2('appkey', 'secretkey'):
+                pass
+
+        asyncio.run(use_client())
+
+        mocked_close.assert_not_awaited()
+
+
+class TestAsyncWykopAPIv2LoginRequired(object):
+
+    def test_all_wrapped(self):
+        for name in dir(WykopAPIv2):
+            method = getattr(WykopAPIv2, name)
+            if not hasattr(method, '__wrapped__'):
+                continue
+
+            assert iscoroutinefunction(getattr(AsyncWykopAPIv2, name)), name
+
+
+class TestAsyncWykopAPIv2Request(object):
+
+    @mock.patch.object(JSONParser, 'parse')
+    def test_awaited(self, mocked_parse, async_wykop_api_v2):
+        response = '{}'
+        parsed = mock.sentinel.parsed
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(return_value=response)
+        mocked_parse.return_value = parsed
+
+        result = asyncio.run(
+            async_wykop_api_v2.request('entries', requester=requester))
+
+        url = async_wykop_api_v2.construct_url('entries')
+        headers = async_wykop_api_v2.get_headers(url)
+        requester.make_request.assert_awaited_once_with(url, {}, headers, {})
+        mocked_parse.assert_called_once_with(response)
+        assert result == parsed
+
+    @mock.patch('asyncio.sleep')
+    def test_rate_limit_deadline(self, mocked_sleep, async_wykop_api_v2):
+        async_wykop_api_v2.rate_limiter = RateLimiter(rate=1)
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(return_value='{}')
+
+        async def request_twice():
+            await async_wykop_api_v2.request('entries', requester=requester)
+            with deadline(0.2):
+                await async_wykop_api_v2.request(
+                    'entries', 'hot', requester=requester)
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(request_twice())
+
+        mocked_sleep.assert_not_called()
+        assert requester.make_request.await_count == 1
+
+    def test_no_parser(self, async_wykop_api_v2):
+        response = '{}'
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(return_value=response)
+
+        result = asyncio.run(async_wykop_api_v2.request(
+            'entries', parser=None, requester=requester))
+
+        assert result == response
+
+    def test_stream_not_implemented(self, async_wykop_api_v2):
+        with pytest.raises(NotImplementedError):
+            async_wykop_api_v2.request('entries', stream=True)
+
+    @mock.patch('wykop.api.aio.retries.asyncio.sleep')
+    def test_retried(self, mocked_sleep, async_wykop_api_v2):
+        async_wykop_api_v2.retry_policy = RetryPolicy(jitter=False)
+        unreachable = '{"error": {"code": 1001, "message": "unreachable"}}'
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(
+            side_effect=[unreachable, '{"data": []}'])
+
+        result = asyncio.run(
+            async_wykop_api_v2.request('entries', requester=requester))
+
+        mocked_sleep.assert_awaited_once_with(0.5)
+        assert requester.make_request.await_count == 2
+        assert result == {'data': []}
+
+    @mock.patch('wykop.api.aio.retries.asyncio.sleep')
+    def test_retries_exhausted(self, mocked_sleep, async_wykop_api_v2):
+        async_wykop_api_v2.retry_policy = RetryPolicy(max_retries=1)
+        unreachable = '{"error": {"code": 1001, "message": "unreachable"}}'
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(return_value=unreachable)
+
+        with pytest.raises(UnreachableAPIError) as exc_info:
+            asyncio.run(
+                async_wykop_api_v2.request('entries', requester=requester))
+
+        assert exc_info.value.retries == 1
+
+    def test_stale_refreshed(self, async_wykop_api_v2):
+        async_wykop_api_v2.cache = MemoryCache(stale_ttl=600)
+        url = async_wykop_api_v2.construct_url('entries/hot')
+        async_wykop_api_v2.cache.set(url, '{"data": ["stale"]}', 0, 600)
+        requester = mock.Mock()
+        requester.make_request = mock.AsyncMock(
+            return_value='{"data": ["fresh"]}')
+
+        async def request_twice():
+            results = [
+                await async_wykop_api_v2.request(
+                    'entries', 'hot', requester=requester)
+                for _ in range(2)
+            ]
+            await asyncio.gather(*async_wykop_api_v2._refresh_tasks)
+            return results
+
+        result = asyncio.run(request_twice())
+
+        assert result == [{'data': ['stale']}, {'data': ['stale']}]
+        assert requester.make_request.await_count == 1
+        assert async_wykop_api_v2.cache.get(url) == '{"data": ["fresh"]}'
+
+
+class TestAsyncWykopAPIv2Authenticate(object):
+
+    def test_credentials_missing(self, async_wykop_api_v2):
+        with pytest.raises(WykopAPIError):
+            asyncio.run(async_wykop_api_v2.authenticate())
+
+    @mock.patch.object(
+        AsyncWykopAPIv2, 'user_login', new_callable=mock.AsyncMock)
+    def test_userkey(self, mocked_user_login, async_wykop_api_v2):
+        mocked_user_login.return_value = {'data': {'userkey': 'userkey'}}
+
+        asyncio.run(async_wykop_api_v2.authenticate('login', 'accountkey'))
+
+        mocked_user_login.assert_awaited_once_with(
+            'login', 'accountkey', None)
+        assert async_wykop_api_v2.userkey == 'userkey'
+
+    def test_projected_parser(self, async_wykop_api_v2):
+        async_wykop_api_v2.parser = default_parser.project(['id'])
+        async_wykop_api_v2.requester = mock.Mock()
+        async_wykop_api_v2.requester.make_request = mock.AsyncMock(
+            return_value='{"data": {"userkey": "userkey"}}')
+
+        asyncio.run(async_wykop_api_v2.authenticate('login', 'accountkey'))
+
+        assert async_wykop_api_v2.userkey == 'userkey'
+
+    @mock.patch.object(
+        AsyncWykopAPIv2, 'request', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncWykopAPIv2, 'authenticate')
+    def test_login_required(
+            self, mocked_authenticate, mocked_request, async_wykop_api_v2):
+        response = mock.sentinel.response
+        mocked_request.side_effect = [InvalidUserKeyError(), response]
+        async_wykop_api_v2.userkey = 'invalid_userkey'
+
+        result = asyncio.run(async_wykop_api_v2.get_mywykop())
+
+        mocked_authenticate.assert_awaited_once_with()
+        assert mocked_request.await_count == 2
+        assert result == response
+
+
+class TestAsyncWykopAPIv2Paginate(object):
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    def test_iter_tag_entries(self, prefetch, async_wykop_api_v2):
+        pages = {
+            1: {'data': [1, 2], 'pagination': {'next': 'next'}},
+            2: {'data': [3], 'pagination': {'next': None}},
+        }
+
+        async def get_tag_entries(name, page=1):
+            return pages[page]
+
+        async def collect():
+            return [item async for item in async_wykop_api_v2.iter_tag_entries(
+                'tag', prefetch=prefetch)]
+
+        with mock.patch.object(
+                async_wykop_api_v2, 'get_tag_entries', get_tag_entries):
+            result = asyncio.run(collect())
+
+        assert result == [1, 2, 3]
+
+
+class TestAsyncWykopAPIv2Batch(object):
+
+    def test_fetch_pages(self, async_wykop_api_v2):
+        error = WykopAPIError()
+        running = []
+        peak = []
+
+        async def get_hits_month(year, month, page=1):
+            running.append(page)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(page)
+            if page == 2:
+                raise error
+            return page
+
+        with mock.patch.object(
+                async_wykop_api_v2, 'get_hits_month', get_hits_month):
+            result = asyncio.run(async_wykop_api_v2.fetch_pages(
+                async_wykop_api_v2.get_hits_month, 2018, 5,
+                pages=range(1, 6), max_workers=2))
+
+        assert result == [
+            BatchResult(1, None),
+            BatchResult(None, error),
+            BatchResult(3, None),
+            BatchResult(4, None),
+            BatchResult(5, None),
+        ]
+        assert max(peak) == 2
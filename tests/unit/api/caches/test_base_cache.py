@@ -0,0 +1,76 @@
+import pytest
+
+from wykop.api.caches.base import BaseCache
+from wykop.api.exceptions import (
+    EntryDoesNotExistError, UnreachableAPIError, UserDoesNotExistError,
+)
+
+
+class TestBaseCacheGetTTL(object):
+
+    @pytest.fixture
+    def cache(self):
+        return BaseCache(ttl=60, ttls={'hits/popular': 300, 'profiles': 10})
+
+    @pytest.mark.parametrize('endpoint,expected', [
+        ('hits/popular', 300),
+        ('profiles/m__b', 10),
+        ('profiles', 10),
+        ('hits/month', 60),
+        (None, 60),
+    ])
+    def test_ttl(self, cache, endpoint, expected):
+        assert cache.get_ttl(endpoint) == expected
+
+    def test_no_default(self, cache):
+        assert cache.get_ttl('hits/popular', default=False) == 300
+        assert cache.get_ttl('search/entries', default=False) is None
+
+
+class TestBaseCacheGetStaleTTL(object):
+
+    def test_stale_ttl(self):
+        cache = BaseCache(stale_ttl=5, stale_ttls={'entries/hot': 600})
+
+        assert cache.get_stale_ttl('entries/hot') == 600
+        assert cache.get_stale_ttl('links/promoted') == 5
+        assert cache.get_stale_ttl(None) == 5
+
+
+class TestBaseCacheClaimRefresh(object):
+
+    def test_claimed_once(self):
+        cache = BaseCache()
+
+        assert cache.claim_refresh('key') is True
+        assert cache.claim_refresh('key') is False
+
+        cache.release_refresh('key')
+
+        assert cache.claim_refresh('key') is True
+
+
+class TestBaseCacheGetNegativeTTL(object):
+
+    @pytest.fixture
+    def cache(self):
+        return BaseCache(negative_ttl=30, negative_ttls={'entries': 300})
+
+    def test_negative_ttl(self, cache):
+        assert cache.get_negative_ttl('entries/entry') == 300
+        assert cache.get_negative_ttl('links/link') == 30
+
+    def test_no_default(self, cache):
+        assert cache.get_negative_ttl('entries', default=False) == 300
+        assert cache.get_negative_ttl('search', default=False) is None
+
+    def test_disabled(self):
+        assert BaseCache().get_negative_ttl('entries') == 0
+
+    @pytest.mark.parametrize('error,expected', [
+        (EntryDoesNotExistError(), True),
+        (UserDoesNotExistError(), True),
+        (UnreachableAPIError(), False),
+    ])
+    def test_is_negative(self, error, expected):
+        assert BaseCache().is_negative(error) is expected
@@ -0,0 +1,119 @@
+import pickle
+
+import mock
+import pytest
+
+from wykop.api.caches.memory import MemoryCache
+
+
+@pytest.fixture
+def mocked_clock():
+    with mock.patch('wykop.api.caches.memory.clock') as mocked_clock:
+        mocked_clock.return_value = 100
+        yield mocked_clock
+
+
+class TestMemoryCache(object):
+
+    def test_miss(self):
+        cache = MemoryCache()
+
+        assert cache.get('key') is None
+
+    def test_hit(self):
+        cache = MemoryCache()
+        cache.set('key', 'value', 60)
+
+        assert cache.get('key') == 'value'
+
+    def test_expired(self, mocked_clock):
+        cache = MemoryCache()
+        cache.set('key', 'value', 60)
+
+        mocked_clock.return_value = 160
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_stale(self, mocked_clock):
+        cache = MemoryCache()
+        cache.set('key', 'value', 60, stale_ttl=30)
+
+        mocked_clock.return_value = 170
+
+        assert cache.get('key') is None
+        assert cache.lookup('key') == ('value', False)
+
+        mocked_clock.return_value = 190
+
+        assert cache.lookup('key') == (None, False)
+        assert len(cache) == 0
+
+    def test_maxsize_lru(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set('key1', 'value1', 60)
+        cache.set('key2', 'value2', 60)
+        cache.get('key1')
+
+        cache.set('key3', 'value3', 60)
+
+        assert cache.get('key1') == 'value1'
+        assert cache.get('key2') is None
+        assert cache.get('key3') == 'value3'
+
+    def test_maxbytes(self):
+        cache = MemoryCache(maxbytes=10)
+        cache.set('key1', '12345', 60)
+        cache.set('key2', u'ąę', 60)
+
+        cache.set('key3', '1234', 60)
+
+        assert cache.get('key1') is None
+        assert cache.get('key2') == u'ąę'
+        assert cache.size == 8
+
+    def test_too_big(self):
+        cache = MemoryCache(maxbytes=4)
+
+        cache.set('key', '12345', 60)
+
+        assert cache.get('key') is None
+        assert cache.size == 0
+
+    def test_replaced(self):
+        cache = MemoryCache()
+        cache.set('key', '12345', 60)
+
+        cache.set('key', '123', 60)
+
+        assert cache.get('key') == '123'
+        assert cache.size == 3
+
+    def test_delete(self):
+        cache = MemoryCache()
+        cache.set('key', 'value', 60)
+
+        cache.delete('key')
+        cache.delete('key')
+
+        assert cache.get('key') is None
+        assert cache.size == 0
+
+    def test_clear(self):
+        cache = MemoryCache()
+        cache.set('key', 'value', 60)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_pickle(self):
+        cache = MemoryCache(maxsize=10, ttls={'profiles': 10})
+        cache.set('key', 'value', 60)
+
+        result = pickle.loads(pickle.dumps(cache))
+
+        assert result.maxsize == 10
+        assert result.ttls == {'profiles': 10}
+        assert result.get('key') is None
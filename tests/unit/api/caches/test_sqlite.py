@@ -0,0 +1,162 @@
+import pickle
+import threading
+
+import mock
+import pytest
+
+from wykop.api.caches.sqlite import SQLiteCache
+
+
+@pytest.fixture
+def cache_path(tmpdir):
+    return str(tmpdir.join('cache.db'))
+
+
+@pytest.fixture
+def mocked_time():
+    with mock.patch('wykop.api.caches.sqlite.time') as mocked_time:
+        mocked_time.time.return_value = 100
+        yield mocked_time
+
+
+class TestSQLiteCache(object):
+
+    def test_miss(self, cache_path):
+        cache = SQLiteCache(cache_path)
+
+        assert cache.get('key') is None
+
+    def test_hit(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', u'value ąę', 60)
+
+        assert cache.get('key') == u'value ąę'.encode('utf-8')
+
+    def test_bytes(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', b'{"data": []}', 60)
+
+        assert cache.get('key') == b'{"data": []}'
+        assert cache.size == 12
+
+    def test_shared(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', 'value', 60)
+
+        other = SQLiteCache(cache_path)
+
+        assert other.get('key') == b'value'
+
+    def test_expired(self, mocked_time, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key1', 'value1', 60)
+
+        mocked_time.time.return_value = 160
+
+        assert cache.get('key1') is None
+
+        cache.set('key2', 'value2', 60)
+
+        assert len(cache) == 1
+        assert cache.size == 6
+
+    def test_stale(self, mocked_time, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', 'value', 60, stale_ttl=30)
+
+        mocked_time.time.return_value = 170
+
+        assert cache.get('key') is None
+        assert cache.lookup('key') == (b'value', False)
+
+        mocked_time.time.return_value = 190
+
+        assert cache.lookup('key') == (None, False)
+
+    def test_maxsize(self, mocked_time, cache_path):
+        cache = SQLiteCache(cache_path, maxsize=2)
+        for i in range(3):
+            mocked_time.time.return_value = 100 + i
+            cache.set('key%d' % i, 'value', 60)
+
+        assert cache.get('key0') is None
+        assert cache.get('key1') == b'value'
+        assert cache.get('key2') == b'value'
+        assert len(cache) == 2
+
+    def test_maxbytes(self, mocked_time, cache_path):
+        cache = SQLiteCache(cache_path, maxbytes=10)
+        cache.set('key1', '12345', 60)
+        mocked_time.time.return_value = 101
+        cache.set('key2', u'ąę', 60)
+
+        mocked_time.time.return_value = 102
+        cache.set('key3', '1234', 60)
+
+        assert cache.get('key1') is None
+        assert cache.get('key2') == u'ąę'.encode('utf-8')
+        assert cache.size == 8
+
+    def test_too_big(self, cache_path):
+        cache = SQLiteCache(cache_path, maxbytes=4)
+
+        cache.set('key', '12345', 60)
+
+        assert cache.get('key') is None
+        assert cache.size == 0
+
+    def test_replaced(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', '12345', 60)
+
+        cache.set('key', '123', 60)
+
+        assert cache.get('key') == b'123'
+        assert len(cache) == 1
+        assert cache.size == 3
+
+    def test_delete(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', 'value', 60)
+
+        cache.delete('key')
+        cache.delete('key')
+
+        assert cache.get('key') is None
+        assert cache.size == 0
+
+    def test_clear(self, cache_path):
+        cache = SQLiteCache(cache_path)
+        cache.set('key', 'value', 60)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_threads(self, cache_path):
+        cache = SQLiteCache(cache_path, maxsize=50)
+
+        def write(n):
+            for i in range(20):
+                cache.set('key%d-%d' % (n, i), 'value', 60)
+                cache.get('key%d-%d' % (n, i))
+
+        threads = [threading.Thread(target=write, args=(n, ))
+                   for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 50
+        assert cache.size == 250
+
+    def test_pickle(self, cache_path):
+        cache = SQLiteCache(cache_path, ttls={'profiles': 10})
+        cache.set('key', 'value', 60)
+
+        result = pickle.loads(pickle.dumps(cache))
+
+        assert result.ttls == {'profiles': 10}
+        assert result.get('key') == b'value'
@@ -0,0 +1,33 @@
+import json
+
+import mock
+import pytest
+
+from wykop.api.parsers.backends import get_json_loads
+
+
+class TestGetJSONLoads(object):
+
+    def test_backend(self):
+        assert get_json_loads('json') is json.loads
+
+    def test_fastest_installed(self):
+        modules = {
+            'simplejson': mock.Mock(loads=mock.sentinel.simplejson_loads),
+            'json': mock.Mock(loads=mock.sentinel.json_loads),
+        }
+
+        def import_module(name):
+            if name not in modules:
+                raise ImportError(name)
+            return modules[name]
+
+        with mock.patch(
+                'wykop.api.parsers.backends.import_module', import_module):
+            result = get_json_loads()
+
+        assert result == mock.sentinel.simplejson_loads
+
+    def test_not_installed(self):
+        with pytest.raises(ImportError):
+            get_json_loads('nosuchjson')
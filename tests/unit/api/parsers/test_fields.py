@@ -0,0 +1,106 @@
+from wykop.api.parsers.fields import (
+    compile_fields, project, project_response,
+)
+
+
+class TestCompileFields(object):
+
+    def test_flat(self):
+        result = compile_fields(['id', 'date'])
+
+        assert result == {'id': None, 'date': None}
+
+    def test_nested(self):
+        result = compile_fields(['id', 'author.login', 'author.color'])
+
+        assert result == {'id': None, 'author': {'login': None, 'color': None}}
+
+    def test_whole_first(self):
+        result = compile_fields(['author', 'author.login'])
+
+        assert result == {'author': None}
+
+    def test_whole_last(self):
+        result = compile_fields(['author.login', 'author'])
+
+        assert result == {'author': None}
+
+
+class TestProject(object):
+
+    def test_object(self):
+        value = {
+            'id': 1,
+            'body': 'test',
+            'author': {'login': 'user', 'avatar': 'http://example.com/a'},
+        }
+        tree = compile_fields(['id', 'author.login', 'vote_count'])
+
+        result = project(value, tree)
+
+        assert result == {'id': 1, 'author': {'login': 'user'}}
+
+    def test_list(self):
+        value = [
+            {'id': 1, 'comments': [{'id': 2, 'body': 'test'}]},
+            {'id': 3, 'body': 'test'},
+        ]
+        tree = compile_fields(['id', 'comments.id'])
+
+        result = project(value, tree)
+
+        assert result == [{'id': 1, 'comments': [{'id': 2}]}, {'id': 3}]
+
+    def test_not_object(self):
+        value = {'id': 1, 'author': 'user'}
+        tree = compile_fields(['author.login'])
+
+        result = project(value, tree)
+
+        assert result == {'author': 'user'}
+
+
+class TestProjectResponse(object):
+
+    tree = {'id': None}
+
+    def test_data(self):
+        response = {
+            'data': [{'id': 1, 'body': 'test'}],
+            'pagination': {'next': 'x'},
+        }
+
+        result = project_response(response, self.tree)
+
+        assert result == {'data': [{'id': 1}], 'pagination': {'next': 'x'}}
+
+    def test_items(self):
+        response = {'items': [{'id': 1, 'body': 'test'}]}
+
+        result = project_response(response, self.tree)
+
+        assert result == {'items': [{'id': 1}]}
+
+    def test_list(self):
+        response = [{'id': 1, 'body': 'test'}]
+
+        result = project_response(response, self.tree)
+
+        assert result == [{'id': 1}]
+
+    def test_object(self):
+        response = {'id': 1, 'body': 'test'}
+
+        result = project_response(response, self.tree)
+
+        assert result == {'id': 1}
+
+    def test_error(self):
+        response = {'error': {'code': 61, 'message': 'not found'}}
+
+        result = project_response(response, self.tree)
+
+        assert result == {'error': {'code': 61, 'message': 'not found'}}
+
+    def test_other(self):
+        assert project_response(True, self.tree) is True
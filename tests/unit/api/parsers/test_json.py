@@ -1,5 +1,16 @@
+# -*- coding: utf-8 -*-
+import json
+
 import mock
+import pytest
 
+from wykop.api.exceptions import (
+    EntryDoesNotExistError, default_exception_resolver,
+)
+from wykop.api.models import (
+    Entry, LazyWykopAPIResponseList, WykopAPIResponse, wrap,
+)
+from wykop.api.parsers import get_model_parser, lazy_parser
 from wykop.api.parsers.base import Error
 from wykop.api.parsers.json import JSONParser
 
@@ -18,6 +29,19 @@ class TestJSONParserInit(object):
 
         assert parser.exception_resolver == exception_resolver
         assert parser.json_kwargs == json_params
+        assert parser.loads is None
+
+    def test_backend(self):
+        parser = JSONParser(mock.sentinel.exception_resolver, backend='json')
+
+        assert parser.loads is json.loads
+
+    def test_backend_callable(self):
+        loads = mock.Mock()
+
+        parser = JSONParser(mock.sentinel.exception_resolver, backend=loads)
+
+        assert parser.loads is loads
 
 
 class TestJSONParserGetResponse(object):
@@ -33,6 +57,39 @@ class TestJSONParserGetResponse(object):
         mock_loads.assert_called_once_with(data, **json_parser.json_kwargs)
         assert result == response
 
+    def test_backend(self):
+        loads = mock.Mock(return_value=mock.sentinel.response)
+        wrapper = mock.Mock(return_value=mock.sentinel.wrapped)
+        parser = JSONParser(
+            mock.sentinel.exception_resolver, backend=loads, wrapper=wrapper)
+
+        result = parser._get_response(mock.sentinel.data)
+
+        loads.assert_called_once_with(mock.sentinel.data)
+        wrapper.assert_called_once_with(mock.sentinel.response)
+        assert result == mock.sentinel.wrapped
+
+    @pytest.mark.parametrize('backend', ['json', 'orjson'])
+    def test_default_wrapper(self, backend):
+        pytest.importorskip(backend)
+        parser = JSONParser(
+            mock.sentinel.exception_resolver, backend=backend, wrapper=wrap)
+
+        result = parser._get_response('{"data": [{"author": {"login": "a"}}]}')
+
+        assert result.data[0].author.login == 'a'
+
+    @pytest.mark.parametrize('backend', ['json', 'orjson', 'ujson'])
+    def test_bytes(self, backend):
+        pytest.importorskip(backend)
+        parser = JSONParser(
+            mock.sentinel.exception_resolver, backend=backend, wrapper=wrap)
+        data = u'{"data": [{"body": "zażółć"}]}'.encode('utf-8')
+
+        result = parser._get_response(data)
+
+        assert result.data[0].body == u'zażółć'
+
 
 class TestJSONParserGetError(object):
 
@@ -79,3 +136,171 @@ class TestJSONParserGetError(object):
         result = json_parser._get_error(response)
 
         assert result == Error(code, message)
+
+
+class TestGetModelParser(object):
+
+    def test_parse(self):
+        parser = get_model_parser(Entry)
+
+        result = parser.parse('{"data": [{"id": 1, "body": "test"}]}')
+
+        assert result.data == [Entry(id=1, body='test')]
+
+    def test_error(self):
+        parser = get_model_parser(Entry)
+
+        with pytest.raises(EntryDoesNotExistError):
+            parser.parse('{"error": {"code": 61, "message": "not found"}}')
+
+
+class TestJSONParserFields(object):
+
+    def test_fields(self):
+        parser = JSONParser(
+            default_exception_resolver, wrapper=wrap,
+            fields=['id', 'author.login'])
+        data = '{"data": [{"id": 1, "body": "x", "author": {"login": "a"}}]}'
+
+        result = parser.parse(data)
+
+        assert result == {'data': [{'id': 1, 'author': {'login': 'a'}}]}
+        assert result.data[0].author.login == 'a'
+
+    def test_error(self):
+        parser = JSONParser(default_exception_resolver, fields=['id'])
+
+        with pytest.raises(EntryDoesNotExistError):
+            parser.parse('{"error": {"code": 61, "message": "not found"}}')
+
+    def test_project(self):
+        parser = JSONParser(default_exception_resolver, wrapper=wrap)
+
+        result = parser.project(['id'])
+
+        assert result is not parser
+        assert result.fields == ('id', )
+        assert result.wrapper is wrap
+        assert parser.fields is None
+        assert result.parse('{"id": 1, "body": "x"}') == {'id': 1}
+
+    def test_project_reused(self):
+        parser = JSONParser(default_exception_resolver)
+
+        result = parser.project(['id'])
+
+        assert parser.project(('id', )) is result
+        assert parser.project(['id', 'date']) is not result
+
+
+class TestJSONParserLazy(object):
+
+    def test_data(self):
+        data = b'{"data": [{"id": 1, "author": {"login": "a"}}, {"id": 2}],' \
+            b' "pagination": {"next": "x"}}'
+
+        result = lazy_parser.parse(data)
+
+        assert isinstance(result, WykopAPIResponse)
+        assert isinstance(result.data, LazyWykopAPIResponseList)
+        assert result.pagination.next == 'x'
+        assert result.data[0].author.login == 'a'
+        assert result == {
+            'data': [{'id': 1, 'author': {'login': 'a'}}, {'id': 2}],
+            'pagination': {'next': 'x'},
+        }
+
+    def test_decoded_on_access(self):
+        parser = JSONParser(default_exception_resolver, lazy=True)
+        data = '{"items": [{"id": 1}, {"id": 2}]}'
+
+        with mock.patch.object(parser, '_get_item') as mock_get_item:
+            result = parser.parse(data)
+            item = result['items'][1]
+
+        assert item == mock_get_item.return_value
+        mock_get_item.assert_called_once_with({'id': 2})
+
+    def test_list(self):
+        result = lazy_parser.parse(b'[{"id": 1}, true]')
+
+        assert isinstance(result, LazyWykopAPIResponseList)
+        assert result[0].id == 1
+        assert result[1] is True
+
+    @pytest.mark.parametrize("data", [
+        '{"id": 1}', '{"data": {"id": 1}}', ' true',
+    ])
+    def test_no_array(self, data):
+        result = lazy_parser.parse(data)
+
+        assert result == json.loads(data)
+
+    def test_fields(self):
+        parser = lazy_parser.project(['id'])
+
+        result = parser.parse('{"data": [{"id": 1, "body": "x"}]}')
+
+        assert result.data == [{'id': 1}]
+
+    def test_typed(self):
+        parser = get_model_parser(Entry, lazy=True)
+
+        result = parser.parse('{"data": [{"id": 1, "body": "test"}]}')
+
+        assert result.data[0] == Entry(id=1, body='test')
+
+    def test_error(self):
+        with pytest.raises(EntryDoesNotExistError):
+            lazy_parser.parse(
+                '{"data": [], "error": {"code": 61, "message": "x"}}')
+
+
+class TestJSONParserParseStream(object):
+
+    @pytest.fixture
+    def parser(self):
+        return JSONParser(default_exception_resolver, wrapper=wrap)
+
+    def test_items(self, parser):
+        chunks = [b'{"data": [{"id": 1, "author": {"lo', b'gin": "a"}}]}']
+
+        result = list(parser.parse_stream(chunks))
+
+        assert result == [{'id': 1, 'author': {'login': 'a'}}]
+        assert result[0].author.login == 'a'
+
+    def test_fields(self, parser):
+        chunks = [b'[{"id": 1, "body": "x"}, {"id": 2, "body": "y"}]']
+
+        result = list(parser.project(['id']).parse_stream(chunks))
+
+        assert result == [{'id': 1}, {'id': 2}]
+
+    def test_typed(self):
+        parser = get_model_parser(Entry)
+        chunks = [b'{"data": [{"id": 1}]}']
+
+        result = list(parser.parse_stream(chunks))
+
+        assert result == [Entry(id=1)]
+
+    def test_object(self, parser):
+        chunks = [b'{"data": {"id": 1}}']
+
+        result = list(parser.parse_stream(chunks))
+
+        assert result == [{'id': 1}]
+
+    def test_v1_object(self, parser):
+        chunks = [b'{"id": 1}']
+
+        result = list(parser.parse_stream(chunks))
+
+        assert result == [{'id': 1}]
+
+    def test_error(self, parser):
+        chunks = [b'{"data": null, "error": {"code": 61, "message": "x"}}']
+
+        with pytest.raises(EntryDoesNotExistError):
+            list(parser.parse_stream(chunks))
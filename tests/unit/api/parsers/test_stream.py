@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from wykop.api.parsers.stream import JSONStreamDecoder
+
+
+def split(data, size=1):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONStreamDecoder(object):
+
+    @pytest.mark.parametrize("size", [1, 3, 1024])
+    def test_data(self, size):
+        data = json.dumps({
+            'data': [{'id': 1, 'body': u'zażółć'}, {'id': 2}],
+            'pagination': {'next': 'x'},
+        }).encode('utf-8')
+        stream = JSONStreamDecoder(split(data, size), json.JSONDecoder())
+
+        result = list(stream)
+
+        assert result == [{'id': 1, 'body': u'zażółć'}, {'id': 2}]
+        assert stream.members == {'pagination': {'next': 'x'}}
+        assert stream.array is True
+
+    def test_items(self):
+        data = b'{"items": [{"id": 1}], "count": 1}'
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        result = list(stream)
+
+        assert result == [{'id': 1}]
+        assert stream.members == {'count': 1}
+        assert stream.key == 'items'
+
+    def test_list(self):
+        data = b' [12, "test", true, null] '
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        result = list(stream)
+
+        assert result == [12, 'test', True, None]
+        assert stream.array is True
+        assert stream.key is None
+
+    @pytest.mark.parametrize("size", [1, 3, 1024])
+    def test_raw(self, size):
+        data = u'{"data": [{"id": 1, "body": "zażółć"}, 2.5 ,[]], "a": 1}'
+        stream = JSONStreamDecoder(
+            split(data.encode('utf-8'), size), json.JSONDecoder(), raw=True)
+
+        result = list(stream)
+
+        assert result == [u'{"id": 1, "body": "zażółć"}', u'2.5', u'[]']
+        assert stream.members == {'a': 1}
+
+    def test_number_split(self):
+        data = b'{"a": 1, "data": [1, 2.5, -3.25e+10, 4E-2, 10], "b": 0.75}'
+
+        for i in range(1, len(data)):
+            chunks = [data[:i], data[i:]]
+            stream = JSONStreamDecoder(chunks, json.JSONDecoder())
+
+            assert list(stream) == [1, 2.5, -3.25e+10, 4E-2, 10]
+            assert stream.members == {'a': 1, 'b': 0.75}
+
+    def test_multibyte_split(self):
+        data = u'["żółw"]'.encode('utf-8')
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        assert list(stream) == [u'żółw']
+
+    def test_text_chunks(self):
+        data = u'{"data": [{"id": 1}]}'
+        stream = JSONStreamDecoder(split(data, 4), json.JSONDecoder())
+
+        assert list(stream) == [{'id': 1}]
+
+    def test_incremental(self):
+        chunks = iter([b'{"data": [{"id": 1}, ', b'{"id": 2}]}'])
+        stream = iter(JSONStreamDecoder(chunks, json.JSONDecoder()))
+
+        assert next(stream) == {'id': 1}
+        assert next(chunks) == b'{"id": 2}]}'
+
+    def test_no_array(self):
+        data = b'{"data": {"id": 1}, "error": null}'
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        result = list(stream)
+
+        assert result == []
+        assert stream.members == {'data': {'id': 1}, 'error': None}
+        assert stream.array is False
+
+    @pytest.mark.parametrize("data", [b'[]', b'{}', b'{"data": []}'])
+    def test_empty(self, data):
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        assert list(stream) == []
+
+    @pytest.mark.parametrize("data", [
+        b'', b'{"data": [1, 2}', b'{"data": [1', b'{1: 2}', b'true',
+    ])
+    def test_malformed(self, data):
+        stream = JSONStreamDecoder(split(data), json.JSONDecoder())
+
+        with pytest.raises(ValueError):
+            list(stream)
@@ -13,3 +13,18 @@ class TestBaseRequesterMakeRequest(object):
         with pytest.raises(NotImplementedError):
             base_requester.make_request(
                 url, data=data, headers=headers, files=files)
+
+
+class TestBaseRequesterStreamRequest(object):
+
+    def test_single_chunk(self, base_requester):
+        url = mock.sentinel.url
+
+        with mock.patch.object(base_requester, 'make_request') as mocked:
+            mocked.return_value = mock.sentinel.content
+
+            result = list(base_requester.stream_request(url))
+
+        assert result == [mock.sentinel.content]
+        mocked.assert_called_once_with(
+            url, data=None, headers=None, files=None, timeout=None)
@@ -1,15 +1,75 @@
+import os
 from collections import namedtuple
 
 import mock
 import pytest
-from requests.exceptions import RequestException
+from requests import Session
+from requests.exceptions import (
+    ConnectionError, ConnectTimeout, HTTPError, RequestException,
+)
 
-from wykop.api.exceptions import WykopAPIError
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, HTTPStatusError,
+)
 from wykop.api.requesters.requests import RequestsRequester
 
 MockFile = namedtuple('MockFile', ['name', ])
 
 
+class TestRequestsRequesterSession(object):
+
+    def test_reused(self, requests_requester):
+        session = requests_requester.session
+
+        assert isinstance(session, Session)
+        assert requests_requester.session is session
+
+    def test_pool_options(self):
+        requester = RequestsRequester(pool_connections=2, pool_maxsize=20)
+
+        adapter = requester.session.get_adapter('https://a2.wykop.pl/')
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 20
+
+    def test_no_keep_alive(self):
+        requester = RequestsRequester(keep_alive=False)
+
+        assert requester.session.headers['Connection'] == 'close'
+
+    def test_close(self, requests_requester):
+        session = requests_requester.session
+
+        with mock.patch.object(session, 'close') as mocked_close:
+            requests_requester.close()
+
+        mocked_close.assert_called_once_with()
+        assert requests_requester.session is not session
+
+    def test_forked(self, requests_requester):
+        session = requests_requester.session
+
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            result = requests_requester.session
+
+            assert result is not session
+            assert requests_requester.session is result
+
+    def test_close_forked(self, requests_requester):
+        session = requests_requester.session
+
+        with mock.patch.object(session, 'close') as mocked_close:
+            with mock.patch('os.getpid', return_value=os.getpid() + 1):
+                requests_requester.close()
+
+        mocked_close.assert_not_called()
+
+    def test_close_not_opened(self, requests_requester):
+        requests_requester.close()
+
+        assert requests_requester._session is None
+
+
 class TestRequestsRequesterMakeRequest(object):
 
     @pytest.mark.parametrize("data,files,method", [
@@ -18,7 +78,7 @@ class TestRequestsRequesterMakeRequest(object):
         (None, {'testfile': MockFile('testfile')}, 'POST'),
         ({'test': 'data'},  {'testfile': MockFile('testfile')}, 'POST'),
     ])
-    @mock.patch('wykop.api.requesters.requests.request')
+    @mock.patch.object(Session, 'request')
     @mock.patch.object(RequestsRequester, '_get_method')
     @mock.patch.object(RequestsRequester, '_get_files')
     def test_raises_error(
@@ -43,4 +103,105 @@ class TestRequestsRequesterMakeRequest(object):
                 url, data=data, headers=headers, files=files)
 
         mocked_request.assert_called_once_with(
-            method, url, data=data, headers=headers, files=files)
+            method, url, data=data, headers=headers, files=files,
+            timeout=None)
+
+    @pytest.mark.parametrize("error,expected", [
+        (ConnectionError(), APIConnectionError),
+        (ConnectTimeout(), APITimeoutError),
+        (HTTPError(response=mock.Mock(status_code=503)), HTTPStatusError),
+    ])
+    @mock.patch.object(Session, 'request')
+    def test_classified_error(
+            self, mocked_request, error, expected, requests_requester):
+        mocked_request.side_effect = error
+
+        with pytest.raises(expected):
+            requests_requester.make_request('http://test.com/api/1', files={})
+
+    @mock.patch.object(Session, 'request')
+    def test_content(self, mocked_request, requests_requester):
+        content = b'{"data": []}'
+        mocked_request.return_value = mock.Mock(content=content)
+
+        result = requests_requester.make_request(
+            'http://test.com/api/1', files={})
+
+        assert result is content
+
+    @mock.patch.object(Session, 'request')
+    def test_http_status(self, mocked_request, requests_requester):
+        response = mock.Mock(status_code=503)
+        response.raise_for_status.side_effect = HTTPError(response=response)
+        mocked_request.return_value = response
+
+        with pytest.raises(HTTPStatusError) as exc_info:
+            requests_requester.make_request('http://test.com/api/1', files={})
+
+        assert exc_info.value.status == 503
+
+    @mock.patch.object(Session, 'request')
+    def test_timeout(self, mocked_request):
+        requester = RequestsRequester(timeout=(1, 5))
+
+        requester.make_request('http://test.com/api/1', files={})
+        requester.make_request('http://test.com/api/1', files={}, timeout=2)
+
+        assert mocked_request.call_args_list[0][1]['timeout'] == (1, 5)
+        assert mocked_request.call_args_list[1][1]['timeout'] == 2
+
+
+class TestRequestsRequesterStreamRequest(object):
+
+    @mock.patch.object(Session, 'request')
+    def test_chunks(self, mocked_request, requests_requester):
+        response = mock.Mock()
+        response.iter_content.return_value = iter([b'{"data"', b': []}'])
+        mocked_request.return_value = response
+
+        result = requests_requester.stream_request(
+            'http://test.com/api/1', files={})
+
+        mocked_request.assert_not_called()
+        assert list(result) == [b'{"data"', b': []}']
+        assert mocked_request.call_args[1]['stream'] is True
+        response.iter_content.assert_called_once_with(
+            RequestsRequester.chunk_size)
+        response.close.assert_called_once_with()
+
+    @mock.patch.object(Session, 'request')
+    def test_closed(self, mocked_request, requests_requester):
+        response = mock.Mock()
+        response.iter_content.return_value = iter([b'{"data"', b': []}'])
+        mocked_request.return_value = response
+
+        result = requests_requester.stream_request(
+            'http://test.com/api/1', files={})
+        next(result)
+        result.close()
+
+        response.close.assert_called_once_with()
+
+    @mock.patch.object(Session, 'request')
+    def test_read_error(self, mocked_request, requests_requester):
+        response = mock.Mock()
+        response.iter_content.side_effect = ConnectionError()
+        mocked_request.return_value = response
+
+        with pytest.raises(APIConnectionError):
+            list(requests_requester.stream_request(
+                'http://test.com/api/1', files={}))
+
+        response.close.assert_called_once_with()
+
+    @mock.patch.object(Session, 'request')
+    def test_http_status(self, mocked_request, requests_requester):
+        response = mock.Mock(status_code=503)
+        response.raise_for_status.side_effect = HTTPError(response=response)
+        mocked_request.return_value = response
+
+        with pytest.raises(HTTPStatusError) as exc_info:
+            list(requests_requester.stream_request(
+                'http://test.com/api/1', files={}))
+
+        assert exc_info.value.status == 503
@@ -1,24 +1,102 @@
+import os
+import socket
+
 import mock
 import pytest
 
-from wykop.api.exceptions import WykopAPIError
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, HTTPStatusError,
+)
+from wykop.api.requesters.urllib import (
+    ConnectionPool, RemoteDisconnected, UrllibRequester,
+)
+
+
+class MockResponse(object):
+
+    def __init__(self, status=200, content=b'{}', will_close=False):
+        self.status = status
+        self.content = content
+        self.will_close = will_close
+
+    def read(self, amt=None):
+        if amt is None:
+            amt = len(self.content)
+        content, self.content = self.content[:amt], self.content[amt:]
+        return content
+
+
+def mock_connection(*responses):
+    conn = mock.Mock()
+    conn.getresponse.side_effect = responses
+    return conn
+
+
+class TestConnectionPool(object):
+
+    def test_reused(self):
+        pool = ConnectionPool()
+        conn = pool.connect('http', 'test.com')
+        pool.put('http', 'test.com', conn)
+
+        result = pool.get('http', 'test.com')
+
+        assert result == (conn, True)
+
+    def test_per_host(self):
+        pool = ConnectionPool()
+        conn = pool.connect('http', 'test.com')
+        pool.put('http', 'test.com', conn)
+
+        result, reused = pool.get('http', 'other.com')
+
+        assert result is not conn
+        assert reused is False
+
+    def test_full(self):
+        pool = ConnectionPool(maxsize=1)
+        conn1 = mock.Mock()
+        conn2 = mock.Mock()
+
+        pool.put('http', 'test.com', conn1)
+        pool.put('http', 'test.com', conn2)
+
+        conn1.close.assert_not_called()
+        conn2.close.assert_called_once_with()
+
+    def test_clear(self):
+        pool = ConnectionPool()
+        conn = mock.Mock()
+        pool.put('http', 'test.com', conn)
+
+        pool.clear()
 
-from six.moves.urllib.error import HTTPError, URLError
+        conn.close.assert_called_once_with()
+        assert pool.get('http', 'test.com')[1] is False
 
+    def test_unsupported_scheme(self):
+        pool = ConnectionPool()
 
-class MockFile(object):
+        with pytest.raises(WykopAPIError):
+            pool.connect('ftp', 'test.com')
+
+
+class TestUrllibRequesterPool(object):
 
-    def __init__(self, name):
-        self.name = name
+    def test_reused(self, urllib_requester):
+        pool = urllib_requester.pool
 
-    def read(self):
-        return self.name
+        assert isinstance(pool, ConnectionPool)
+        assert urllib_requester.pool is pool
 
-    def readline(self):
-        return self.name
+    def test_forked(self, urllib_requester):
+        pool = urllib_requester.pool
 
-    def close(self):
-        return
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            result = urllib_requester.pool
+
+            assert result is not pool
+            assert urllib_requester.pool is result
 
 
 class TestUrllibRequesterMakeReuqest(object):
@@ -32,24 +110,194 @@ class TestUrllibRequesterMakeReuqest(object):
         with pytest.raises(NotImplementedError):
             urllib_requester.make_request(url, files=files)
 
-    @mock.patch('wykop.api.requesters.urllib.urlopen')
-    def test_urlerror_raises_error(self, mocked_urlopen, urllib_requester):
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_response(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1?q=1'
+        conn = mock_connection(MockResponse(content=b'{"data": 1}'))
+        mocked_connect.return_value = conn
+
+        result = urllib_requester.make_request(
+            url, data={'test': 'data'}, headers={'header': 'header'})
+
+        assert result == b'{"data": 1}'
+        conn.request.assert_called_once_with(
+            'POST', '/api/1?q=1', b'test=data', {
+                'header': 'header',
+                'Content-Type': 'application/x-www-form-urlencoded',
+            })
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_timeout(self, mocked_connect):
         url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse())
+        conn.sock = None
 
-        mocked_urlopen.side_effect = URLError(url)
+        def connect():
+            conn.sock = mock.Mock()
+        conn.connect.side_effect = connect
+        mocked_connect.return_value = conn
+        requester = UrllibRequester(timeout=(1, 5))
 
-        with pytest.raises(WykopAPIError):
+        requester.make_request(url)
+
+        assert conn.timeout == 1
+        conn.sock.settimeout.assert_called_once_with(5)
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_connection_reused(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse(), MockResponse())
+        mocked_connect.return_value = conn
+
+        urllib_requester.make_request(url)
+        urllib_requester.make_request(url)
+
+        mocked_connect.assert_called_once_with('http', 'test.com')
+        assert conn.request.call_count == 2
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_connection_closed(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse(will_close=True))
+        mocked_connect.return_value = conn
+
+        urllib_requester.make_request(url)
+
+        conn.close.assert_called_once_with()
+        assert urllib_requester.pool.get('http', 'test.com')[1] is False
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_stale_reconnected(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        stale = mock_connection(RemoteDisconnected(''))
+        fresh = mock_connection(MockResponse(content=b'fresh'))
+        mocked_connect.return_value = fresh
+        urllib_requester.pool.put('http', 'test.com', stale)
+
+        result = urllib_requester.make_request(url)
+
+        stale.close.assert_called_once_with()
+        assert result == b'fresh'
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_stale_not_sent_reconnected(
+            self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        stale = mock_connection()
+        stale.request.side_effect = socket.error('broken pipe')
+        fresh = mock_connection(MockResponse(content=b'fresh'))
+        mocked_connect.return_value = fresh
+        urllib_requester.pool.put('http', 'test.com', stale)
+
+        result = urllib_requester.make_request(url, data={'test': 'data'})
+
+        stale.close.assert_called_once_with()
+        fresh.request.assert_called_once()
+        assert result == b'fresh'
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_sent_post_not_resent(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        stale = mock_connection(RemoteDisconnected(''))
+        urllib_requester.pool.put('http', 'test.com', stale)
+
+        with pytest.raises(APIConnectionError):
+            urllib_requester.make_request(url, data={'test': 'data'})
+
+        mocked_connect.assert_not_called()
+
+    @pytest.mark.parametrize('data', [None, {'test': 'data'}])
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_timeout_not_resent(self, mocked_connect, data, urllib_requester):
+        url = 'http://test.com/api/1'
+        stale = mock_connection(socket.timeout('timed out'))
+        urllib_requester.pool.put('http', 'test.com', stale)
+
+        with pytest.raises(APITimeoutError):
+            urllib_requester.make_request(url, data=data)
+
+        stale.close.assert_called_once_with()
+        mocked_connect.assert_not_called()
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_reset_after_sent_not_resent(
+            self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        stale = mock_connection(socket.error('connection reset'))
+        urllib_requester.pool.put('http', 'test.com', stale)
+
+        with pytest.raises(APIConnectionError):
             urllib_requester.make_request(url)
 
-    @mock.patch('wykop.api.requesters.urllib.urlopen')
-    def test_httperror_raises_error(self, mocked_urlopen, urllib_requester):
+        mocked_connect.assert_not_called()
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_connection_error_raises_error(
+            self, mocked_connect, urllib_requester):
         url = 'http://test.com/api/1'
-        code = 777
-        msg = 'msg'
-        hdrs = 'hdrs'
-        fp = MockFile(url)
+        mocked_connect.return_value = mock_connection(socket.error('error'))
 
-        mocked_urlopen.side_effect = HTTPError(url, code, msg, hdrs, fp)
+        with pytest.raises(APIConnectionError):
+            urllib_requester.make_request(url)
 
-        with pytest.raises(WykopAPIError):
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_timeout_raises_error(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        mocked_connect.return_value = mock_connection(
+            socket.timeout('timed out'))
+
+        with pytest.raises(APITimeoutError):
+            urllib_requester.make_request(url)
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_http_error_raises_error(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        mocked_connect.return_value = mock_connection(MockResponse(777))
+
+        with pytest.raises(HTTPStatusError) as exc_info:
             urllib_requester.make_request(url)
+
+        assert exc_info.value.status == 777
+
+
+class TestUrllibRequesterStreamRequest(object):
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_chunks(self, mocked_connect):
+        url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse(content=b'{"data": []}'))
+        mocked_connect.return_value = conn
+        requester = UrllibRequester()
+        requester.chunk_size = 5
+
+        result = requester.stream_request(url)
+
+        assert list(result) == [b'{"dat', b'a": [', b']}']
+        assert requester.pool.get('http', 'test.com') == (conn, True)
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_closed(self, mocked_connect):
+        url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse(content=b'{"data": []}'))
+        mocked_connect.return_value = conn
+        requester = UrllibRequester()
+        requester.chunk_size = 5
+
+        result = requester.stream_request(url)
+        next(result)
+        result.close()
+
+        conn.close.assert_called_once_with()
+        assert requester.pool.get('http', 'test.com')[1] is False
+
+    @mock.patch.object(ConnectionPool, 'connect')
+    def test_http_error_raises_error(self, mocked_connect, urllib_requester):
+        url = 'http://test.com/api/1'
+        conn = mock_connection(MockResponse(503))
+        mocked_connect.return_value = conn
+
+        with pytest.raises(HTTPStatusError) as exc_info:
+            list(urllib_requester.stream_request(url))
+
+        assert exc_info.value.status == 503
+        conn.close.assert_called_once_with()
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from wykop.api.batch import BatchResult, run_batch
+from wykop.api.exceptions import EntryDoesNotExistError
+
+
+class TestRunBatch(object):
+
+    def test_empty(self):
+        result = run_batch([])
+
+        assert result == []
+
+    def test_ordered(self):
+        def call(value, delay):
+            def f():
+                time.sleep(delay)
+                return value
+            return f
+        calls = [call(1, 0.03), call(2, 0.01), call(3, 0)]
+
+        result = run_batch(calls, max_workers=3)
+
+        assert result == [
+            BatchResult(1, None),
+            BatchResult(2, None),
+            BatchResult(3, None),
+        ]
+
+    def test_error_captured(self):
+        error = EntryDoesNotExistError()
+
+        def fail():
+            raise error
+
+        result = run_batch([lambda: 1, fail, lambda: 3])
+
+        assert result == [
+            BatchResult(1, None),
+            BatchResult(None, error),
+            BatchResult(3, None),
+        ]
+
+    def test_other_error_raised(self):
+        def fail():
+            raise ValueError()
+
+        with pytest.raises(ValueError):
+            run_batch([lambda: 1, fail])
+
+    def test_bounded(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def call():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        run_batch([call] * 10, max_workers=2)
+
+        assert peak[0] <= 2
@@ -1,6 +1,22 @@
+import hashlib
+import pickle
+import threading
+import time
+
 import mock
+import pytest
 
+from wykop.api.caches.memory import MemoryCache
 from wykop.api.clients import BaseWykopAPI
+from wykop.api.exceptions import (
+    APITimeoutError, DeadlineExceededError, EntryDoesNotExistError,
+    WykopAPIError,
+)
+from wykop.api.models import Entry
+from wykop.api.parsers import default_parser, get_model_parser
+from wykop.api.requesters import default_requester
+from wykop.api.retries import RetryPolicy
+from wykop.api.timeouts import deadline_at
 
 
 class TestBaseWykopAPIInit(object):
@@ -18,6 +34,7 @@ class TestBaseWykopAPIInit(object):
         assert client.password is None
         assert client.output == ''
         assert client.format == 'json'
+        assert client.requester == default_requester
 
     def test_additional_options(self):
         appkey = mock.sentinel.appkey
@@ -27,6 +44,7 @@ class TestBaseWykopAPIInit(object):
         password = mock.sentinel.password
         output = mock.sentinel.output
         response_format = mock.sentinel.response_format
+        requester = mock.sentinel.requester
 
         client = BaseWykopAPI(
             appkey,
@@ -36,6 +54,7 @@ class TestBaseWykopAPIInit(object):
             password=password,
             output=output,
             response_format=response_format,
+            requester=requester,
         )
 
         assert client.appkey == appkey
@@ -45,6 +64,16 @@ class TestBaseWykopAPIInit(object):
         assert client.password is password
         assert client.output == output
         assert client.format == response_format
+        assert client.requester == requester
+
+    def test_pickle_model_parser(self):
+        client = BaseWykopAPI(
+            'appkey', 'secretkey', parser=get_model_parser(Entry))
+
+        result = pickle.loads(pickle.dumps(client))
+
+        assert result.parser.parse(b'{"data": [{"id": 1}]}').data == \
+            [Entry(id=1)]
 
 
 class TestBaseWykopAPIGetPostParamsValues(object):
@@ -77,7 +106,7 @@ class TestBaseWykopAPIGetApiSign(object):
 
         result = base_wykop_api.get_api_sign(url, **post_params)
 
-        mocked_get_post_params_values.assert_called_once_with(**post_params)
+        mocked_get_post_params_values.assert_not_called()
         assert result == 'fab16da58887f16066e6f7fc585f6ea5'
 
     @mock.patch.object(BaseWykopAPI, 'get_post_params_values')
@@ -97,6 +126,21 @@ class TestBaseWykopAPIGetApiSign(object):
         mocked_get_post_params_values.assert_called_once_with(**post_params)
         assert result == '168499bac18e90313e5b46bf9f21403c'
 
+    def test_repeated(self, base_wykop_api):
+        result1 = base_wykop_api.get_api_sign('url', param='value')
+        result2 = base_wykop_api.get_api_sign('url', param='value')
+
+        assert result1 == result2 == hashlib.md5(
+            b'sentinel.secretkeyurlvalue').hexdigest()
+
+    def test_secretkey_changed(self, base_wykop_api):
+        base_wykop_api.get_api_sign('url')
+        base_wykop_api.secretkey = 'other'
+
+        result = base_wykop_api.get_api_sign('url')
+
+        assert result == hashlib.md5(b'otherurl').hexdigest()
+
 
 class TestBaseWykopAPIGetUserAgent(object):
 
@@ -109,6 +153,16 @@ class TestBaseWykopAPIGetUserAgent(object):
 
         assert result == '{0}/{1}'.format(base_wykop_api._client_name, version)
 
+    @mock.patch('wykop.api.clients.get_version')
+    def test_cached(self, mocked_get_version, base_wykop_api):
+        mocked_get_version.return_value = 'version'
+
+        base_wykop_api.get_user_agent()
+        result = base_wykop_api.get_user_agent()
+
+        assert result == '{0}/version'.format(base_wykop_api._client_name)
+        mocked_get_version.assert_called_once_with()
+
 
 class TestBaseWykopAPIGetHeaders(object):
 
@@ -131,3 +185,284 @@ class TestBaseWykopAPIGetHeaders(object):
             'apisign': api_sign,
             'User-Agent': user_agent,
         }
+
+
+class TestBaseWykopAPISend(object):
+
+    def test_rate_limited(self, base_wykop_api):
+        base_wykop_api._domain = 'test.com'
+        base_wykop_api.rate_limiter = mock.Mock()
+        requester = mock.Mock()
+        requester.make_request.return_value = mock.sentinel.response
+
+        result = base_wykop_api.send(
+            'url', {}, {}, {}, None, requester)
+
+        base_wykop_api.rate_limiter.acquire.assert_called_once_with(
+            base_wykop_api.appkey, 'test.com')
+        assert result == mock.sentinel.response
+
+    @mock.patch('wykop.api.retries.time.sleep')
+    def test_retried(self, mocked_sleep, base_wykop_api):
+        base_wykop_api.retry_policy = RetryPolicy()
+        requester = mock.Mock()
+        requester.make_request.side_effect = [
+            APITimeoutError(0, 'timed out'),
+            mock.sentinel.response,
+        ]
+
+        result = base_wykop_api.send(
+            'url', {}, {}, {}, None, requester)
+
+        assert requester.make_request.call_count == 2
+        assert result == mock.sentinel.response
+
+    @mock.patch('wykop.api.retries.time.sleep')
+    def test_mutating_not_retried(self, mocked_sleep, base_wykop_api):
+        base_wykop_api.retry_policy = RetryPolicy()
+        requester = mock.Mock()
+        requester.make_request.side_effect = APITimeoutError(0, 'timed out')
+
+        with pytest.raises(APITimeoutError):
+            base_wykop_api.send(
+                'url', {'body': 'body'}, {}, {}, None, requester)
+
+        assert requester.make_request.call_count == 1
+
+    def test_timeout(self, base_wykop_api):
+        requester = mock.Mock()
+
+        base_wykop_api.send(
+            'url', {}, {}, {}, None, requester, timeout=5)
+
+        requester.make_request.assert_called_once_with(
+            'url', {}, {}, {}, timeout=5)
+
+    @mock.patch('wykop.api.timeouts.clock')
+    def test_deadline_exceeded(self, mocked_clock, base_wykop_api):
+        mocked_clock.return_value = 100
+        requester = mock.Mock()
+
+        with deadline_at(100):
+            with pytest.raises(DeadlineExceededError):
+                base_wykop_api.send('url', {}, {}, {}, None, requester)
+
+        requester.make_request.assert_not_called()
+
+    @mock.patch('wykop.api.retries.time.sleep')
+    @mock.patch('wykop.api.timeouts.clock')
+    def test_deadline_not_retried(
+            self, mocked_clock, mocked_sleep, base_wykop_api):
+        mocked_clock.return_value = 100
+        base_wykop_api.retry_policy = RetryPolicy(backoff=1, jitter=False)
+        requester = mock.Mock()
+        requester.make_request.side_effect = APITimeoutError(0, 'timed out')
+
+        with deadline_at(101):
+            with pytest.raises(APITimeoutError) as exc_info:
+                base_wykop_api.send('url', {}, {}, {}, None, requester)
+
+        assert exc_info.value.retries == 0
+        mocked_sleep.assert_not_called()
+
+
+class TestBaseWykopAPISendCache(object):
+
+    @pytest.fixture
+    def parser(self):
+        parser = mock.Mock()
+        parser.parse.side_effect = lambda response: {'data': response}
+        return parser
+
+    @pytest.fixture
+    def requester(self):
+        requester = mock.Mock()
+        requester.make_request.return_value = 'response'
+        return requester
+
+    def test_cached(self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = MemoryCache()
+
+        result1 = base_wykop_api.send(
+            'url', {}, {}, {}, parser, requester, endpoint='hits/popular')
+        result2 = base_wykop_api.send(
+            'url', {}, {}, {}, parser, requester, endpoint='hits/popular')
+
+        requester.make_request.assert_called_once_with('url', {}, {}, {})
+        assert result1 == result2 == {'data': 'response'}
+
+    def test_error_not_cached(self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = MemoryCache()
+        parser.parse.side_effect = [WykopAPIError(1, 'error'), {}, {}]
+
+        with pytest.raises(WykopAPIError):
+            base_wykop_api.send('url', {}, {}, {}, parser, requester)
+        base_wykop_api.send('url', {}, {}, {}, parser, requester)
+        base_wykop_api.send('url', {}, {}, {}, parser, requester)
+
+        assert requester.make_request.call_count == 2
+
+    def test_authenticated_bypassed(self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = MemoryCache()
+        base_wykop_api.userkey = 'userkey'
+
+        base_wykop_api.send('url', {}, {}, {}, parser, requester)
+        base_wykop_api.send('url', {}, {}, {}, parser, requester)
+
+        assert requester.make_request.call_count == 2
+
+    @pytest.mark.parametrize('ttls,expected', [
+        ({}, 2),
+        ({'search/entries': 60}, 1),
+    ])
+    def test_post_params(
+            self, base_wykop_api, parser, requester, ttls, expected):
+        base_wykop_api.cache = MemoryCache(ttls=ttls)
+        post_params = {'q': b'python'}
+
+        for _ in range(2):
+            base_wykop_api.send(
+                'url', post_params, {}, {}, parser, requester,
+                endpoint='search/entries')
+
+        assert requester.make_request.call_count == expected
+
+    def test_stale(self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = mock.Mock()
+        base_wykop_api.cache.get_ttl.return_value = 60
+        base_wykop_api.cache.get_stale_ttl.return_value = 600
+        base_wykop_api.cache.lookup.return_value = ('stale', False)
+        base_wykop_api.cache.claim_refresh.side_effect = [True, False]
+
+        with mock.patch('wykop.api.clients.threading') as mocked_threading:
+            result1 = base_wykop_api.send(
+                'url', {}, {}, {}, parser, requester, endpoint='entries/hot')
+            result2 = base_wykop_api.send(
+                'url', {}, {}, {}, parser, requester, endpoint='entries/hot')
+
+        assert result1 == result2 == {'data': 'stale'}
+        requester.make_request.assert_not_called()
+        assert mocked_threading.Thread.call_count == 1
+        refresh = mocked_threading.Thread.call_args[1]['target']
+
+        refresh()
+
+        requester.make_request.assert_called_once_with('url', {}, {}, {})
+        base_wykop_api.cache.set.assert_called_once_with(
+            'url', 'response', 60, 600)
+        base_wykop_api.cache.release_refresh.assert_called_once_with('url')
+
+    def test_stale_refresh_failed(self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = MemoryCache(ttl=60, stale_ttl=600)
+        base_wykop_api.cache.set('url', 'stale', 0, 600)
+        requester.make_request.side_effect = APITimeoutError(0, 'timeout')
+
+        with mock.patch('wykop.api.clients.threading') as mocked_threading:
+            result = base_wykop_api.send(
+                'url', {}, {}, {}, parser, requester, endpoint='entries/hot')
+            refresh = mocked_threading.Thread.call_args[1]['target']
+
+            refresh()
+
+        assert result == {'data': 'stale'}
+        assert base_wykop_api.cache.lookup('url') == ('stale', False)
+        assert base_wykop_api.cache.claim_refresh('url') is True
+
+    def test_negative_cached(self, base_wykop_api, requester):
+        base_wykop_api.cache = MemoryCache(ttl=0, negative_ttl=60)
+        requester.make_request.return_value = \
+            '{"error": {"code": 61, "message": "not found"}}'
+
+        for _ in range(2):
+            with pytest.raises(EntryDoesNotExistError):
+                base_wykop_api.send(
+                    'url', {}, {}, {}, default_parser, requester,
+                    endpoint='entries/entry')
+
+        requester.make_request.assert_called_once_with('url', {}, {}, {})
+
+    def test_negative_disabled(self, base_wykop_api, requester):
+        base_wykop_api.cache = MemoryCache()
+        requester.make_request.return_value = \
+            '{"error": {"code": 61, "message": "not found"}}'
+
+        for _ in range(2):
+            with pytest.raises(EntryDoesNotExistError):
+                base_wykop_api.send(
+                    'url', {}, {}, {}, default_parser, requester,
+                    endpoint='entries/entry')
+
+        assert requester.make_request.call_count == 2
+
+    def test_success_not_cached_without_ttl(
+            self, base_wykop_api, parser, requester):
+        base_wykop_api.cache = MemoryCache(ttl=0, negative_ttl=60)
+
+        for _ in range(2):
+            base_wykop_api.send('url', {}, {}, {}, parser, requester)
+
+        assert requester.make_request.call_count == 2
+
+    def test_cache_key(self, base_wykop_api):
+        result = base_wykop_api.get_cache_key(
+            'url', {'q': b'python', 'page': b'2'})
+
+        assert result == 'url?page=2&q=python'
+
+
+class TestBaseWykopAPISendCoalesced(object):
+
+    @pytest.fixture
+    def requester(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def make_request(*args):
+            started.set()
+            release.wait(5)
+            return 'response'
+
+        requester = mock.Mock()
+        requester.make_request.side_effect = make_request
+        requester.started = started
+        requester.release = release
+        return requester
+
+    def send_concurrently(self, base_wykop_api, requester, post_params):
+        parser = mock.Mock()
+        results = []
+
+        def send():
+            results.append(base_wykop_api.send(
+                'url', post_params, {}, {}, parser, requester))
+
+        threads = [threading.Thread(target=send) for _ in range(3)]
+        threads[0].start()
+        requester.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # let followers join the flight
+        time.sleep(0.05)
+        requester.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_coalesced(self, base_wykop_api, requester):
+        results = self.send_concurrently(base_wykop_api, requester, {})
+
+        requester.make_request.assert_called_once_with('url', {}, {}, {})
+        assert len(results) == 3
+        assert results[0] is results[1] is results[2]
+
+    def test_mutating_not_coalesced(self, base_wykop_api, requester):
+        self.send_concurrently(base_wykop_api, requester, {'body': 'text'})
+
+        assert requester.make_request.call_count == 3
+
+    def test_disabled(self, base_wykop_api, requester):
+        base_wykop_api.coalesce = False
+
+        self.send_concurrently(base_wykop_api, requester, {})
+
+        assert requester.make_request.call_count == 3
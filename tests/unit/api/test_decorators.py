@@ -4,6 +4,7 @@ import mock
 from wykop.api.v1.clients import WykopAPIv1 as WykopAPI
 from wykop.api.decorators import login_required
 from wykop.api.exceptions import InvalidUserKeyError
+from wykop.api.timeouts import deadline_at, get_deadline
 
 
 class TestLoginRequired(object):
@@ -47,3 +48,19 @@ class TestLoginRequired(object):
         ]
         mocked_request.assert_has_calls(calls)
         assert result == response
+
+    @mock.patch.object(WykopAPI, 'request')
+    @mock.patch.object(WykopAPI, 'authenticate')
+    def test_deadline_propagated(
+            self, mocked_authenticate, mocked_request, wykop_api):
+        deadlines = []
+        mocked_authenticate.side_effect = \
+            lambda: deadlines.append(get_deadline())
+        mocked_request.side_effect = \
+            lambda *args: deadlines.append(get_deadline())
+
+        decorated_method = login_required(wykop_api.request)
+        with deadline_at(105):
+            decorated_method(wykop_api)
+
+        assert deadlines == [105, 105]
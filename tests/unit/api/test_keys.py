@@ -0,0 +1,189 @@
+from collections import OrderedDict
+
+import mock
+import pickle
+import pytest
+
+from wykop.api.exceptions import KeysExhaustedError
+from wykop.api.keys import (
+    KeyScheduler,
+    LeastUsedStrategy,
+    RoundRobinStrategy,
+    StickyStrategy,
+    WeightedStrategy,
+)
+from wykop.api.quotas import QuotaLedger
+
+
+@pytest.fixture
+def usage():
+    return OrderedDict([('appkey1', 3), ('appkey2', 1), ('appkey3', 2)])
+
+
+class TestStickyStrategy(object):
+
+    def test_current(self, usage):
+        strategy = StickyStrategy()
+
+        result = strategy.choose(['appkey1', 'appkey3'], usage, 'appkey1')
+
+        assert result == 'appkey1'
+
+    def test_current_unavailable(self, usage):
+        strategy = StickyStrategy()
+
+        result = strategy.choose(['appkey1', 'appkey3'], usage, 'appkey2')
+
+        assert result == 'appkey3'
+
+
+class TestRoundRobinStrategy(object):
+
+    def test_next(self, usage):
+        strategy = RoundRobinStrategy()
+
+        result = strategy.choose(list(usage), usage, 'appkey1')
+
+        assert result == 'appkey2'
+
+    def test_wraps(self, usage):
+        strategy = RoundRobinStrategy()
+
+        result = strategy.choose(['appkey1', 'appkey2'], usage, 'appkey2')
+
+        assert result == 'appkey1'
+
+    def test_no_current(self, usage):
+        strategy = RoundRobinStrategy()
+
+        result = strategy.choose(['appkey2', 'appkey3'], usage, None)
+
+        assert result == 'appkey2'
+
+
+class TestLeastUsedStrategy(object):
+
+    def test_least_used(self, usage):
+        strategy = LeastUsedStrategy()
+
+        result = strategy.choose(list(usage), usage, 'appkey1')
+
+        assert result == 'appkey2'
+
+
+class TestWeightedStrategy(object):
+
+    def test_most_remaining(self, usage):
+        strategy = WeightedStrategy({'appkey1': 10, 'appkey2': 5})
+
+        result = strategy.choose(list(usage), usage, None)
+
+        assert result == 'appkey3'
+
+    def test_default_quota(self, usage):
+        strategy = WeightedStrategy({'appkey1': 10}, default_quota=1)
+
+        result = strategy.choose(list(usage), usage, None)
+
+        assert result == 'appkey1'
+
+
+class TestKeySchedulerAcquire(object):
+
+    @pytest.fixture
+    def key_pairs(self):
+        return [
+            ('appkey1', 'secretkey1'),
+            ('appkey2', 'secretkey2'),
+        ]
+
+    def test_sticky(self, key_pairs):
+        scheduler = KeyScheduler(key_pairs)
+
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+
+    def test_strategy(self, key_pairs):
+        scheduler = KeyScheduler(key_pairs, strategy=RoundRobinStrategy())
+
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+        assert scheduler.acquire() == ('appkey2', 'secretkey2')
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+
+    def test_exhausted_skipped(self, key_pairs):
+        scheduler = KeyScheduler(key_pairs)
+        scheduler.mark_exhausted('appkey1')
+
+        assert scheduler.acquire() == ('appkey2', 'secretkey2')
+
+    @mock.patch('wykop.api.keys.get_reset_time')
+    def test_all_exhausted(self, mocked_get_reset_time, key_pairs):
+        mocked_get_reset_time.return_value = 2000000000
+        scheduler = KeyScheduler(key_pairs)
+        scheduler.mark_exhausted('appkey1')
+        scheduler.mark_exhausted('appkey2')
+
+        with pytest.raises(KeysExhaustedError) as exc_info:
+            scheduler.acquire()
+
+        assert exc_info.value.until == 2000000000
+
+    @mock.patch('wykop.api.keys.time')
+    def test_cooldown(self, mocked_time, key_pairs):
+        mocked_time.time.return_value = 1000
+        scheduler = KeyScheduler(key_pairs, cooldown=60)
+        scheduler.mark_exhausted('appkey1')
+        scheduler.mark_exhausted('appkey2')
+
+        with pytest.raises(KeysExhaustedError) as exc_info:
+            scheduler.acquire()
+
+        assert exc_info.value.until == 1060
+
+        mocked_time.time.return_value = 1060
+
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+
+    def test_ledger(self, key_pairs, tmpdir):
+        ledger = QuotaLedger(str(tmpdir.join('quota.db')), daily_limit=1)
+        scheduler = KeyScheduler(key_pairs, ledger=ledger)
+
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+        assert scheduler.acquire() == ('appkey1', 'secretkey1')
+        scheduler.record('appkey1')
+        assert scheduler.acquire() == ('appkey2', 'secretkey2')
+        scheduler.record('appkey2')
+        with pytest.raises(KeysExhaustedError):
+            scheduler.acquire()
+
+    def test_record(self, key_pairs):
+        scheduler = KeyScheduler(key_pairs, strategy=LeastUsedStrategy())
+        scheduler.record('appkey1')
+
+        assert scheduler.acquire() == ('appkey2', 'secretkey2')
+
+    @mock.patch('wykop.api.keys.time')
+    def test_ledger_cooldown(self, mocked_time, key_pairs, tmpdir):
+        mocked_time.time.return_value = 1000
+        ledger = QuotaLedger(str(tmpdir.join('quota.db')))
+        scheduler = KeyScheduler(key_pairs, cooldown=60, ledger=ledger)
+        other = KeyScheduler(key_pairs, cooldown=60, ledger=ledger)
+        scheduler.mark_exhausted('appkey1')
+        scheduler.mark_exhausted('appkey2')
+
+        with pytest.raises(KeysExhaustedError) as exc_info:
+            other.acquire()
+
+        assert exc_info.value.until == 1060
+
+        mocked_time.time.return_value = 1060
+
+        assert other.acquire() == ('appkey1', 'secretkey1')
+
+    def test_pickle(self, key_pairs):
+        scheduler = KeyScheduler(key_pairs, cooldown=60)
+
+        result = pickle.loads(pickle.dumps(scheduler))
+
+        assert result.cooldown == 60
+        assert result.acquire() == ('appkey1', 'secretkey1')
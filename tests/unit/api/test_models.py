@@ -0,0 +1,321 @@
+import json
+import pickle
+
+import mock
+
+from wykop.api.models import (
+    Author, Comment, Entry, LazyWykopAPIResponseList, Link, Tag,
+    TypedWrapper, WykopAPIResponse, WykopAPIResponseList, wrap,
+)
+
+
+def wrap_json(raw):
+    return wrap(json.loads(raw))
+
+
+class TestWrap(object):
+
+    def test_dict(self):
+        result = wrap({'id': 1})
+
+        assert isinstance(result, WykopAPIResponse)
+        assert result == {'id': 1}
+
+    def test_list(self):
+        result = wrap([{'id': 1}])
+
+        assert isinstance(result, WykopAPIResponseList)
+        assert result == [{'id': 1}]
+
+    def test_other(self):
+        assert wrap(1) == 1
+
+
+class TestWykopAPIResponse(object):
+
+    def test_attribute_access(self):
+        response = WykopAPIResponse({'author': {'login': 'm__b'}})
+
+        assert response.author.login == 'm__b'
+        assert response['author']['login'] == 'm__b'
+
+    def test_wrapped_once(self):
+        response = WykopAPIResponse({'author': {'login': 'm__b'}})
+
+        assert response.author is response.author
+
+    def test_get(self):
+        response = WykopAPIResponse({'author': {'login': 'm__b'}})
+
+        assert response.get('author').login == 'm__b'
+        assert response.get('missing') is None
+
+    def test_items(self):
+        response = WykopAPIResponse({'author': {'login': 'm__b'}})
+
+        assert response.items()[0][1].login == 'm__b'
+        assert response.values()[0].login == 'm__b'
+
+    def test_setattr(self):
+        response = WykopAPIResponse()
+
+        response.id = 1
+
+        assert response == {'id': 1}
+
+    def test_pop(self):
+        response = WykopAPIResponse({'data': {'id': 1}})
+
+        assert response.pop('data').id == 1
+        assert response.pop('missing', None) is None
+        assert response == {}
+
+    def test_popitem(self):
+        response = WykopAPIResponse({'data': {'id': 1}})
+
+        key, value = response.popitem()
+
+        assert key == 'data'
+        assert value.id == 1
+
+    def test_setdefault(self):
+        response = WykopAPIResponse({'data': {'id': 1}})
+
+        assert response.setdefault('data', {}).id == 1
+        assert response.setdefault('author', {'login': 'm__b'}).login == \
+            'm__b'
+
+    def test_copy(self):
+        response = WykopAPIResponse({'data': [{'id': 1}]})
+
+        result = response.copy()
+
+        assert isinstance(result, WykopAPIResponse)
+        assert result['data'][0].id == 1
+
+
+class TestWykopAPIResponseList(object):
+
+    def test_items_wrapped(self):
+        response = WykopAPIResponseList([{'id': 1}, [{'id': 2}]])
+
+        assert response[0].id == 1
+        assert response[1][0].id == 2
+        assert [item for item in response][0].id == 1
+
+    def test_slice(self):
+        response = WykopAPIResponseList([{'id': 1}, {'id': 2}])
+
+        result = response[1:]
+
+        assert isinstance(result, WykopAPIResponseList)
+        assert result[0].id == 2
+
+    def test_pop(self):
+        response = WykopAPIResponseList([{'id': 1}, {'id': 2}])
+
+        assert response.pop().id == 2
+        assert response.pop(0).id == 1
+
+    def test_reversed(self):
+        response = WykopAPIResponseList([{'id': 1}, {'id': 2}])
+
+        result = [item.id for item in reversed(response)]
+
+        assert result == [2, 1]
+
+    def test_copy(self):
+        response = WykopAPIResponseList([{'id': 1}])
+
+        result = response.copy()
+
+        assert isinstance(result, WykopAPIResponseList)
+        assert result[0].id == 1
+
+
+class TestLazyWykopAPIResponseList(object):
+
+    def get_items(self, decode):
+        return LazyWykopAPIResponseList(['{"id": 1}', '{"id": 2}'], decode)
+
+    def test_decoded_on_access(self):
+        decode = mock.Mock(side_effect=wrap_json)
+        response = self.get_items(decode)
+
+        assert len(response) == 2
+        assert response[-1].id == 2
+        assert response[1] is response[1]
+        decode.assert_called_once_with('{"id": 2}')
+
+    def test_iter(self):
+        response = self.get_items(json.loads)
+
+        assert [item['id'] for item in response] == [1, 2]
+        assert [item['id'] for item in reversed(response)] == [2, 1]
+
+    def test_slice(self):
+        response = self.get_items(wrap_json)
+
+        result = response[1:]
+
+        assert isinstance(result, WykopAPIResponseList)
+        assert result[0].id == 2
+
+    def test_eq(self):
+        response = self.get_items(json.loads)
+
+        assert response == [{'id': 1}, {'id': 2}]
+        assert response == self.get_items(json.loads)
+        assert response != [{'id': 1}]
+        assert not isinstance(response, list)
+
+    def test_pickle(self):
+        response = self.get_items(wrap_json)
+
+        result = pickle.loads(pickle.dumps(response))
+
+        assert isinstance(result, LazyWykopAPIResponseList)
+        assert result[0].id == 1
+        assert result == [{'id': 1}, {'id': 2}]
+
+
+class TestModel(object):
+
+    def test_init(self):
+        tag = Tag(tag='#python', followers=10)
+
+        assert tag.tag == '#python'
+        assert tag.followers == 10
+        assert tag.description is None
+
+    def test_from_dict_v2(self):
+        data = {
+            'id': 1,
+            'body': 'test',
+            'author': {'login': 'user', 'color': 1, 'unknown': 'x'},
+            'comments': [{'id': 2, 'author': {'login': 'other'}}],
+            'embed': {'type': 'image', 'url': 'http://example.com/a.jpg'},
+            'unknown': 'x',
+        }
+
+        entry = Entry.from_dict(data)
+
+        assert entry.id == 1
+        assert entry.body == 'test'
+        assert entry.author == Author(login='user', color=1)
+        assert entry.comments == [
+            Comment(id=2, author=Author(login='other')),
+        ]
+        assert entry.embed.url == 'http://example.com/a.jpg'
+        assert entry.receiver is None
+        assert entry.survey is None
+        assert not hasattr(entry, '__dict__')
+
+    def test_from_dict_v1(self):
+        data = {
+            'id': 1,
+            'author': 'user',
+            'author_group': 2,
+            'comments': [],
+        }
+
+        entry = Entry.from_dict(data)
+
+        assert entry.author == 'user'
+        assert entry.author_group == 2
+        assert entry.comments == []
+
+    def test_convert_list(self):
+        result = Link.convert([{'id': 1}, {'id': 2}])
+
+        assert result == [Link(id=1), Link(id=2)]
+
+    def test_convert_other(self):
+        assert Link.convert(mock.sentinel.value) == mock.sentinel.value
+
+    def test_to_dict(self):
+        tag = Tag(tag='#python')
+
+        assert tag.to_dict() == {
+            'tag': '#python',
+            'description': None,
+            'background': None,
+            'followers': None,
+            'is_observed': None,
+            'is_blocked': None,
+        }
+
+    def test_eq(self):
+        assert Tag(tag='#python') == Tag(tag='#python')
+        assert Tag(tag='#python') != Tag(tag='#java')
+        assert Tag(tag='#python') != {'tag': '#python'}
+
+    def test_pickle(self):
+        entry = Entry.from_dict({'id': 1, 'author': {'login': 'user'}})
+
+        result = pickle.loads(pickle.dumps(entry))
+
+        assert result == entry
+
+    def test_repr(self):
+        assert repr(Tag(tag='#python')) == \
+            "<Tag tag='#python' description=None>"
+
+
+class TestTypedWrapper(object):
+
+    def test_data(self):
+        wrapper = TypedWrapper(Entry)
+
+        result = wrapper({'data': [{'id': 1}], 'pagination': {'next': 'x'}})
+
+        assert result.data == [Entry(id=1)]
+        assert result.pagination.next == 'x'
+
+    def test_data_object(self):
+        wrapper = TypedWrapper(Entry)
+
+        result = wrapper({'data': {'id': 1}})
+
+        assert result.data == Entry(id=1)
+
+    def test_items(self):
+        wrapper = TypedWrapper(Link)
+
+        result = wrapper({'items': [{'id': 1}]})
+
+        assert result['items'] == [Link(id=1)]
+
+    def test_list(self):
+        wrapper = TypedWrapper(Link)
+
+        result = wrapper([{'id': 1}, {'id': 2}])
+
+        assert result == [Link(id=1), Link(id=2)]
+
+    def test_object(self):
+        wrapper = TypedWrapper(Link)
+
+        result = wrapper({'id': 1})
+
+        assert result == Link(id=1)
+
+    def test_error(self):
+        wrapper = TypedWrapper(Link)
+
+        result = wrapper({'error': {'code': 61}})
+
+        assert isinstance(result, WykopAPIResponse)
+        assert result.error.code == 61
+
+    def test_other(self):
+        wrapper = TypedWrapper(Link)
+
+        assert wrapper(True) is True
+
+    def test_pickle(self):
+        wrapper = TypedWrapper(Entry)
+
+        result = pickle.loads(pickle.dumps(wrapper))
+
+        assert result({'data': [{'id': 1}]}).data == [Entry(id=1)]
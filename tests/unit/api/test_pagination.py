@@ -0,0 +1,123 @@
+import threading
+
+import mock
+import pytest
+
+from wykop.api.pagination import paginate
+from wykop.api.timeouts import get_deadline
+
+
+def get_items(response):
+    return response['data']
+
+
+def has_next_page(response):
+    return response.get('next', True)
+
+
+class FakePages(object):
+
+    def __init__(self, *pages):
+        self.pages = pages
+        self.fetched = []
+
+    def __call__(self, page):
+        self.fetched.append(page)
+        try:
+            return self.pages[page - 1]
+        except IndexError:
+            return {'data': []}
+
+
+class TestPaginate(object):
+
+    def test_empty_page(self):
+        fetch_page = FakePages({'data': [1, 2]}, {'data': [3]})
+
+        result = list(paginate(fetch_page, get_items, has_next_page))
+
+        assert result == [1, 2, 3]
+        assert fetch_page.fetched == [1, 2, 3]
+
+    def test_last_page(self):
+        fetch_page = FakePages({'data': [1, 2]}, {'data': [3], 'next': False})
+
+        result = list(paginate(fetch_page, get_items, has_next_page))
+
+        assert result == [1, 2, 3]
+        assert fetch_page.fetched == [1, 2]
+
+    def test_start_page(self):
+        fetch_page = FakePages({'data': [1, 2]}, {'data': [3]})
+
+        result = list(paginate(fetch_page, get_items, has_next_page, page=2))
+
+        assert result == [3]
+
+    @pytest.mark.parametrize('max_items,expected,fetched', [
+        (1, [1], [1]),
+        (2, [1, 2], [1]),
+        (3, [1, 2, 3], [1, 2]),
+    ])
+    def test_max_items(self, max_items, expected, fetched):
+        fetch_page = FakePages({'data': [1, 2]}, {'data': [3, 4]})
+
+        result = list(paginate(
+            fetch_page, get_items, has_next_page, max_items=max_items))
+
+        assert result == expected
+        assert fetch_page.fetched == fetched
+
+    def test_lazy(self):
+        fetch_page = FakePages({'data': [1, 2]}, {'data': [3]})
+
+        result = paginate(fetch_page, get_items, has_next_page)
+
+        assert fetch_page.fetched == []
+        assert next(result) == 1
+        assert fetch_page.fetched == [1]
+
+    def test_prefetch(self):
+        fetched = threading.Event()
+        pages = FakePages({'data': [1, 2]}, {'data': [3]})
+
+        def fetch_page(page):
+            response = pages(page)
+            if page == 2:
+                fetched.set()
+            return response
+
+        result = paginate(fetch_page, get_items, has_next_page, prefetch=True)
+
+        assert next(result) == 1
+        assert fetched.wait(1)
+        assert list(result) == [2, 3]
+        assert pages.fetched == [1, 2, 3]
+
+    def test_prefetch_error(self):
+        fetch_page = mock.Mock(side_effect=[{'data': [1]}, ValueError()])
+
+        result = paginate(fetch_page, get_items, has_next_page, prefetch=True)
+
+        assert next(result) == 1
+        with pytest.raises(ValueError):
+            next(result)
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    @mock.patch('wykop.api.pagination.clock')
+    def test_deadline(self, mocked_clock, prefetch):
+        mocked_clock.return_value = 100
+        deadlines = []
+        pages = FakePages({'data': [1, 2]}, {'data': [3]})
+
+        def fetch_page(page):
+            deadlines.append(get_deadline())
+            return pages(page)
+
+        result = paginate(
+            fetch_page, get_items, has_next_page, prefetch=prefetch,
+            deadline=5)
+
+        assert list(result) == [1, 2, 3]
+        assert deadlines == [105, 105, 105]
+        assert get_deadline() is None
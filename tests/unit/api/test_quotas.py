@@ -0,0 +1,80 @@
+from datetime import date
+
+import mock
+import pytest
+
+from wykop.api.quotas import QuotaLedger
+
+
+@pytest.fixture
+def ledger_path(tmpdir):
+    return str(tmpdir.join('quota.db'))
+
+
+@pytest.fixture
+def ledger(ledger_path):
+    return QuotaLedger(ledger_path, daily_limit=10)
+
+
+class TestQuotaLedgerRecord(object):
+
+    def test_counted(self, ledger):
+        ledger.record('appkey1')
+        ledger.record('appkey1', count=2)
+
+        result = ledger.get_usage(['appkey1', 'appkey2'])
+
+        assert result == {
+            'appkey1': (3, 0),
+            'appkey2': (0, 0),
+        }
+
+    def test_shared(self, ledger, ledger_path):
+        other = QuotaLedger(ledger_path, daily_limit=10)
+
+        ledger.record('appkey1')
+        other.record('appkey1')
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (2, 0)}
+
+    @mock.patch('wykop.api.quotas.today')
+    def test_daily_reset(self, mocked_today, ledger):
+        mocked_today.return_value = date(2018, 1, 1)
+        ledger.record('appkey1', count=10)
+        ledger.mark_exhausted('appkey1')
+
+        mocked_today.return_value = date(2018, 1, 2)
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (0, 0)}
+
+
+class TestQuotaLedgerMarkExhausted(object):
+
+    @mock.patch('wykop.api.quotas.get_reset_time')
+    def test_daily(self, mocked_get_reset_time, ledger):
+        mocked_get_reset_time.return_value = 2000000000
+        ledger.record('appkey1')
+
+        ledger.mark_exhausted('appkey1')
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (1, 2000000000)}
+
+    def test_until(self, ledger):
+        ledger.mark_exhausted('appkey1', 1060)
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (0, 1060)}
+
+
+class TestQuotaLedgerClear(object):
+
+    @mock.patch('wykop.api.quotas.today')
+    def test_old_removed(self, mocked_today, ledger):
+        mocked_today.return_value = date(2018, 1, 1)
+        ledger.record('appkey1')
+        mocked_today.return_value = date(2018, 1, 2)
+        ledger.record('appkey1')
+
+        ledger.clear()
+
+        rows = ledger.connection.execute("SELECT day FROM quota").fetchall()
+        assert rows == [('2018-01-02', )]
@@ -0,0 +1,116 @@
+import mock
+import pytest
+
+from wykop.api.exceptions import DeadlineExceededError
+from wykop.api.ratelimiters import TokenBucket, RateLimiter
+from wykop.api.timeouts import deadline
+
+
+@pytest.fixture
+def mocked_clock():
+    with mock.patch('wykop.api.ratelimiters.clock') as mocked_clock:
+        mocked_clock.return_value = 100.0
+        yield mocked_clock
+
+
+class TestTokenBucketReserve(object):
+
+    def test_burst(self, mocked_clock):
+        bucket = TokenBucket(2, capacity=2)
+
+        result = [bucket.reserve() for _ in range(4)]
+
+        assert result == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refilled(self, mocked_clock):
+        bucket = TokenBucket(2, capacity=2)
+        bucket.reserve()
+        bucket.reserve()
+        mocked_clock.return_value = 100.5
+
+        result = bucket.reserve()
+
+        assert result == 0.0
+
+    def test_capacity(self, mocked_clock):
+        bucket = TokenBucket(2, capacity=1)
+        mocked_clock.return_value = 200.0
+
+        result = [bucket.reserve() for _ in range(2)]
+
+        assert result == [0.0, 0.5]
+
+
+class TestRateLimiterReserve(object):
+
+    def test_no_limits(self, mocked_clock):
+        limiter = RateLimiter()
+
+        result = [limiter.reserve('appkey', 'host') for _ in range(3)]
+
+        assert result == [0.0, 0.0, 0.0]
+
+    def test_per_appkey(self, mocked_clock):
+        limiter = RateLimiter(rate=60, per=60)
+
+        result = [
+            limiter.reserve('appkey1', 'host'),
+            limiter.reserve('appkey1', 'host'),
+            limiter.reserve('appkey2', 'host'),
+        ]
+
+        assert result == [0.0, 1.0, 0.0]
+
+    def test_per_host(self, mocked_clock):
+        limiter = RateLimiter(rate=10, host_rate=1)
+
+        result = [
+            limiter.reserve('appkey1', 'host'),
+            limiter.reserve('appkey2', 'host'),
+            limiter.reserve('appkey3', 'other'),
+        ]
+
+        assert result == [0.0, 1.0, 0.0]
+
+    def test_within_deadline(self, mocked_clock):
+        limiter = RateLimiter(rate=1)
+        limiter.reserve('appkey', 'host')
+
+        with deadline(5):
+            result = limiter.reserve('appkey', 'host')
+
+        assert result == 1.0
+
+    def test_deadline_exceeded(self, mocked_clock):
+        limiter = RateLimiter(rate=1, host_rate=1)
+        limiter.reserve('appkey', 'host')
+
+        with deadline(0.5):
+            with pytest.raises(DeadlineExceededError):
+                limiter.reserve('appkey', 'host')
+
+        # slot wasn't taken
+        assert limiter.reserve('appkey', 'host') == 1.0
+
+
+class TestRateLimiterAcquire(object):
+
+    @mock.patch('wykop.api.ratelimiters.time.sleep')
+    def test_waits(self, mocked_sleep, mocked_clock):
+        limiter = RateLimiter(rate=4)
+
+        limiter.acquire('appkey', 'host')
+        limiter.acquire('appkey', 'host')
+
+        mocked_sleep.assert_called_once_with(0.25)
+
+    @mock.patch('wykop.api.ratelimiters.time.sleep')
+    def test_deadline_exceeded(self, mocked_sleep, mocked_clock):
+        limiter = RateLimiter(rate=1)
+        limiter.acquire('appkey', 'host')
+
+        with deadline(0.2):
+            with pytest.raises(DeadlineExceededError):
+                limiter.acquire('appkey', 'host')
+
+        mocked_sleep.assert_not_called()
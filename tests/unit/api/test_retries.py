@@ -0,0 +1,123 @@
+import mock
+import pytest
+
+from wykop.api.exceptions import (
+    APIConnectionError, APITimeoutError, HTTPStatusError, InvalidParamsError,
+    UnreachableAPIError,
+)
+from wykop.api.retries import RetryPolicy
+
+
+class TestRetryPolicyIsTransient(object):
+
+    @pytest.mark.parametrize('error,expected', [
+        (APIConnectionError(0, 'reset'), True),
+        (APITimeoutError(0, 'timed out'), True),
+        (UnreachableAPIError(1001, 'unreachable'), True),
+        (HTTPStatusError(503), True),
+        (HTTPStatusError(404), False),
+        (InvalidParamsError(2, 'invalid'), False),
+    ])
+    def test_classified(self, error, expected):
+        retry_policy = RetryPolicy()
+
+        assert retry_policy.is_transient(error) == expected
+
+
+class TestRetryPolicyGetBackoff(object):
+
+    def test_exponential(self):
+        retry_policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+
+        result = [retry_policy.get_backoff(retries) for retries in range(4)]
+
+        assert result == [1, 2, 4, 5]
+
+    @mock.patch('wykop.api.retries.random')
+    def test_jitter(self, mocked_random):
+        mocked_random.uniform.return_value = mock.sentinel.delay
+        retry_policy = RetryPolicy(backoff=1)
+
+        result = retry_policy.get_backoff(2)
+
+        mocked_random.uniform.assert_called_once_with(0, 4)
+        assert result == mock.sentinel.delay
+
+
+class TestRetryPolicyGetDelay(object):
+
+    def test_max_retries(self):
+        retry_policy = RetryPolicy(max_retries=2, jitter=False)
+        error = APITimeoutError(0, 'timed out')
+
+        assert retry_policy.get_delay(error, 1, 0) == 1
+        assert retry_policy.get_delay(error, 2, 0) is None
+
+    def test_mutating(self):
+        retry_policy = RetryPolicy()
+        error = APITimeoutError(0, 'timed out')
+
+        assert retry_policy.get_delay(error, 0, 0, mutating=True) is None
+
+    def test_retry_mutating(self):
+        retry_policy = RetryPolicy(retry_mutating=True, jitter=False)
+        error = APITimeoutError(0, 'timed out')
+
+        assert retry_policy.get_delay(error, 0, 0, mutating=True) == 0.5
+
+    @mock.patch('wykop.api.retries.clock')
+    def test_deadline(self, mocked_clock):
+        mocked_clock.return_value = 10
+        retry_policy = RetryPolicy(backoff=1, jitter=False, deadline=11)
+        error = APITimeoutError(0, 'timed out')
+
+        assert retry_policy.get_delay(error, 0, 0) == 1
+        assert retry_policy.get_delay(error, 1, 0) is None
+
+
+@mock.patch('wykop.api.retries.time.sleep')
+class TestRetryPolicyCall(object):
+
+    def test_success(self, mocked_sleep):
+        retry_policy = RetryPolicy()
+        func = mock.Mock(return_value=mock.sentinel.result)
+
+        result = retry_policy.call(func)
+
+        assert result == mock.sentinel.result
+        mocked_sleep.assert_not_called()
+
+    def test_retried(self, mocked_sleep):
+        on_retry = mock.Mock()
+        retry_policy = RetryPolicy(jitter=False, on_retry=on_retry)
+        error = HTTPStatusError(502)
+        func = mock.Mock(side_effect=[error, error, mock.sentinel.result])
+
+        result = retry_policy.call(func)
+
+        assert result == mock.sentinel.result
+        assert mocked_sleep.call_args_list == [mock.call(0.5), mock.call(1)]
+        on_retry.assert_has_calls([
+            mock.call(error, 1, 0.5),
+            mock.call(error, 2, 1),
+        ])
+
+    def test_gives_up(self, mocked_sleep):
+        retry_policy = RetryPolicy(max_retries=2)
+        func = mock.Mock(side_effect=APIConnectionError(0, 'reset'))
+
+        with pytest.raises(APIConnectionError) as exc_info:
+            retry_policy.call(func)
+
+        assert func.call_count == 3
+        assert exc_info.value.retries == 2
+
+    def test_permanent(self, mocked_sleep):
+        retry_policy = RetryPolicy()
+        func = mock.Mock(side_effect=InvalidParamsError(2, 'invalid'))
+
+        with pytest.raises(InvalidParamsError) as exc_info:
+            retry_policy.call(func)
+
+        assert func.call_count == 1
+        assert exc_info.value.retries == 0
@@ -0,0 +1,167 @@
+import threading
+import time
+
+import pytest
+
+from wykop.api.exceptions import (
+    APITimeoutError, DeadlineExceededError, WykopAPIError,
+)
+from wykop.api.singleflight import SingleFlight
+from wykop.api.timeouts import deadline
+
+
+class TestSingleFlight(object):
+
+    def test_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'result'
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(single_flight.call('key', func)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # let followers join the flight
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == ['result'] * 5
+        assert len(calls) == 1
+        assert len(single_flight) == 0
+
+    def test_sequential_not_shared(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        for _ in range(2):
+            single_flight.call('key', lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+    def test_error_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        error = WykopAPIError(1, 'error')
+        errors = []
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise error
+
+        def call():
+            try:
+                single_flight.call('key', func)
+            except WykopAPIError as ex:
+                errors.append(ex)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert errors == [error, error]
+
+    def test_waiter_deadline(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+
+        leader = threading.Thread(
+            target=single_flight.call, args=('key', func))
+        leader.start()
+        started.wait(5)
+        try:
+            with deadline(0.01):
+                with pytest.raises(DeadlineExceededError):
+                    single_flight.call('key', func)
+        finally:
+            release.set()
+            leader.join(5)
+
+    def test_leader_deadline_not_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                started.set()
+                time.sleep(0.1)
+                raise DeadlineExceededError(0, 'Deadline exceeded')
+            return 'result'
+
+        def lead():
+            with deadline(0.05):
+                with pytest.raises(DeadlineExceededError):
+                    single_flight.call('key', func)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(
+            target=lambda: results.append(single_flight.call('key', func)))
+        follower.start()
+        leader.join(5)
+        follower.join(5)
+
+        assert results == ['result']
+        assert len(calls) == 2
+
+    def test_timeout_without_deadline_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        errors = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            raise APITimeoutError(0, 'timed out')
+
+        def call():
+            try:
+                single_flight.call('key', func)
+            except APITimeoutError as ex:
+                errors.append(ex)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(errors) == 2
+        assert len(calls) == 1
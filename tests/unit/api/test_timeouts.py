@@ -0,0 +1,96 @@
+import threading
+
+import mock
+import pytest
+
+from wykop.api.exceptions import DeadlineExceededError
+from wykop.api.timeouts import (
+    cap_timeout,
+    check_deadline,
+    deadline,
+    deadline_at,
+    get_deadline,
+    get_remaining,
+    split_timeout,
+    with_deadline,
+)
+
+
+@pytest.fixture
+def mocked_clock():
+    with mock.patch('wykop.api.timeouts.clock') as mocked_clock:
+        mocked_clock.return_value = 100
+        yield mocked_clock
+
+
+class TestDeadline(object):
+
+    def test_no_deadline(self):
+        assert get_deadline() is None
+        assert get_remaining() is None
+
+    def test_deadline(self, mocked_clock):
+        with deadline(5) as until:
+            assert until == 105
+            assert get_deadline() == 105
+            assert get_remaining() == 5
+
+        assert get_deadline() is None
+
+    def test_nested_earlier(self, mocked_clock):
+        with deadline(5):
+            with deadline(10) as until:
+                assert until == 105
+
+            with deadline(1) as until:
+                assert until == 101
+
+            assert get_deadline() == 105
+
+    def test_with_deadline_other_thread(self, mocked_clock):
+        result = []
+        func = with_deadline(lambda: result.append(get_deadline()), 105)
+
+        thread = threading.Thread(target=func)
+        thread.start()
+        thread.join()
+
+        assert result == [105]
+
+    def test_check_deadline(self, mocked_clock):
+        with deadline_at(100):
+            with pytest.raises(DeadlineExceededError):
+                check_deadline()
+
+
+class TestCapTimeout(object):
+
+    @pytest.mark.parametrize('timeout,expected', [
+        (None, None),
+        (5, 5),
+        ((1, 5), (1, 5)),
+    ])
+    def test_no_deadline(self, timeout, expected):
+        assert cap_timeout(timeout) == expected
+
+    @pytest.mark.parametrize('timeout,expected', [
+        (None, 3),
+        (5, 3),
+        (1, 1),
+        ((1, 5), (1, 3)),
+        ((None, 5), (3, 3)),
+    ])
+    def test_deadline(self, mocked_clock, timeout, expected):
+        with deadline(3):
+            assert cap_timeout(timeout) == expected
+
+
+class TestSplitTimeout(object):
+
+    @pytest.mark.parametrize('timeout,expected', [
+        (None, (None, None)),
+        (5, (5, 5)),
+        ((1, 5), (1, 5)),
+    ])
+    def test_split(self, timeout, expected):
+        assert split_timeout(timeout) == expected
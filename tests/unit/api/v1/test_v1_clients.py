@@ -1,12 +1,23 @@
 import base64
+import hashlib
 import json
 import mock
 import pytest
-
-from wykop.api.exceptions import DailtyRequestLimitError
-from wykop.api.parsers import JSONParser
+import sys
+import time
+
+from wykop.api.caches.memory import MemoryCache
+from wykop.api.exceptions import (
+    APIConnectionError, DailtyRequestLimitError, KeysExhaustedError,
+)
+from wykop.api.keys import RoundRobinStrategy
+from wykop.api.models import Link
+from wykop.api.parsers import JSONParser, default_parser, get_model_parser
+from wykop.api.quotas import QuotaLedger
 from wykop.api.requesters import Requester
+from wykop.api.retries import RetryPolicy
 from wykop.api.v1.clients import WykopAPIv1 as WykopAPI
+from wykop.api.v1.clients import RotatingKeysWykopAPI
 
 
 class TestWykopAPIGetMethodParams(object):
@@ -225,6 +236,27 @@ class TestWykopAPIInit(object):
 
         mocked_authenticate.assert_called_once_with()
 
+    def test_auth_projected_parser(self):
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"userkey": "userkey"}'
+
+        client = WykopAPI(
+            'appkey', 'secretkey', login='login', accountkey='accountkey',
+            requester=requester,
+            parser=default_parser.project(['id', 'author.login']))
+
+        assert client.userkey == 'userkey'
+
+    def test_auth_model_parser(self):
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"userkey": "userkey"}'
+
+        client = WykopAPI(
+            'appkey', 'secretkey', login='login', accountkey='accountkey',
+            requester=requester, parser=get_model_parser(Link))
+
+        assert client.userkey == 'userkey'
+
 
 class TestWykopAPIConstructUrl(object):
 
@@ -393,6 +425,17 @@ class TestWykopAPIRequest(object):
         mocked_parse.assert_not_called()
         assert result == response
 
+    def test_fields(self, wykop_api):
+        requester = mock.Mock()
+        requester.make_request.return_value = \
+            '[{"id": 1, "body": "test", "author": "user"}]'
+
+        result = wykop_api.request(
+            'links', 'promoted', requester=requester,
+            fields=['id', 'author'])
+
+        assert result == [{'id': 1, 'author': 'user'}]
+
 
 class TestWykopAPIGetConnectUrl(object):
 
@@ -437,7 +480,7 @@ class TestWykopAPIGetConnectData(object):
             }
             data_str = json.dumps(data)
             data_bytes = data_str.encode()
-            return base64.encodestring(data_bytes)
+            return base64.b64encode(data_bytes)
         return get_connect_data
 
     def test_decoded(self, wykop_api, connect_data_factory):
@@ -454,23 +497,22 @@ class TestWykopAPIGetConnectData(object):
 class TestRotatingKeysWykopAPIRequest(object):
 
     @mock.patch.object(WykopAPI, 'request')
-    def test_no_rotate_keys(self, mocked_request, rotating_keys_wykop_api):
+    def test_no_rotate_keys(
+            self, mocked_request, rotating_keys_wykop_api, key_pairs):
         request_type = mock.sentinel.request_type
         request_method = mock.sentinel.request_method
         response = mock.sentinel.response
         mocked_request.return_value = response
-        first_appkey = rotating_keys_wykop_api.appkey
-        first_secretkey = rotating_keys_wykop_api.secretkey
 
         result = rotating_keys_wykop_api.request(request_type, request_method)
 
-        mocked_request.assert_called_once_with(request_type, request_method)
+        mocked_request.assert_called_once_with(
+            request_type, request_method, keys=key_pairs[0])
         assert result == response
-        assert rotating_keys_wykop_api.appkey == first_appkey
-        assert rotating_keys_wykop_api.secretkey == first_secretkey
 
     @mock.patch.object(WykopAPI, 'request')
-    def test_rotate_keys(self, mocked_request, rotating_keys_wykop_api):
+    def test_rotate_keys(
+            self, mocked_request, rotating_keys_wykop_api, key_pairs):
         request_type = mock.sentinel.request_type
         request_method = mock.sentinel.request_method
         response = mock.sentinel.response
@@ -478,21 +520,37 @@ class TestRotatingKeysWykopAPIRequest(object):
             DailtyRequestLimitError(),
             response,
         ]
-        first_appkey = rotating_keys_wykop_api.appkey
-        first_secretkey = rotating_keys_wykop_api.secretkey
 
         result = rotating_keys_wykop_api.request(request_type, request_method)
 
-        calls = [
-            mock.call(request_type, request_method),
-        ]
-        mocked_request.assert_has_calls(calls)
+        mocked_request.assert_has_calls([
+            mock.call(request_type, request_method, keys=key_pairs[0]),
+            mock.call(request_type, request_method, keys=key_pairs[1]),
+        ])
         assert result == response
-        assert not rotating_keys_wykop_api.appkey == first_appkey
-        assert not rotating_keys_wykop_api.secretkey == first_secretkey
+        # keys are not set on shared client
+        assert (rotating_keys_wykop_api.appkey,
+                rotating_keys_wykop_api.secretkey) == key_pairs[0]
 
     @mock.patch.object(WykopAPI, 'request')
-    def test_rotate_keys_repeat(self, mocked_request, rotating_keys_wykop_api):
+    def test_rotate_keys_exhausted(
+            self, mocked_request, rotating_keys_wykop_api):
+        request_type = mock.sentinel.request_type
+        request_method = mock.sentinel.request_method
+        mocked_request.side_effect = [
+            DailtyRequestLimitError(),
+            DailtyRequestLimitError(),
+        ]
+
+        with pytest.raises(KeysExhaustedError) as exc_info:
+            rotating_keys_wykop_api.request(request_type, request_method)
+
+        assert mocked_request.call_count == 2
+        assert exc_info.value.until > time.time()
+
+    @mock.patch.object(WykopAPI, 'request')
+    def test_rotate_keys_repeat(self, mocked_request, key_pairs):
+        api = RotatingKeysWykopAPI(key_pairs, cooldown=0)
         request_type = mock.sentinel.request_type
         request_method = mock.sentinel.request_method
         response = mock.sentinel.response
@@ -501,15 +559,145 @@ class TestRotatingKeysWykopAPIRequest(object):
             DailtyRequestLimitError(),
             response,
         ]
-        first_appkey = rotating_keys_wykop_api.appkey
-        first_secretkey = rotating_keys_wykop_api.secretkey
 
-        result = rotating_keys_wykop_api.request(request_type, request_method)
+        result = api.request(request_type, request_method)
+
+        assert mocked_request.call_count == 3
+        assert result == response
+        assert mocked_request.call_args[1]['keys'] == key_pairs[0]
+
+
+class TestRotatingKeysWykopAPISigning(object):
+
+    @pytest.fixture
+    def key_pairs(self):
+        return [('appkey%d' % i, 'secretkey%d' % i) for i in range(4)]
+
+    def assert_signed(self, key_pairs, url, headers):
+        appkey = url.split('appkey,')[1].split(',')[0]
+        secretkey = dict(key_pairs)[appkey]
+        sign = hashlib.md5((secretkey + url).encode()).hexdigest()
+        assert headers['apisign'] == sign
+
+    def test_keys(self, key_pairs):
+        api = WykopAPI('appkey0', 'secretkey0')
+        requester = mock.Mock()
+        requester.make_request.return_value = '{}'
+
+        api.request(
+            'links', 'index', [1], api_params={'appkey': 'appkey0'},
+            requester=requester, keys=('appkey1', 'secretkey1'))
+
+        url, _, headers, _ = requester.make_request.call_args[0]
+        assert 'appkey,appkey1,' in url
+        self.assert_signed(key_pairs, url, headers)
 
-        calls = [
-            mock.call(request_type, request_method),
+    @pytest.fixture
+    def switch_often(self):
+        # threads interleave within request preparation
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(interval)
+
+    def test_concurrent(self, key_pairs, switch_often):
+        api = RotatingKeysWykopAPI(
+            key_pairs, strategy=RoundRobinStrategy(), coalesce=False)
+        requests = []
+
+        def make_request(url, data, headers, files):
+            # mock's call records aren't thread safe
+            requests.append((url, headers))
+            return '{}'
+        api.requester = mock.Mock(make_request=make_request)
+
+        api.batch(
+            [lambda i=i: api.get_link(i) for i in range(2000)],
+            max_workers=16)
+
+        assert len(requests) == 2000
+        for url, headers in requests:
+            self.assert_signed(key_pairs, url, headers)
+
+
+class TestRotatingKeysWykopAPILedger(object):
+
+    @pytest.fixture
+    def ledger(self, tmpdir):
+        return QuotaLedger(str(tmpdir.join('quota.db')), daily_limit=10)
+
+    @pytest.fixture
+    def key_pairs(self):
+        return [
+            ('appkey1', 'secretkey1'),
+            ('appkey2', 'secretkey2'),
         ]
-        mocked_request.assert_has_calls(calls)
+
+    @pytest.fixture
+    def requester(self):
+        requester = mock.Mock()
+        requester.make_request.return_value = b'{"login": "m__b"}'
+        return requester
+
+    @pytest.fixture
+    def api(self, key_pairs, ledger, requester):
+        return RotatingKeysWykopAPI(
+            key_pairs, ledger=ledger, requester=requester)
+
+    def test_recorded(self, api, ledger):
+        api.request('rtype', 'rmethod')
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (1, 0)}
+
+    def test_exhausted_skipped(self, api, ledger, requester):
+        ledger.mark_exhausted('appkey1')
+
+        api.request('rtype', 'rmethod')
+
+        url = requester.make_request.call_args[0][0]
+        assert 'appkey,appkey2,' in url
+        assert ledger.get_usage(['appkey2']) == {'appkey2': (1, 0)}
+
+    def test_cached_not_recorded(self, key_pairs, ledger, requester):
+        api = RotatingKeysWykopAPI(
+            key_pairs[:1], ledger=ledger, requester=requester,
+            cache=MemoryCache())
+
+        for _ in range(12):
+            api.get_profile('m__b')
+
+        assert requester.make_request.call_count == 1
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (1, 0)}
+
+    def test_retries_recorded(self, key_pairs, ledger, requester):
+        requester.make_request.side_effect = [
+            APIConnectionError(0, 'reset'), b'{"login": "m__b"}']
+        api = RotatingKeysWykopAPI(
+            key_pairs, ledger=ledger, requester=requester,
+            retry_policy=RetryPolicy(backoff=0))
+
+        api.request('rtype', 'rmethod')
+
+        assert ledger.get_usage(['appkey1']) == {'appkey1': (2, 0)}
+
+    @mock.patch.object(WykopAPI, 'request')
+    def test_rotate_keys(self, mocked_request, api, ledger):
+        response = mock.sentinel.response
+        mocked_request.side_effect = [DailtyRequestLimitError(), response]
+
+        result = api.request('rtype', 'rmethod')
+
         assert result == response
-        assert rotating_keys_wykop_api.appkey == first_appkey
-        assert rotating_keys_wykop_api.secretkey == first_secretkey
+        assert mocked_request.call_args[1]['keys'] == (
+            'appkey2', 'secretkey2')
+        used, exhausted_until = ledger.get_usage(['appkey1'])['appkey1']
+        assert exhausted_until > time.time()
+
+    @mock.patch.object(WykopAPI, 'request')
+    def test_all_exhausted(self, mocked_request, api, ledger):
+        mocked_request.side_effect = DailtyRequestLimitError()
+
+        with pytest.raises(DailtyRequestLimitError):
+            api.request('rtype', 'rmethod')
+
+        assert mocked_request.call_count == 2
@@ -4,6 +4,10 @@ from types import GeneratorType
 import mock
 import pytest
 
+from wykop.api.batch import BatchResult
+from wykop.api.exceptions import WykopAPIError
+from wykop.api.models import Entry
+from wykop.api.parsers import default_parser, get_model_parser
 from wykop.api.v2.clients import WykopAPIv2
 
 
@@ -200,7 +204,7 @@ class TestWykopAPIGetConnectData(object):
             }
             data_str = json.dumps(data)
             data_bytes = data_str.encode()
-            return base64.encodestring(data_bytes)
+            return base64.b64encode(data_bytes)
         return get_connect_data
 
     def test_decoded(self, wykop_api_v2, connect_data_factory):
@@ -212,3 +216,183 @@ class TestWykopAPIGetConnectData(object):
         result = wykop_api_v2.get_connect_data(data_bytes_encoded)
 
         assert result == (appkey, login, token)
+
+
+class TestWykopAPIv2RequestParser(object):
+
+    def test_client_parser(self, wykop_api_v2):
+        wykop_api_v2.parser = get_model_parser(Entry)
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"data": [{"id": 1}]}'
+
+        result = wykop_api_v2.request('entries', requester=requester)
+
+        assert result.data == [Entry(id=1)]
+
+    def test_request_parser(self, wykop_api_v2):
+        wykop_api_v2.parser = get_model_parser(Entry)
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"data": []}'
+
+        result = wykop_api_v2.request(
+            'entries', parser=None, requester=requester)
+
+        assert result == '{"data": []}'
+
+    def test_request_default_parser(self, wykop_api_v2):
+        wykop_api_v2.parser = default_parser.project(['id'])
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"data": [{"id": 1, "x": 2}]}'
+
+        result = wykop_api_v2.request(
+            'entries', parser=default_parser, requester=requester)
+
+        assert result == {'data': [{'id': 1, 'x': 2}]}
+
+    def test_authenticate_projected_parser(self, wykop_api_v2):
+        wykop_api_v2.parser = default_parser.project(['id', 'author.login'])
+        wykop_api_v2.requester = mock.Mock()
+        wykop_api_v2.requester.make_request.return_value = \
+            '{"data": {"userkey": "userkey"}}'
+
+        wykop_api_v2.authenticate('login', 'accountkey')
+
+        assert wykop_api_v2.userkey == 'userkey'
+
+    def test_authenticate_model_parser(self, wykop_api_v2):
+        wykop_api_v2.parser = get_model_parser(Entry)
+        wykop_api_v2.requester = mock.Mock()
+        wykop_api_v2.requester.make_request.return_value = \
+            '{"data": {"userkey": "userkey"}}'
+
+        wykop_api_v2.authenticate('login', 'accountkey')
+
+        assert wykop_api_v2.userkey == 'userkey'
+
+    def test_request_fields(self, wykop_api_v2):
+        requester = mock.Mock()
+        requester.make_request.return_value = \
+            '{"data": [{"id": 1, "body": "test"}], "pagination": null}'
+
+        result = wykop_api_v2.request(
+            'entries', requester=requester, fields=['id'])
+
+        assert result == {'data': [{'id': 1}], 'pagination': None}
+
+    def test_request_fields_no_parser(self, wykop_api_v2):
+        requester = mock.Mock()
+        requester.make_request.return_value = '{"data": []}'
+
+        result = wykop_api_v2.request(
+            'entries', parser=None, requester=requester, fields=['id'])
+
+        assert result == '{"data": []}'
+
+
+class TestWykopAPIv2RequestStream(object):
+
+    def test_items(self, wykop_api_v2):
+        requester = mock.Mock()
+        requester.stream_request.return_value = iter(
+            [b'{"data": [{"id": 1}, ', b'{"id": 2}]}'])
+
+        result = wykop_api_v2.request(
+            'entries', requester=requester, stream=True)
+
+        assert [item.id for item in result] == [1, 2]
+        url = wykop_api_v2.construct_url('entries')
+        headers = wykop_api_v2.get_headers(url)
+        requester.stream_request.assert_called_once_with(
+            url, {}, headers, {})
+        requester.make_request.assert_not_called()
+
+    def test_fields(self, wykop_api_v2):
+        requester = mock.Mock()
+        requester.stream_request.return_value = iter(
+            [b'{"data": [{"id": 1, "body": "test"}]}'])
+
+        result = wykop_api_v2.request(
+            'entries', requester=requester, stream=True, fields=['id'])
+
+        assert list(result) == [{'id': 1}]
+
+    def test_no_parser(self, wykop_api_v2):
+        chunks = iter([b'{"data": []}'])
+        requester = mock.Mock()
+        requester.stream_request.return_value = chunks
+
+        result = wykop_api_v2.request(
+            'entries', parser=None, requester=requester, stream=True)
+
+        assert result is chunks
+
+
+class TestWykopAPIv2Paginate(object):
+
+    @mock.patch.object(WykopAPIv2, 'get_tag_entries')
+    def test_iter_tag_entries(self, mocked_get_tag_entries, wykop_api_v2):
+        mocked_get_tag_entries.side_effect = [
+            {'data': [1, 2], 'pagination': {'next': 'next'}},
+            {'data': [3], 'pagination': {'next': None}},
+        ]
+
+        result = list(wykop_api_v2.iter_tag_entries('tag'))
+
+        assert result == [1, 2, 3]
+        mocked_get_tag_entries.assert_has_calls([
+            mock.call('tag', page=1),
+            mock.call('tag', page=2),
+        ])
+
+    @mock.patch.object(WykopAPIv2, 'get_links_upcoming')
+    def test_endpoint_kwargs(self, mocked_get_links_upcoming, wykop_api_v2):
+        mocked_get_links_upcoming.side_effect = [
+            {'data': [1, 2]},
+            {'data': []},
+        ]
+
+        result = list(wykop_api_v2.iter_links_upcoming(
+            sort='date', page=3, max_items=5))
+
+        assert result == [1, 2]
+        mocked_get_links_upcoming.assert_has_calls([
+            mock.call(sort='date', page=3),
+            mock.call(sort='date', page=4),
+        ])
+
+
+class TestWykopAPIv2Batch(object):
+
+    @mock.patch.object(WykopAPIv2, 'get_hits_month')
+    def test_fetch_pages(self, mocked_get_hits_month, wykop_api_v2):
+        error = WykopAPIError()
+
+        def get_hits_month(year, month, page=1):
+            if page == 2:
+                raise error
+            return page
+        mocked_get_hits_month.side_effect = get_hits_month
+
+        result = wykop_api_v2.fetch_pages(
+            wykop_api_v2.get_hits_month, 2018, 5, pages=range(1, 4))
+
+        assert result == [
+            BatchResult(1, None),
+            BatchResult(None, error),
+            BatchResult(3, None),
+        ]
+
+    @mock.patch.object(WykopAPIv2, 'request')
+    def test_batch_requests(self, mocked_request, wykop_api_v2):
+        mocked_request.side_effect = lambda *args, **kwargs: (args, kwargs)
+
+        result = wykop_api_v2.batch_requests([
+            ('entries', 'stream'),
+            {'rtype': 'entries', 'api_params': {'entry': 1}},
+        ])
+
+        assert result == [
+            BatchResult((('entries', 'stream'), {}), None),
+            BatchResult(
+                ((), {'rtype': 'entries', 'api_params': {'entry': 1}}), None),
+        ]
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import mock
+
+import wykop
+
+
+class TestVersion(object):
+
+    def test_pkg_resources_not_imported(self):
+        code = (
+            "import sys, wykop; "
+            "assert 'pkg_resources' not in sys.modules"
+        )
+
+        subprocess.check_call([sys.executable, '-c', code])
+
+    @mock.patch('wykop.get_version')
+    def test_lazy(self, mocked_get_version):
+        mocked_get_version.return_value = mock.sentinel.version
+
+        assert wykop.__version__ == mock.sentinel.version
+
+
+class TestLazyImports(object):
+
+    def test_v2_only(self):
+        code = (
+            "import sys; "
+            "from wykop import WykopAPIv2; "
+            "WykopAPIv2('appkey', 'secretkey').get_user_agent(); "
+            "loaded = set(['pkg_resources', 'wykop.api.v1.clients', "
+            "'multiprocessing.pool']) & set(sys.modules); "
+            "assert not loaded, loaded"
+        )
+
+        subprocess.check_call([sys.executable, '-c', code])
+
+    def test_clients(self):
+        from wykop.api.v1.clients import WykopAPIv1
+        from wykop.api.v2.clients import WykopAPIv2
+
+        assert wykop.WykopAPI is WykopAPIv1
+        assert wykop.WykopAPIv2 is WykopAPIv2
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import datetime
-from pkg_resources import DistributionNotFound
+import threading
 import mock
 import pytest
 
 from six import b, u
 
-from wykop.utils import force_text, force_bytes, get_version
+from wykop.utils import (
+    DistributionNotFound, force_text, force_bytes, get_distribution,
+    get_version, lazy_attributes, once,
+)
 
 
 class TestForceText(object):
@@ -65,6 +68,12 @@ class TestForceBytes(object):
 
 class TestGetVersion(object):
 
+    @pytest.fixture(autouse=True)
+    def clear_version(self):
+        get_version.clear()
+        yield
+        get_version.clear()
+
     @mock.patch('wykop.utils.get_distribution')
     def test_no_distribution(self, m_get_distribution):
         m_get_distribution.side_effect = DistributionNotFound
@@ -85,3 +94,61 @@ class TestGetVersion(object):
         result = get_version()
 
         assert result == version
+
+    @mock.patch('wykop.utils.get_distribution')
+    def test_cached(self, m_get_distribution):
+        get_version()
+        get_version()
+
+        m_get_distribution.assert_called_once_with('wykop')
+
+
+class TestGetDistribution(object):
+
+    def test_not_found(self):
+        with pytest.raises(DistributionNotFound):
+            get_distribution('wykop-no-such-distribution')
+
+
+class TestOnce(object):
+
+    def test_called_once(self):
+        func = mock.Mock(return_value=mock.sentinel.result)
+        wrapped = once(func)
+        threads = [threading.Thread(target=wrapped) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert wrapped() == mock.sentinel.result
+        func.assert_called_once_with()
+
+    def test_clear(self):
+        func = mock.Mock()
+        wrapped = once(func)
+
+        wrapped()
+        wrapped.clear()
+        wrapped()
+
+        assert func.call_count == 2
+
+
+class TestLazyAttributes(object):
+
+    def test_path(self):
+        getattr_ = lazy_attributes(__name__, {'dt': 'datetime:datetime'})
+
+        assert getattr_('dt') is datetime.datetime
+
+    def test_getter(self):
+        getattr_ = lazy_attributes(__name__, {'value': lambda: 1})
+
+        assert getattr_('value') == 1
+
+    def test_missing(self):
+        getattr_ = lazy_attributes(__name__, {})
+
+        with pytest.raises(AttributeError):
+            getattr_('missing')
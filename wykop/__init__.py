@@ -1,7 +1,10 @@
 """Python library for the Wykop API."""
-from wykop.api.v1.clients import WykopAPIv1 as WykopAPI
-from wykop.api.v2.clients import WykopAPIv2
-from wykop.api.exceptions import WykopAPIError
-from wykop.utils import get_version
+from wykop.utils import get_version, lazy_attributes
 
-__version__ = get_version()
+# clients are imported on first access; v2 consumers don't load v1
+__getattr__ = lazy_attributes(__name__, {
+    'WykopAPI': 'wykop.api.v1.clients:WykopAPIv1',
+    'WykopAPIv2': 'wykop.api.v2.clients:WykopAPIv2',
+    'WykopAPIError': 'wykop.api.exceptions:WykopAPIError',
+    '__version__': lambda: get_version(),
+})
@@ -0,0 +1 @@
+"""Wykop API asyncio module. Requires Python 3.6+."""
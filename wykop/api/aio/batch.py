@@ -0,0 +1,26 @@
+"""Wykop API asyncio batch module."""
+import asyncio
+
+from wykop.api.batch import BatchResult
+from wykop.api.exceptions import WykopAPIError
+
+
+async def call_captured(call, semaphore):
+    """
+    Awaits `call` capturing Wykop API error in result.
+    """
+    async with semaphore:
+        try:
+            return BatchResult(await call(), None)
+        except WykopAPIError as ex:
+            return BatchResult(None, ex)
+
+
+async def run_batch(calls, max_workers=10):
+    """
+    Async counterpart of :func:`wykop.api.batch.run_batch`. At most
+    `max_workers` calls are awaited at once.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    return await asyncio.gather(
+        *[call_captured(call, semaphore) for call in calls])
@@ -0,0 +1,149 @@
+"""Wykop API asyncio clients module."""
+import asyncio
+import logging
+from functools import partial
+
+from wykop.api.aio.batch import run_batch
+from wykop.api.aio.pagination import paginate
+from wykop.api.aio.requesters import get_default_async_requester
+from wykop.api.aio.retries import call_with_retries
+from wykop.api.aio.singleflight import AsyncSingleFlight
+from wykop.api.timeouts import check_deadline
+
+log = logging.getLogger(__name__)
+
+
+class BaseAsyncWykopAPI(object):
+    """
+    Base asyncio Wykop API mixin.
+
+    Turns `request` of Wykop API class it's mixed into awaitable. URL
+    construction and signing are inherited unchanged.
+    """
+
+    _single_flight_class = AsyncSingleFlight
+
+    def _get_default_requester(self):
+        return get_default_async_requester()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def send(self, url, post_params, headers, file_params, parser,
+                   requester, timeout=None, endpoint=None, appkey=None):
+        """
+        Sends prepared request and parses response. Transient failures
+        are retried according to retry policy, within current deadline.
+        Cacheable responses of `endpoint` are served from cache; stale
+        ones are refreshed in background task. Concurrent identical reads
+        share one request.
+        """
+        cache_entry = self.get_cache_entry(
+            url, endpoint, post_params, file_params, parser)
+        mutating = bool(post_params or file_params)
+        send = partial(
+            self._send, url, post_params, headers, file_params, parser,
+            requester, timeout, cache_entry, appkey)
+
+        if cache_entry is not None:
+            cached, fresh = self.cache.lookup(cache_entry.key)
+            if cached is not None:
+                if not fresh:
+                    self._refresh(cache_entry.key, send, mutating)
+                return parser.parse(cached)
+
+        if not self.is_coalesced(mutating, cache_entry):
+            return await self._call(send, mutating)
+
+        return await self._single_flight.call(
+            (self.get_cache_key(url, post_params), parser),
+            partial(self._call, send, mutating))
+
+    def send_stream(self, url, post_params, headers, file_params, parser,
+                    requester, timeout=None, appkey=None):
+        raise NotImplementedError(
+            "Streaming responses is not supported by asyncio clients")
+
+    async def _call(self, send, mutating):
+        if self.retry_policy is None:
+            return await send()
+
+        return await call_with_retries(
+            self.retry_policy, send, mutating=mutating)
+
+    def _refresh(self, cache_key, send, mutating):
+        # single refresh of stale response at once
+        if not self.cache.claim_refresh(cache_key):
+            return
+
+        async def refresh():
+            try:
+                await self._call(send, mutating)
+            except Exception:
+                log.warning(
+                    "Refreshing cached response failed", exc_info=True)
+            finally:
+                self.cache.release_refresh(cache_key)
+
+        # keep reference to task until it's done
+        tasks = self.__dict__.setdefault('_refresh_tasks', set())
+        task = asyncio.ensure_future(refresh())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _send(self, url, post_params, headers, file_params, parser,
+                    requester, timeout, cache_entry=None, appkey=None):
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(
+                appkey or self.appkey, self._domain)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        check_deadline()
+        self._record_request(appkey)
+        options = {} if timeout is None else {'timeout': timeout}
+        response = await requester.make_request(
+            url, post_params, headers, file_params, **options)
+
+        if parser is None:
+            return response
+
+        return self._parse(response, parser, cache_entry)
+
+    async def batch(self, calls, max_workers=10):
+        """
+        Awaits calls (callables without arguments returning awaitables)
+        concurrently.
+        """
+        return await run_batch(calls, max_workers=max_workers)
+
+    def paginate(self, method, *args, **kwargs):
+        """
+        Iterates lazily over items of paged endpoint method. Returns
+        asynchronous iterator.
+        """
+        page = kwargs.pop('page', 1)
+        max_items = kwargs.pop('max_items', None)
+        prefetch = kwargs.pop('prefetch', False)
+        deadline = kwargs.pop('deadline', None)
+
+        def fetch_page(page):
+            return method(*args, page=page, **kwargs)
+
+        return paginate(
+            fetch_page, self.get_page_items, self.has_next_page,
+            page=page, max_items=max_items, prefetch=prefetch,
+            deadline=deadline,
+        )
+
+    async def close(self):
+        """
+        Closes client requester. Shared default requester is left open
+        for other clients.
+        """
+        if self.requester is get_default_async_requester():
+            return
+        await self.requester.close()
@@ -0,0 +1,25 @@
+"""Wykop API asyncio decorators module."""
+from functools import wraps
+
+from wykop.api.exceptions import InvalidUserKeyError
+
+
+def login_required(method):
+    """
+    Async counterpart of :func:`wykop.api.decorators.login_required`.
+
+    Wrapped method may be a plain function returning awaitable, so
+    undecorated sync endpoint methods can be reused.
+    """
+    @wraps(method)
+    async def decorator(self, *args, **kwargs):
+        if not self.userkey:
+            await self.authenticate()
+
+        try:
+            return await method(self, *args, **kwargs)
+        # get new userkey on invalid key
+        except InvalidUserKeyError:
+            await self.authenticate()
+            return await method(self, *args, **kwargs)
+    return decorator
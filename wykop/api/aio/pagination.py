@@ -0,0 +1,56 @@
+"""Wykop API asyncio pagination module."""
+import asyncio
+from functools import wraps
+
+from wykop.api.timeouts import clock, deadline_at, get_deadline
+
+
+def with_async_deadline(fetch_page, until):
+    @wraps(fetch_page)
+    async def wrapper(page):
+        with deadline_at(until):
+            return await fetch_page(page)
+    return wrapper
+
+
+async def paginate(fetch_page, get_items, has_next_page, page=1,
+                   max_items=None, prefetch=False, deadline=None):
+    """
+    Async counterpart of :func:`wykop.api.pagination.paginate`. With
+    `prefetch` next page is fetched in background task.
+    """
+    until = get_deadline()
+    if deadline is not None:
+        until = min(until or float('inf'), clock() + deadline)
+    if until is not None:
+        fetch_page = with_async_deadline(fetch_page, until)
+
+    pending = None
+    count = 0
+    try:
+        response = await fetch_page(page)
+        while True:
+            items = get_items(response)
+            if max_items is not None:
+                items = items[:max_items - count]
+            count += len(items)
+
+            has_next = bool(items) and has_next_page(response) and \
+                (max_items is None or count < max_items)
+            if has_next and prefetch:
+                pending = asyncio.ensure_future(fetch_page(page + 1))
+
+            for item in items:
+                yield item
+
+            if not has_next:
+                return
+
+            page += 1
+            if pending is not None:
+                response, pending = await pending, None
+            else:
+                response = await fetch_page(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
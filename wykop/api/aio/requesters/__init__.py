@@ -0,0 +1,35 @@
+"""Wykop API asyncio requesters module."""
+from wykop.utils import lazy_attributes, once
+
+
+def get_async_requester_class():
+    """
+    Gets aiohttp requester class if aiohttp module is installed,
+    executor one otherwise.
+    """
+    # try aiohttp module
+    try:
+        import aiohttp
+
+        from wykop.api.aio.requesters.aiohttp import (
+            AiohttpRequester as AsyncRequester,
+        )
+    except ImportError:
+        from wykop.api.aio.requesters.executor import (
+            ExecutorRequester as AsyncRequester,
+        )
+    return AsyncRequester
+
+
+@once
+def get_default_async_requester():
+    """
+    Gets shared default asyncio requester, created on first use.
+    """
+    return get_async_requester_class()()
+
+
+__getattr__ = lazy_attributes(__name__, {
+    'AsyncRequester': get_async_requester_class,
+    'default_async_requester': get_default_async_requester,
+})
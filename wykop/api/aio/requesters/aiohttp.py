@@ -0,0 +1,122 @@
+"""Wykop API aiohttp requester module."""
+import asyncio
+import logging
+
+from aiohttp import (
+    ClientConnectionError, ClientError, ClientResponseError, ClientSession,
+    ClientTimeout, DummyCookieJar, FormData,
+)
+from aiohttp import TCPConnector
+
+from wykop.api.aio.requesters.base import BaseAsyncRequester
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, HTTPStatusError,
+)
+from wykop.api.timeouts import cap_timeout, split_timeout
+from wykop.utils import mimetype, force_text
+
+log = logging.getLogger(__name__)
+
+
+class AiohttpRequester(BaseAsyncRequester):
+    """
+    Aiohttp Wykop API requester. Uses aiohttp module.
+
+    Keeps session with pooled keep-alive connections. Number of
+    concurrent connections (in total and per host) is bounded, excess
+    requests wait for free connection. Default `timeout` is number of
+    seconds or `(connect, read)` pair.
+    """
+
+    METHOD_GET = 'GET'
+    METHOD_POST = 'POST'
+
+    def __init__(self, limit=100, limit_per_host=0, keepalive_timeout=15,
+                 timeout=None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+        self._loop = None
+
+    @property
+    def session(self):
+        """
+        Gets session bound to running event loop. Creates one on first use.
+        """
+        loop = asyncio.get_event_loop()
+        if self._session is None or self._session.closed or \
+                self._loop is not loop:
+            self._session = self._create_session()
+            self._loop = loop
+        return self._session
+
+    async def make_request(self, url, data=None, headers=None, files=None,
+                           timeout=None):
+        log.debug(
+            " Fetching url: `%s` (data: %s, headers: `%s`)",
+            str(url), str(data), str(headers),
+        )
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        try:
+            method = self._get_method(data, files)
+            data = self._get_data(data, files)
+            options = self._get_options(timeout)
+            async with self.session.request(
+                    method, url, data=data, headers=headers,
+                    **options) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+        except asyncio.TimeoutError as ex:
+            raise APITimeoutError(0, str(ex))
+        except ClientResponseError as ex:
+            raise HTTPStatusError(ex.status, str(ex))
+        except ClientConnectionError as ex:
+            raise APIConnectionError(0, str(ex))
+        except ClientError as ex:
+            raise WykopAPIError(0, str(ex))
+
+    async def close(self):
+        session, self._session = self._session, None
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _create_session(self):
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        # API is stateless; don't carry cookies between requests
+        return ClientSession(connector=connector, cookie_jar=DummyCookieJar())
+
+    def _get_data(self, data, files):
+        if not files:
+            return data and {
+                key: force_text(value) for key, value in data.items()}
+
+        form = FormData()
+        for key, value in (data or {}).items():
+            form.add_field(key, force_text(value))
+        for key, fileobj in files.items():
+            form.add_field(
+                key, fileobj, filename=fileobj.name,
+                content_type=mimetype(fileobj.name),
+            )
+        return form
+
+    def _get_options(self, timeout):
+        if timeout is None:
+            # session default
+            return {}
+        connect_timeout, read_timeout = split_timeout(timeout)
+        return {
+            'timeout': ClientTimeout(
+                total=None, sock_connect=connect_timeout,
+                sock_read=read_timeout),
+        }
+
+    def _get_method(self, data, files):
+        return self.METHOD_POST if data or files else self.METHOD_GET
@@ -0,0 +1,23 @@
+"""Wykop API asyncio base requester module."""
+class BaseAsyncRequester(object):
+    """Base Wykop API asyncio requester"""
+
+    timeout = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def make_request(self, url, data=None, headers=None, files=None,
+                           timeout=None):
+        raise NotImplementedError(
+            "%s: `make_request` method must be implemented" %
+            self.__class__.__name__)
+
+    async def close(self):
+        """
+        Releases resources (ie. pooled connections) held by requester.
+        """
+        pass
@@ -0,0 +1,47 @@
+"""Wykop API executor requester module."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from wykop.api.aio.requesters.base import BaseAsyncRequester
+from wykop.api.requesters import get_default_requester
+from wykop.api.timeouts import cap_timeout
+
+
+class ExecutorRequester(BaseAsyncRequester):
+    """
+    Executor Wykop API requester. Runs synchronous requester in thread
+    pool, so at most `max_workers` requests are in flight at once.
+    """
+
+    def __init__(self, requester=None, max_workers=10):
+        self.requester = requester or get_default_requester()
+        self.max_workers = max_workers
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    @property
+    def timeout(self):
+        return getattr(self.requester, 'timeout', None)
+
+    async def make_request(self, url, data=None, headers=None, files=None,
+                           timeout=None):
+        loop = asyncio.get_event_loop()
+        # deadline isn't visible in executor thread; cap timeout here
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        make_request = partial(
+            self.requester.make_request,
+            url, data=data, headers=headers, files=files, timeout=timeout,
+        )
+        return await loop.run_in_executor(self.executor, make_request)
+
+    async def close(self):
+        executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
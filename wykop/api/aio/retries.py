@@ -0,0 +1,28 @@
+"""Wykop API asyncio retries module."""
+import asyncio
+
+from wykop.api.exceptions import WykopAPIError
+from wykop.api.retries import clock
+
+
+async def call_with_retries(retry_policy, call, mutating=False):
+    """
+    Async counterpart of :meth:`wykop.api.retries.RetryPolicy.call`.
+    Awaits `call` (callable without arguments returning awaitable)
+    retrying transient failures.
+    """
+    started = clock()
+    retries = 0
+    while True:
+        try:
+            return await call()
+        except WykopAPIError as ex:
+            delay = retry_policy.get_delay(
+                ex, retries, started, mutating=mutating)
+            if delay is None:
+                ex.retries = retries
+                raise
+            retry_policy._notify(ex, retries, delay)
+
+        await asyncio.sleep(delay)
+        retries += 1
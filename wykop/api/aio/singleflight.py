@@ -0,0 +1,38 @@
+"""Wykop API asyncio single-flight module."""
+import asyncio
+
+from wykop.api.singleflight import outlives
+from wykop.api.timeouts import get_deadline
+
+
+class AsyncSingleFlight(object):
+    """
+    Async counterpart of :class:`wykop.api.singleflight.SingleFlight`.
+    Awaits one call (callable without arguments returning awaitable) per
+    key at once.
+    """
+
+    def __init__(self):
+        self._flights = {}
+
+    def __len__(self):
+        return len(self._flights)
+
+    async def call(self, key, func):
+        while True:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                # task runs with leader's deadline
+                task = asyncio.ensure_future(func())
+                flight = self._flights[key] = task, get_deadline()
+                task.add_done_callback(
+                    lambda _: self._flights.pop(key, None))
+
+            task, deadline = flight
+            try:
+                # cancelled caller doesn't cancel call shared with others
+                return await asyncio.shield(task)
+            except Exception as ex:
+                if leader or not outlives(ex, deadline):
+                    raise
@@ -0,0 +1,176 @@
+"""Wykop API version 1 asyncio clients module."""
+import logging
+
+from wykop.api.aio.clients import BaseAsyncWykopAPI
+from wykop.api.aio.decorators import login_required
+from wykop.api.exceptions import WykopAPIError, DailtyRequestLimitError
+from wykop.api.keys import KeyScheduler
+from wykop.api.v1.clients import BaseWykopAPIv1, WykopAPIv1
+
+log = logging.getLogger(__name__)
+
+
+class AsyncWykopAPIv1(BaseAsyncWykopAPI, WykopAPIv1):
+    """
+    Asyncio Wykop API version 1.
+
+    All endpoint methods of :class:`WykopAPIv1` return awaitables. Unlike
+    sync client it doesn't authenticate on init; methods requiring login
+    authenticate on first call.
+    """
+
+    def __init__(self, appkey, secretkey, login=None, accountkey=None,
+                 password=None, output='', response_format='json',
+                 requester=None, rate_limiter=None, retry_policy=None,
+                 cache=None, coalesce=True, parser=None):
+        BaseWykopAPIv1.__init__(
+            self, appkey, secretkey, login=login, accountkey=accountkey,
+            password=password, output=output, response_format=response_format,
+            requester=requester, rate_limiter=rate_limiter,
+            retry_policy=retry_policy, cache=cache, coalesce=coalesce,
+            parser=parser)
+
+    async def authenticate(self, login=None, accountkey=None, password=None):
+        self.login = login or self.login
+        self.accountkey = accountkey or self.accountkey
+        self.password = password or self.password
+
+        if not self.login or not (self.accountkey or self.password):
+            raise WykopAPIError(
+                0, 'Login or (password or account key) not set')
+
+        res = await self.user_login(
+            self.login, self.accountkey, self.password)
+        self.userkey = res['userkey']
+
+    # Comments
+
+    add_comment = login_required(WykopAPIv1.add_comment.__wrapped__)
+    plus_comment = login_required(WykopAPIv1.plus_comment.__wrapped__)
+    minus_comment = login_required(WykopAPIv1.minus_comment.__wrapped__)
+    edit_comment = login_required(WykopAPIv1.edit_comment.__wrapped__)
+    delete_comment = login_required(WykopAPIv1.delete_comment.__wrapped__)
+
+    # Link
+
+    dig_link = login_required(WykopAPIv1.dig_link.__wrapped__)
+    cancel_link = login_required(WykopAPIv1.cancel_link.__wrapped__)
+    bury_link = login_required(WykopAPIv1.bury_link.__wrapped__)
+    observe_link = login_required(WykopAPIv1.observe_link.__wrapped__)
+    favorite_link = login_required(WykopAPIv1.favorite_link.__wrapped__)
+
+    # MyWykop
+
+    get_mywykop = login_required(WykopAPIv1.get_mywykop.__wrapped__)
+    get_mywykop_tags = login_required(WykopAPIv1.get_mywykop_tags.__wrapped__)
+    get_mywykop_users = login_required(
+        WykopAPIv1.get_mywykop_users.__wrapped__)
+    get_notifications = login_required(
+        WykopAPIv1.get_notifications.__wrapped__)
+    get_notifications_count = login_required(
+        WykopAPIv1.get_notifications_count.__wrapped__)
+    get_hashtags_notifications = login_required(
+        WykopAPIv1.get_hashtags_notifications.__wrapped__)
+    get_hashtags_notifications_count = login_required(
+        WykopAPIv1.get_hashtags_notifications_count.__wrapped__)
+    mark_as_read_notifications = login_required(
+        WykopAPIv1.mark_as_read_notifications.__wrapped__)
+    mark_as_read_hashtags_notifications = login_required(
+        WykopAPIv1.mark_as_read_hashtags_notifications.__wrapped__)
+    mark_as_read_notification = login_required(
+        WykopAPIv1.mark_as_read_notification.__wrapped__)
+
+    # Profile
+
+    get_profile_buried = login_required(
+        WykopAPIv1.get_profile_buried.__wrapped__)
+    observe_profile = login_required(WykopAPIv1.observe_profile.__wrapped__)
+    unobserve_profile = login_required(
+        WykopAPIv1.unobserve_profile.__wrapped__)
+    block_profile = login_required(WykopAPIv1.block_profile.__wrapped__)
+    unblock_profile = login_required(WykopAPIv1.unblock_profile.__wrapped__)
+
+    # User
+
+    get_user_favorites = login_required(
+        WykopAPIv1.get_user_favorites.__wrapped__)
+    get_user_observed = login_required(
+        WykopAPIv1.get_user_observed.__wrapped__)
+
+    # Related
+
+    plus_related = login_required(WykopAPIv1.plus_related.__wrapped__)
+    minus_related = login_required(WykopAPIv1.minus_related.__wrapped__)
+    add_related = login_required(WykopAPIv1.add_related.__wrapped__)
+
+    # Entries
+
+    add_entry = login_required(WykopAPIv1.add_entry.__wrapped__)
+    edit_entry = login_required(WykopAPIv1.edit_entry.__wrapped__)
+    delete_entry = login_required(WykopAPIv1.delete_entry.__wrapped__)
+    add_entry_comment = login_required(
+        WykopAPIv1.add_entry_comment.__wrapped__)
+    edit_entry_comment = login_required(
+        WykopAPIv1.edit_entry_comment.__wrapped__)
+    delete_entry_comment = login_required(
+        WykopAPIv1.delete_entry_comment.__wrapped__)
+    vote_entry = login_required(WykopAPIv1.vote_entry.__wrapped__)
+    unvote_entry = login_required(WykopAPIv1.unvote_entry.__wrapped__)
+    vote_entry_comment = login_required(
+        WykopAPIv1.vote_entry_comment.__wrapped__)
+    unvote_entry_comment = login_required(
+        WykopAPIv1.unvote_entry_comment.__wrapped__)
+
+    # Favorites
+
+    get_favorites = login_required(WykopAPIv1.get_favorites.__wrapped__)
+    get_favorites_lists = login_required(
+        WykopAPIv1.get_favorites_lists.__wrapped__)
+
+    # PM
+
+    get_conversations_list = login_required(
+        WykopAPIv1.get_conversations_list.__wrapped__)
+    get_conversation = login_required(WykopAPIv1.get_conversation.__wrapped__)
+    send_message = login_required(WykopAPIv1.send_message.__wrapped__)
+    delete_conversation = login_required(
+        WykopAPIv1.delete_conversation.__wrapped__)
+
+
+class AsyncRotatingKeysWykopAPI(AsyncWykopAPIv1):
+    """
+    Asyncio Rotating Keys Wykop API class.
+
+    Keys are scheduled as in :class:`RotatingKeysWykopAPI`; key exhausted
+    by many in-flight requests is put on cooldown just once.
+    """
+
+    def __init__(self, key_pairs=[(None, None)], ledger=None, strategy=None,
+                 cooldown=None, **kwargs):
+        self.scheduler = KeyScheduler(
+            key_pairs, strategy=strategy, cooldown=cooldown, ledger=ledger)
+        keys = key_pairs[0]
+
+        super(AsyncRotatingKeysWykopAPI, self).__init__(*keys, **kwargs)
+
+    def __getstate__(self):
+        state = super(AsyncRotatingKeysWykopAPI, self).__getstate__()
+        state['scheduler'] = self.scheduler
+        return state
+
+    def __setstate__(self, state):
+        super(AsyncRotatingKeysWykopAPI, self).__setstate__(state)
+        self.scheduler = state['scheduler']
+
+    async def request(self, *args, **kwargs):
+        while True:
+            keys = self.scheduler.acquire()
+            try:
+                return await super(AsyncRotatingKeysWykopAPI, self).request(
+                    *args, keys=keys, **kwargs)
+            except DailtyRequestLimitError:
+                log.debug("Key pair %s exhausted", keys[0])
+                self.scheduler.mark_exhausted(keys[0])
+
+    def _record_request(self, appkey):
+        self.scheduler.record(appkey)
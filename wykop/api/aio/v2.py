@@ -0,0 +1,58 @@
+"""Wykop API version 2 asyncio clients module."""
+from wykop.api.aio.clients import BaseAsyncWykopAPI
+from wykop.api.aio.decorators import login_required
+from wykop.api.exceptions import WykopAPIError
+from wykop.api.v2.clients import WykopAPIv2
+
+
+class AsyncWykopAPIv2(BaseAsyncWykopAPI, WykopAPIv2):
+    """
+    Asyncio Wykop API version 2.
+
+    All endpoint methods of :class:`WykopAPIv2` return awaitables.
+    """
+
+    async def authenticate(self, login=None, accountkey=None, password=None):
+        self.login = login or self.login
+        self.accountkey = accountkey or self.accountkey
+        self.password = password or self.password
+
+        if not self.login or not (self.accountkey or self.password):
+            raise WykopAPIError(
+                0, 'Login or (password or account key) not set')
+
+        res = await self.user_login(
+            self.login, self.accountkey, self.password)
+        self.userkey = res['data']['userkey']
+
+    # mywykop
+
+    get_mywykop = login_required(WykopAPIv2.get_mywykop.__wrapped__)
+    get_mywykop_tags = login_required(WykopAPIv2.get_mywykop_tags.__wrapped__)
+    get_mywykop_users = login_required(
+        WykopAPIv2.get_mywykop_users.__wrapped__)
+    get_moj = login_required(WykopAPIv2.get_moj.__wrapped__)
+    get_moj_tagi = login_required(WykopAPIv2.get_moj_tagi.__wrapped__)
+
+    # profiles
+
+    observe_profile = login_required(WykopAPIv2.observe_profile.__wrapped__)
+    unobserve_profile = login_required(
+        WykopAPIv2.unobserve_profile.__wrapped__)
+    block_profile = login_required(WykopAPIv2.block_profile.__wrapped__)
+    unblock_profile = login_required(WykopAPIv2.unblock_profile.__wrapped__)
+
+    # pm
+
+    get_conversations_list = login_required(
+        WykopAPIv2.get_conversations_list.__wrapped__)
+
+    # notifications
+
+    get_notifications_count = login_required(
+        WykopAPIv2.get_notifications_count.__wrapped__)
+
+    # tags
+
+    get_tags_observed = login_required(
+        WykopAPIv2.get_tags_observed.__wrapped__)
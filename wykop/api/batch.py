@@ -0,0 +1,42 @@
+"""Wykop API batch module."""
+from collections import namedtuple
+
+from wykop.api.exceptions import WykopAPIError
+from wykop.api.timeouts import get_deadline, with_deadline
+
+BatchResult = namedtuple('BatchResult', ['value', 'error'])
+
+
+def call_captured(call):
+    """
+    Calls `call` capturing Wykop API error in result.
+    """
+    try:
+        return BatchResult(call(), None)
+    except WykopAPIError as ex:
+        return BatchResult(None, ex)
+
+
+def run_batch(calls, max_workers=10):
+    """
+    Runs calls concurrently on pool of at most `max_workers` threads.
+
+    Returns list of `BatchResult` in order of calls.
+    """
+    # multiprocessing is slow to import
+    from multiprocessing.pool import ThreadPool
+
+    calls = list(calls)
+    if not calls:
+        return []
+
+    # pass current deadline to worker threads
+    until = get_deadline()
+    if until is not None:
+        calls = [with_deadline(call, until) for call in calls]
+
+    pool = ThreadPool(min(max_workers, len(calls)))
+    try:
+        return pool.map(call_captured, calls, chunksize=1)
+    finally:
+        pool.close()
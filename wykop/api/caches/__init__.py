@@ -0,0 +1 @@
+"""Wykop API response caches package."""
@@ -0,0 +1,148 @@
+"""Wykop API base cache module."""
+import threading
+from collections import namedtuple
+
+from wykop.api.exceptions import (
+    CommentDoesNotExistError,
+    EntryDoesNotExistError,
+    RemovedLinkError,
+    UserDoesNotExistError,
+)
+
+CacheEntry = namedtuple(
+    'CacheEntry', ['key', 'ttl', 'stale_ttl', 'negative_ttl'])
+
+
+class BaseCache(object):
+    """
+    Base Wykop API response cache.
+
+    Stores raw response bodies for `ttl` seconds. Per endpoint TTLs
+    (`ttls`) are keyed by `rtype/rmethod` or just `rtype`, ie.
+    ``{'hits/popular': 300, 'profiles': 60}``; TTL of 0 disables cache
+    for endpoint. Expired responses are still served for `stale_ttl`
+    seconds (per endpoint `stale_ttls`) while they're refreshed in
+    background.
+
+    Not found and removed object errors (`negative_errors`) are cached
+    for `negative_ttl` seconds (per endpoint `negative_ttls`), so they
+    are raised again without request; negative caching is disabled by
+    default.
+    """
+
+    negative_errors = (
+        EntryDoesNotExistError,
+        RemovedLinkError,
+        CommentDoesNotExistError,
+        UserDoesNotExistError,
+    )
+
+    def __init__(self, ttl=60, ttls=None, stale_ttl=0, stale_ttls=None,
+                 negative_ttl=0, negative_ttls=None):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self.stale_ttls = dict(stale_ttls or {})
+        self.negative_ttl = negative_ttl
+        self.negative_ttls = dict(negative_ttls or {})
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+
+    def get_ttl(self, endpoint, default=True):
+        """
+        Gets TTL of endpoint responses. Falls back to default TTL only
+        if `default` is set; otherwise returns None.
+        """
+        return self._get_endpoint_option(
+            self.ttls, endpoint, self.ttl if default else None)
+
+    def get_stale_ttl(self, endpoint):
+        """
+        Gets how long expired endpoint responses are served while
+        refreshed.
+        """
+        return self._get_endpoint_option(
+            self.stale_ttls, endpoint, self.stale_ttl)
+
+    def get_negative_ttl(self, endpoint, default=True):
+        """
+        Gets TTL of endpoint not found errors. Falls back to default TTL
+        only if `default` is set; otherwise returns None.
+        """
+        return self._get_endpoint_option(
+            self.negative_ttls, endpoint,
+            self.negative_ttl if default else None)
+
+    def is_negative(self, error):
+        """
+        Checks whether API error is cached.
+        """
+        return isinstance(error, self.negative_errors)
+
+    def claim_refresh(self, key):
+        """
+        Claims refresh of stale response. Returns False if it's already
+        being refreshed.
+        """
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key):
+        """
+        Releases claimed refresh of response.
+        """
+        with self._refreshing_lock:
+            self._refreshing.discard(key)
+
+    def get(self, key):
+        """
+        Gets fresh cached response body or None.
+        """
+        value, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def lookup(self, key):
+        """
+        Gets `(value, fresh)` pair of cached response body. Value is None
+        if there is no fresh nor stale response.
+        """
+        raise NotImplementedError(
+            "%s: `lookup` method must be implemented" %
+            self.__class__.__name__)
+
+    def set(self, key, value, ttl, stale_ttl=0):
+        """
+        Caches response body for `ttl` seconds (and `stale_ttl` seconds
+        more as stale one).
+        """
+        raise NotImplementedError(
+            "%s: `set` method must be implemented" %
+            self.__class__.__name__)
+
+    def delete(self, key):
+        """
+        Removes cached response body.
+        """
+        raise NotImplementedError(
+            "%s: `delete` method must be implemented" %
+            self.__class__.__name__)
+
+    def clear(self):
+        """
+        Removes all cached responses.
+        """
+        raise NotImplementedError(
+            "%s: `clear` method must be implemented" %
+            self.__class__.__name__)
+
+    def _get_endpoint_option(self, options, endpoint, default):
+        if endpoint is not None:
+            rtype = endpoint.split('/', 1)[0]
+            for name in (endpoint, rtype):
+                if name in options:
+                    return options[name]
+
+        return default
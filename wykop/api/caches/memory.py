@@ -0,0 +1,98 @@
+"""Wykop API in-memory cache module."""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from wykop.api.caches.base import BaseCache
+from wykop.utils import force_bytes
+
+clock = getattr(time, 'monotonic', time.time)
+
+Entry = namedtuple('Entry', ['value', 'expires', 'stale', 'size'])
+
+
+class MemoryCache(BaseCache):
+    """
+    In-memory LRU response cache bounded by number of entries
+    (`maxsize`) and total size of response bodies in bytes
+    (`maxbytes`). Shared between threads of single process.
+    """
+
+    def __init__(self, maxsize=1000, maxbytes=32 * 1024 * 1024, ttl=60,
+                 ttls=None, stale_ttl=0, stale_ttls=None, negative_ttl=0,
+                 negative_ttls=None):
+        super(MemoryCache, self).__init__(
+            ttl=ttl, ttls=ttls, stale_ttl=stale_ttl, stale_ttls=stale_ttls,
+            negative_ttl=negative_ttl, negative_ttls=negative_ttls)
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            'maxsize': self.maxsize,
+            'maxbytes': self.maxbytes,
+            'ttl': self.ttl,
+            'ttls': self.ttls,
+            'stale_ttl': self.stale_ttl,
+            'stale_ttls': self.stale_ttls,
+            'negative_ttl': self.negative_ttl,
+            'negative_ttls': self.negative_ttls,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+
+            now = clock()
+            if entry.stale <= now:
+                self._remove(key)
+                return None, False
+
+            # mark as recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            return entry.value, entry.expires > now
+
+    def set(self, key, value, ttl, stale_ttl=0):
+        size = len(force_bytes(value))
+        # wouldn't fit anyway
+        if size > self.maxbytes:
+            return
+
+        expires = clock() + ttl
+        entry = Entry(value, expires, expires + stale_ttl, size)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self.size += size
+
+            while len(self._entries) > self.maxsize or \
+                    self.size > self.maxbytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.size -= entry.size
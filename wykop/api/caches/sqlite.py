@@ -0,0 +1,147 @@
+"""Wykop API SQLite cache module."""
+import sqlite3
+import time
+
+from wykop.api.caches.base import BaseCache
+from wykop.api.sqlite import SQLiteStore
+from wykop.utils import force_bytes
+
+
+class SQLiteCache(SQLiteStore, BaseCache):
+    """
+    Response cache backed by SQLite database file, so it's shared between
+    threads and processes and survives restarts. Bounded by number of
+    entries (`maxsize`) and total size of response bodies in bytes
+    (`maxbytes`); oldest entries are evicted first.
+    """
+
+    def __init__(self, path, maxsize=10000, maxbytes=256 * 1024 * 1024,
+                 ttl=60, ttls=None, stale_ttl=0, stale_ttls=None,
+                 negative_ttl=0, negative_ttls=None, timeout=30):
+        BaseCache.__init__(
+            self, ttl=ttl, ttls=ttls, stale_ttl=stale_ttl,
+            stale_ttls=stale_ttls, negative_ttl=negative_ttl,
+            negative_ttls=negative_ttls)
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        SQLiteStore.__init__(self, path, timeout=timeout)
+
+    def __getstate__(self):
+        return {
+            'path': self.path,
+            'maxsize': self.maxsize,
+            'maxbytes': self.maxbytes,
+            'ttl': self.ttl,
+            'ttls': self.ttls,
+            'stale_ttl': self.stale_ttl,
+            'stale_ttls': self.stale_ttls,
+            'negative_ttl': self.negative_ttl,
+            'negative_ttls': self.negative_ttls,
+            'timeout': self.timeout,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return self._get_totals(self.connection)[0]
+
+    @property
+    def size(self):
+        """
+        Gets total size of cached response bodies in bytes.
+        """
+        return self._get_totals(self.connection)[1]
+
+    def lookup(self, key):
+        now = time.time()
+        row = self.connection.execute(
+            "SELECT value, expires FROM cache WHERE key = ? AND stale > ?",
+            (key, now)).fetchone()
+        if row is None:
+            return None, False
+        value, expires = row
+        return value, expires > now
+
+    def set(self, key, value, ttl, stale_ttl=0):
+        # stored as blob; parsers take bytes
+        value = force_bytes(value)
+        size = len(value)
+        # wouldn't fit anyway
+        if size > self.maxbytes:
+            return
+
+        now = time.time()
+        with self._transaction() as cursor:
+            self._remove(cursor, "key = ?", (key, ))
+            cursor.execute(
+                "INSERT INTO cache (key, value, created, expires, stale, "
+                "size) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), now, now + ttl,
+                 now + ttl + stale_ttl, size))
+            cursor.execute(
+                "UPDATE cache_totals SET entries = entries + 1, "
+                "size = size + ?", (size, ))
+            self._remove(cursor, "stale <= ?", (now, ))
+            self._evict(cursor)
+
+    def delete(self, key):
+        with self._transaction() as cursor:
+            self._remove(cursor, "key = ?", (key, ))
+
+    def clear(self):
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM cache")
+            cursor.execute("UPDATE cache_totals SET entries = 0, size = 0")
+
+    def _evict(self, cursor):
+        entries, size = self._get_totals(cursor)
+        while entries > self.maxsize or size > self.maxbytes:
+            key, entry_size = cursor.execute(
+                "SELECT key, size FROM cache ORDER BY created LIMIT 1"
+            ).fetchone()
+            self._remove(cursor, "key = ?", (key, ))
+            entries -= 1
+            size -= entry_size
+
+    def _remove(self, cursor, where, params):
+        entries, size = cursor.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE " +
+            where, params).fetchone()
+        if not entries:
+            return
+
+        cursor.execute("DELETE FROM cache WHERE " + where, params)
+        cursor.execute(
+            "UPDATE cache_totals SET entries = entries - ?, "
+            "size = size - ?", (entries, size))
+
+    def _get_totals(self, cursor):
+        return cursor.execute(
+            "SELECT entries, size FROM cache_totals").fetchone()
+
+    def _create_tables(self):
+        # readers don't block writer (and vice versa)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT NOT NULL PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "created REAL NOT NULL, "
+                "expires REAL NOT NULL, "
+                "stale REAL NOT NULL, "
+                "size INTEGER NOT NULL)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS cache_created "
+                "ON cache (created)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS cache_stale ON cache (stale)")
+            # running totals; summing sizes on every write is costly
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS cache_totals ("
+                "entries INTEGER NOT NULL, "
+                "size INTEGER NOT NULL)")
+            cursor.execute(
+                "INSERT INTO cache_totals (entries, size) "
+                "SELECT 0, 0 WHERE NOT EXISTS (SELECT 1 FROM cache_totals)")
@@ -2,15 +2,22 @@
 import base64
 import hashlib
 import logging
+import threading
 from datetime import date, timedelta
+from functools import partial
 from itertools import cycle
 
-from six.moves.urllib.parse import urlunparse, quote_plus
+from six.moves.urllib.parse import urlencode, urlunparse, quote_plus
 
+from wykop.api.batch import run_batch
+from wykop.api.caches.base import CacheEntry
 from wykop.api.decorators import login_required
 from wykop.api.exceptions import WykopAPIError, DailtyRequestLimitError
+from wykop.api.pagination import paginate
 from wykop.api.parsers import default_parser
-from wykop.api.requesters import default_requester
+from wykop.api.requesters import get_default_requester
+from wykop.api.singleflight import SingleFlight
+from wykop.api.timeouts import check_deadline
 from wykop.utils import (
     dictmap,
     paramsencode,
@@ -21,6 +28,9 @@ from wykop.utils import (
 
 log = logging.getLogger(__name__)
 
+# default `parser` of requests: client's parser is used
+CLIENT_PARSER = object()
+
 
 class BaseWykopAPI(object):
     """
@@ -28,9 +38,13 @@ class BaseWykopAPI(object):
     """
 
     _client_name = 'wykop-sdk'
+    _domain = None
+    _single_flight_class = SingleFlight
 
     def __init__(self, appkey, secretkey, login=None, accountkey=None,
-                 password=None, output='', response_format='json'):
+                 password=None, output='', response_format='json',
+                 requester=None, rate_limiter=None, retry_policy=None,
+                 cache=None, coalesce=True, parser=None):
         self.appkey = appkey
         self.secretkey = secretkey
         self.login = login
@@ -38,7 +52,16 @@ class BaseWykopAPI(object):
         self.password = password
         self.output = output
         self.format = response_format
+        self.requester = requester or self._get_default_requester()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.coalesce = coalesce
+        self.parser = parser or default_parser
         self.userkey = ''
+        self._single_flight = self._single_flight_class()
+        self._sign_seeds = {}
+        self._user_agent = None
 
     def __getstate__(self):
         return {
@@ -50,6 +73,12 @@ class BaseWykopAPI(object):
             'output': self.output,
             'format': self.format,
             'userkey': self.userkey,
+            'requester': self.requester,
+            'rate_limiter': self.rate_limiter,
+            'retry_policy': self.retry_policy,
+            'cache': self.cache,
+            'coalesce': self.coalesce,
+            'parser': self.parser,
         }
 
     def __setstate__(self, state):
@@ -61,6 +90,19 @@ class BaseWykopAPI(object):
         self.output = state['output']
         self.format = state['format']
         self.userkey = state['userkey']
+        self.requester = state.get('requester') or \
+            self._get_default_requester()
+        self.rate_limiter = state.get('rate_limiter')
+        self.retry_policy = state.get('retry_policy')
+        self.cache = state.get('cache')
+        self.coalesce = state.get('coalesce', True)
+        self.parser = state.get('parser') or default_parser
+        self._single_flight = self._single_flight_class()
+        self._sign_seeds = {}
+        self._user_agent = None
+
+    def _get_default_requester(self):
+        return get_default_requester()
 
     def get_default_api_params(self):
         """
@@ -77,33 +119,55 @@ class BaseWykopAPI(object):
         """
         Gets request api sign.
         """
+        return self._get_api_sign(url, post_params)
+
+    def _get_api_sign(self, url, post_params, secretkey=None):
+        sign = self._get_sign_hash(
+            self.secretkey if secretkey is None else secretkey)
+        if not post_params:
+            sign.update(force_bytes(url))
+            return sign.hexdigest()
+
         post_params_values = self.get_post_params_values(**post_params)
-        post_params_values_str = ",".join(post_params_values)
-        post_params_values_bytes = force_bytes(post_params_values_str)
-        url_bytes = force_bytes(url)
-        secretkey_bytes = force_bytes(self.secretkey)
-        return hashlib.md5(
-            secretkey_bytes + url_bytes + post_params_values_bytes).hexdigest()
+        sign.update(
+            force_bytes(url) + force_bytes(",".join(post_params_values)))
+        return sign.hexdigest()
+
+    def _get_sign_hash(self, secretkey):
+        # hash seeded with secret key is copied for every sign; seeded
+        # once per secret key (there are few of them with rotating keys)
+        seed = self._sign_seeds.get(secretkey)
+        if seed is None:
+            seed = self._sign_seeds.setdefault(
+                secretkey, hashlib.md5(force_bytes(secretkey)))
+        return seed.copy()
 
     def get_post_params_values(self, **post_params):
         """
         Gets post parameters values list. Required to api sign.
         """
-        return [force_text(post_params[key])
-                for key in sorted(post_params.keys())]
+        return [force_text(post_params[key]) for key in sorted(post_params)]
 
     def get_user_agent(self):
         """
         Gets User-Agent header.
         """
-        client_version = get_version()
-        return '/'.join([self._client_name, client_version])
+        # built once per client; version is looked up once per process
+        if self._user_agent is None:
+            self._user_agent = '/'.join([self._client_name, get_version()])
+        return self._user_agent
 
     def get_headers(self, url, **post_params):
         """
         Gets request headers.
         """
-        apisign = self.get_api_sign(url, **post_params)
+        return self._get_headers(url, post_params)
+
+    def _get_headers(self, url, post_params, secretkey=None):
+        if secretkey is None:
+            apisign = self.get_api_sign(url, **post_params)
+        else:
+            apisign = self._get_api_sign(url, post_params, secretkey)
         user_agent = self.get_user_agent()
 
         return {
@@ -111,6 +175,228 @@ class BaseWykopAPI(object):
             'User-Agent': user_agent,
         }
 
+    def send(self, url, post_params, headers, file_params, parser,
+             requester, timeout=None, endpoint=None, appkey=None):
+        """
+        Sends prepared request and parses response. Transient failures
+        are retried according to retry policy, within current deadline.
+        Cacheable responses of `endpoint` are served from cache; stale
+        ones are refreshed in background. Concurrent identical reads
+        share one request. Request is rate limited by `appkey` it's
+        signed with (client's one by default).
+        """
+        cache_entry = self.get_cache_entry(
+            url, endpoint, post_params, file_params, parser)
+        mutating = bool(post_params or file_params)
+        send = partial(
+            self._send, url, post_params, headers, file_params, parser,
+            requester, timeout, cache_entry, appkey)
+
+        if cache_entry is not None:
+            cached, fresh = self.cache.lookup(cache_entry.key)
+            if cached is not None:
+                log.debug("Using cached response of `%s`", url)
+                if not fresh:
+                    self._refresh(cache_entry.key, send, mutating)
+                return parser.parse(cached)
+
+        if not self.is_coalesced(mutating, cache_entry):
+            return self._call(send, mutating)
+
+        return self._single_flight.call(
+            (self.get_cache_key(url, post_params), parser),
+            partial(self._call, send, mutating))
+
+    def send_stream(self, url, post_params, headers, file_params, parser,
+                    requester, timeout=None, appkey=None):
+        """
+        Sends prepared request and returns iterator over response items
+        parsed as they're downloaded (or over body chunks if there's no
+        parser). Streamed responses are not cached, coalesced nor
+        retried.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(appkey or self.appkey, self._domain)
+
+        check_deadline()
+        self._record_request(appkey)
+        options = {} if timeout is None else {'timeout': timeout}
+        chunks = requester.stream_request(
+            url, post_params, headers, file_params, **options)
+
+        if parser is None:
+            return chunks
+
+        return parser.parse_stream(chunks)
+
+    def is_coalesced(self, mutating, cache_entry):
+        """
+        Checks whether concurrent identical requests share one call.
+        Mutating requests are coalesced only if they're cacheable.
+        """
+        return self.coalesce and (not mutating or cache_entry is not None)
+
+    def _call(self, send, mutating):
+        if self.retry_policy is None:
+            return send()
+
+        return self.retry_policy.call(send, mutating=mutating)
+
+    def _refresh(self, cache_key, send, mutating):
+        # single refresh of stale response at once
+        if not self.cache.claim_refresh(cache_key):
+            return
+
+        def refresh():
+            try:
+                self._call(send, mutating)
+            except Exception:
+                log.warning(
+                    "Refreshing cached response failed", exc_info=True)
+            finally:
+                self.cache.release_refresh(cache_key)
+
+        thread = threading.Thread(target=refresh)
+        thread.daemon = True
+        thread.start()
+
+    def _send(self, url, post_params, headers, file_params, parser,
+              requester, timeout, cache_entry=None, appkey=None):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(appkey or self.appkey, self._domain)
+
+        check_deadline()
+        self._record_request(appkey)
+        options = {} if timeout is None else {'timeout': timeout}
+        response = requester.make_request(
+            url, post_params, headers, file_params, **options)
+
+        if parser is None:
+            return response
+
+        return self._parse(response, parser, cache_entry)
+
+    def _record_request(self, appkey):
+        # called for each request sent over network (cache hits and
+        # coalesced calls aren't)
+        pass
+
+    def _parse(self, response, parser, cache_entry):
+        if cache_entry is None:
+            return parser.parse(response)
+
+        try:
+            result = parser.parse(response)
+        except WykopAPIError as ex:
+            # API errors are raised by parser; only not found ones cached
+            if cache_entry.negative_ttl and self.cache.is_negative(ex):
+                self.cache.set(
+                    cache_entry.key, response, cache_entry.negative_ttl)
+            raise
+
+        if cache_entry.ttl:
+            self.cache.set(
+                cache_entry.key, response, cache_entry.ttl,
+                cache_entry.stale_ttl)
+        return result
+
+    def get_cache_entry(self, url, endpoint, post_params, file_params,
+                        parser):
+        """
+        Gets response cache entry (key and TTLs) of request or None if
+        it's not cacheable. Authenticated requests, requests with files
+        and unparsed ones are not cached; requests with post parameters
+        only if their endpoint has own TTL (or negative TTL).
+        """
+        if self.cache is None or self.userkey or file_params or \
+                parser is None:
+            return None
+
+        default = not post_params
+        ttl = self.cache.get_ttl(endpoint, default=default)
+        negative_ttl = self.cache.get_negative_ttl(endpoint, default=default)
+        if not ttl and not negative_ttl:
+            return None
+
+        return CacheEntry(
+            self.get_cache_key(url, post_params), ttl,
+            self.cache.get_stale_ttl(endpoint), negative_ttl)
+
+    def get_cache_key(self, url, post_params):
+        """
+        Gets response cache key of request.
+        """
+        if not post_params:
+            return url
+        return '?'.join([url, urlencode(sorted(post_params.items()))])
+
+    def paginate(self, method, *args, **kwargs):
+        """
+        Iterates lazily over items of paged endpoint method.
+
+        Accepts `page` (first page), `max_items`, `prefetch` and
+        `deadline` (seconds for all pages) options; remaining arguments
+        are passed to endpoint method.
+        """
+        page = kwargs.pop('page', 1)
+        max_items = kwargs.pop('max_items', None)
+        prefetch = kwargs.pop('prefetch', False)
+        deadline = kwargs.pop('deadline', None)
+
+        def fetch_page(page):
+            return method(*args, page=page, **kwargs)
+
+        return paginate(
+            fetch_page, self.get_page_items, self.has_next_page,
+            page=page, max_items=max_items, prefetch=prefetch,
+            deadline=deadline,
+        )
+
+    def batch(self, calls, max_workers=10):
+        """
+        Runs calls (callables without arguments) concurrently.
+
+        Returns list of `BatchResult` in order of calls. Wykop API errors
+        are captured in results instead of aborting the whole batch.
+        """
+        return run_batch(calls, max_workers=max_workers)
+
+    def batch_requests(self, specs, max_workers=10):
+        """
+        Makes requests concurrently. Each spec is a dict of `request`
+        keyword arguments or a sequence of its positional arguments.
+        """
+        calls = [
+            partial(self.request, **spec) if isinstance(spec, dict) else
+            partial(self.request, *spec)
+            for spec in specs
+        ]
+        return self.batch(calls, max_workers=max_workers)
+
+    def fetch_pages(self, method, *args, **kwargs):
+        """
+        Fetches `pages` of paged endpoint method concurrently. Remaining
+        arguments are passed to endpoint method.
+        """
+        pages = kwargs.pop('pages')
+        max_workers = kwargs.pop('max_workers', 10)
+        calls = [partial(method, *args, page=page, **kwargs) for page in pages]
+        return self.batch(calls, max_workers=max_workers)
+
+    def get_page_items(self, response):
+        """
+        Gets list of items from paged response.
+        """
+        raise NotImplementedError(
+            "%s: `get_page_items` method must be implemented" %
+            self.__class__.__name__)
+
+    def has_next_page(self, response):
+        """
+        Checks whether paged response is followed by next page.
+        """
+        return True
+
     def get_connect_api_params(self, redirect_url=None):
         """
         Gets request api parameters for wykop connect.
@@ -135,8 +421,7 @@ class BaseWykopAPI(object):
         """
         Gets decoded data from wykop connect.
         """
-        data_bytes = force_bytes(data)
-        decoded = base64.decodestring(data_bytes)
-        decoded_str = force_text(decoded)
-        parsed = parser.parse(decoded_str)
+        # parsers take bytes
+        decoded = base64.b64decode(force_bytes(data))
+        parsed = parser.parse(decoded)
         return parsed['appkey'], parsed['login'], parsed['token']
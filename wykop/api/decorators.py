@@ -1,8 +1,11 @@
 """Wykop API decorators module."""
+from functools import wraps
+
 from wykop.api.exceptions import InvalidUserKeyError
 
 
 def login_required(method):
+    @wraps(method)
     def decorator(self, *args, **kwargs):
         if not self.userkey:
             self.authenticate()
@@ -1,4 +1,6 @@
 """Wykop API base exceptions module."""
+import time
+
 __all__ = [
     'InvalidAPIKeyError', 'InvalidParamsError', 'NotEnoughParamsError',
     'AppWritePermissionsError', 'DailtyRequestLimitError',
@@ -10,6 +12,8 @@ __all__ = [
     'PrivateLinkError', 'EntryDoesNotExistError', 'EntryLimitExceededError',
     'QueryTooShortError', 'CommentDoesNotExistError', 'NiceTryError',
     'UnreachableAPIError', 'NoIndexError', 'WykopAPIError',
+    'KeysExhaustedError', 'TransportError', 'APIConnectionError',
+    'APITimeoutError', 'HTTPStatusError', 'DeadlineExceededError',
 ]
 
 
@@ -136,6 +140,42 @@ class UnreachableAPIError(WykopAPIError):
 class NoIndexError(WykopAPIError):
     pass
 
+
+class KeysExhaustedError(DailtyRequestLimitError):
+    """All key pairs exhausted until `until` timestamp."""
+
+    def __init__(self, until):
+        super(KeysExhaustedError, self).__init__(
+            0, 'All keys exhausted until %s' % time.ctime(until))
+        self.until = until
+
+
+class TransportError(WykopAPIError):
+    """Request failed before API response was received."""
+    pass
+
+
+class APIConnectionError(TransportError):
+    pass
+
+
+class APITimeoutError(TransportError):
+    pass
+
+
+class DeadlineExceededError(APITimeoutError):
+    """Deadline passed before request was sent."""
+    pass
+
+
+class HTTPStatusError(TransportError):
+    """API responded with HTTP error `status`."""
+
+    def __init__(self, status, message=None):
+        super(HTTPStatusError, self).__init__(0, message or str(status))
+        self.status = status
+
+
 __all_exceptions__ = {
     1:      InvalidAPIKeyError,
     2:      InvalidParamsError,
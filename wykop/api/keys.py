@@ -0,0 +1,185 @@
+"""Wykop API keys scheduling module."""
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from wykop.api.exceptions import KeysExhaustedError
+from wykop.api.quotas import get_reset_time, today
+
+log = logging.getLogger(__name__)
+
+
+class BaseKeyStrategy(object):
+    """Base key scheduling strategy."""
+
+    def choose(self, available, usage, current):
+        """
+        Chooses appkey out of `available` ones (in key pairs order) given
+        today's `usage` counts and `current` (last used) appkey.
+        """
+        raise NotImplementedError(
+            "%s: `choose` method must be implemented" %
+            self.__class__.__name__)
+
+
+class RoundRobinStrategy(BaseKeyStrategy):
+    """Uses available keys in turn, one request each."""
+
+    def choose(self, available, usage, current):
+        if current not in usage:
+            return available[0]
+
+        keys = list(usage)
+        position = keys.index(current)
+        for appkey in keys[position + 1:] + keys[:position + 1]:
+            if appkey in available:
+                return appkey
+
+
+class LeastUsedStrategy(BaseKeyStrategy):
+    """Uses key with fewest requests made today."""
+
+    def choose(self, available, usage, current):
+        return min(available, key=lambda appkey: usage[appkey])
+
+
+class WeightedStrategy(BaseKeyStrategy):
+    """
+    Uses key with most remaining budget of known daily `quotas` (mapping
+    of appkey to its daily limit). Keys with unknown quota get
+    `default_quota` (highest known quota by default).
+    """
+
+    def __init__(self, quotas, default_quota=None):
+        self.quotas = quotas
+        self.default_quota = default_quota
+
+    def choose(self, available, usage, current):
+        default_quota = self.default_quota
+        if default_quota is None:
+            default_quota = max(self.quotas.values()) if self.quotas else 0
+
+        def remaining(appkey):
+            return self.quotas.get(appkey, default_quota) - usage[appkey]
+
+        return max(available, key=remaining)
+
+
+class StickyStrategy(LeastUsedStrategy):
+    """Uses current key until it's exhausted, then least used one."""
+
+    def choose(self, available, usage, current):
+        if current in available:
+            return current
+        return super(StickyStrategy, self).choose(available, usage, current)
+
+
+class KeyScheduler(object):
+    """
+    Schedules key pairs of rotating keys clients.
+
+    Exhausted key is put on cooldown for `cooldown` seconds, or until
+    daily limits reset if not set. With quota `ledger` usage and
+    cooldowns of exhausted keys are shared between processes.
+    """
+
+    def __init__(self, key_pairs, strategy=None, cooldown=None, ledger=None):
+        self.key_pairs = OrderedDict(key_pairs)
+        self.strategy = strategy or StickyStrategy()
+        self.cooldown = cooldown
+        self.ledger = ledger
+        self.current = None
+        self._usage = defaultdict(int)
+        self._usage_day = today()
+        self._exhausted = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            'key_pairs': list(self.key_pairs.items()),
+            'strategy': self.strategy,
+            'cooldown': self.cooldown,
+            'ledger': self.ledger,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def acquire(self):
+        """
+        Chooses key pair for next request. Its use is recorded once
+        request is sent (see `record`).
+        """
+        usage, exhausted = self._get_usage()
+
+        with self._lock:
+            now = time.time()
+            for appkey, until in self._exhausted.items():
+                exhausted[appkey] = max(exhausted[appkey], until)
+            available = [
+                appkey for appkey in self.key_pairs
+                if exhausted[appkey] <= now
+            ]
+
+            if not available:
+                raise KeysExhaustedError(min(exhausted.values()))
+
+            appkey = self.strategy.choose(available, usage, self.current)
+            self.current = appkey
+
+        return appkey, self.key_pairs[appkey]
+
+    def record(self, appkey):
+        """
+        Records request sent with appkey.
+        """
+        if self.ledger is not None:
+            self.ledger.record(appkey)
+            return
+
+        with self._lock:
+            self._reset_usage()
+            self._usage[appkey] += 1
+
+    def mark_exhausted(self, appkey):
+        """
+        Puts appkey on cooldown.
+        """
+        if self.cooldown is None:
+            until = get_reset_time()
+        else:
+            until = time.time() + self.cooldown
+
+        log.debug("Key %s exhausted until %s", appkey, time.ctime(until))
+        with self._lock:
+            self._exhausted[appkey] = until
+
+        if self.ledger is not None:
+            self.ledger.mark_exhausted(appkey, until)
+
+    def _get_usage(self):
+        # gets usage counts and timestamps keys are exhausted until
+        if self.ledger is not None:
+            ledger_usage = self.ledger.get_usage(list(self.key_pairs))
+            daily_limit = self.ledger.daily_limit
+            usage = OrderedDict()
+            exhausted = {}
+            for appkey in self.key_pairs:
+                used, until = ledger_usage[appkey]
+                if daily_limit is not None and used >= daily_limit:
+                    until = max(until, get_reset_time())
+                usage[appkey] = used
+                exhausted[appkey] = until
+            return usage, exhausted
+
+        with self._lock:
+            self._reset_usage()
+            usage = OrderedDict(
+                (appkey, self._usage[appkey]) for appkey in self.key_pairs)
+        return usage, dict.fromkeys(self.key_pairs, 0)
+
+    def _reset_usage(self):
+        if self._usage_day != today():
+            self._usage.clear()
+            self._usage_day = today()
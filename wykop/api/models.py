@@ -1,4 +1,354 @@
 """Wykop API models module.."""
+try:
+    from collections.abc import Sequence
+except ImportError:  # Python 2
+    from collections import Sequence
+
+from six import add_metaclass
+
+
+def wrap(value):
+    """
+    Wraps plain dict or list value into response type.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return WykopAPIResponse(value)
+    if value_type is list:
+        return WykopAPIResponseList(value)
+    return value
+
+
 class WykopAPIResponse(dict):
-    __getattr__ = dict.__getitem__
+    """
+    Response dict with attribute access to items. Nested plain dicts and
+    lists (decoded without `object_hook`) are wrapped on access.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        value_type = type(value)
+        if value_type is dict or value_type is list:
+            value = wrap(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    __getattr__ = __getitem__
     __setattr__ = dict.__setitem__
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def pop(self, key, *default):
+        return wrap(dict.pop(self, key, *default))
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, wrap(value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return self[key]
+
+    def copy(self):
+        return WykopAPIResponse(self)
+
+
+class WykopAPIResponseList(list):
+    """
+    Response list; nested plain dicts and lists are wrapped on access.
+    """
+
+    def __getitem__(self, index):
+        value = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return WykopAPIResponseList(value)
+        value_type = type(value)
+        if value_type is dict or value_type is list:
+            value = wrap(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __iter__(self):
+        for index, value in enumerate(list.__iter__(self)):
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                value = wrap(value)
+                list.__setitem__(self, index, value)
+            yield value
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def pop(self, index=-1):
+        return wrap(list.pop(self, index))
+
+    def copy(self):
+        return WykopAPIResponseList(self)
+
+
+class LazyWykopAPIResponseList(Sequence):
+    """
+    Response items kept as their JSON text, each decoded with `decode`
+    on first access (and its text dropped then). It's not a list: it
+    compares equal to list of decoded items and `list()` converts it
+    (ie. to serialize it).
+    """
+
+    def __init__(self, raw_items, decode):
+        self._raw = list(raw_items)
+        self._items = [None] * len(self._raw)
+        self._decode = decode
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return WykopAPIResponseList(
+                self[i] for i in range(*index.indices(len(self))))
+        raw = self._raw[index]
+        if raw is not None:
+            self._items[index] = self._decode(raw)
+            self._raw[index] = None
+        return self._items[index]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, LazyWykopAPIResponseList):
+            other = list(other)
+        return list(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+    def __getstate__(self):
+        # decoder isn't pickled, so all items are decoded
+        return list(self)
+
+    def __setstate__(self, items):
+        self._items = items
+        self._raw = [None] * len(items)
+        self._decode = None
+
+
+def compile_from_dict(cls):
+    """
+    Compiles `from_dict` function of model class specialized for its
+    fields (like `collections.namedtuple` does), which is much faster
+    than setting fields in loop.
+    """
+    namespace = {'new': object.__new__, 'cls': cls}
+    lines = [
+        'def from_dict(data):',
+        '    obj = new(cls)',
+        '    get = data.get',
+    ]
+    for name in cls.__slots__:
+        convert = cls.nested.get(name)
+        if convert is None:
+            lines.append('    obj.%s = get(%r)' % (name, name))
+            continue
+        namespace['convert_' + name] = convert
+        lines.append('    value = get(%r)' % name)
+        lines.append(
+            '    obj.%s = None if value is None else convert_%s(value)' %
+            (name, name))
+    lines.append('    return obj')
+    exec('\n'.join(lines), namespace)
+    return namespace['from_dict']
+
+
+class ModelMeta(type):
+    """Typed model metaclass."""
+
+    def __init__(cls, name, bases, namespace):
+        super(ModelMeta, cls).__init__(name, bases, namespace)
+        cls.from_dict = staticmethod(compile_from_dict(cls))
+
+
+@add_metaclass(ModelMeta)
+class Model(object):
+    """
+    Base typed model with `__slots__` for API objects. Built from v1 or
+    v2 payload dict with `from_dict`; fields missing from payload are
+    None and fields not in `__slots__` are dropped (subclass to keep
+    them). Values of `nested` fields are converted with their
+    converter (ie. model's `convert`).
+    """
+
+    __slots__ = ()
+    nested = {}
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def convert(cls, value):
+        """
+        Converts payload dict or list of dicts into model(s).
+        """
+        if isinstance(value, list):
+            return [cls.convert(item) for item in value]
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return value
+
+    def to_dict(self):
+        return dict(
+            (name, getattr(self, name)) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and \
+            self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, ' '.join(
+            '%s=%r' % (name, getattr(self, name))
+            for name in self.__slots__[:2]))
+
+
+class Author(Model):
+    """Author of other object (v2)."""
+
+    __slots__ = ('login', 'color', 'sex', 'avatar', 'signup_at')
+
+
+class Profile(Model):
+    """User profile."""
+
+    __slots__ = (
+        'login', 'color', 'sex', 'avatar', 'background', 'signup_at',
+        'signup_date', 'name', 'email', 'public_email', 'www', 'jabber',
+        'gg', 'city', 'about', 'author_group', 'rank', 'followers',
+        'following', 'entries', 'entries_comments', 'diggs', 'buries',
+        'links_added', 'links_added_count', 'links_published',
+        'links_published_count', 'comments', 'comments_count',
+        'is_verified', 'is_observed', 'is_blocked', 'violation_url',
+    )
+
+
+class Tag(Model):
+    """Tag."""
+
+    __slots__ = (
+        'tag', 'description', 'background', 'followers', 'is_observed',
+        'is_blocked',
+    )
+
+
+class Link(Model):
+    """Link (znalezisko)."""
+
+    __slots__ = (
+        'id', 'title', 'description', 'tags', 'url', 'source_url',
+        'preview', 'date', 'author', 'author_avatar', 'author_group',
+        'author_sex', 'vote_count', 'bury_count', 'comments_count',
+        'comment_count', 'related_count', 'report_count', 'status',
+        'type', 'category', 'group', 'plus18', 'is_hot', 'can_vote',
+        'has_own_content', 'user_vote', 'user_favorite', 'user_observe',
+        'user_lists', 'info', 'app', 'violation_url',
+    )
+    nested = {'author': Author.convert, 'info': wrap}
+
+
+class Comment(Model):
+    """Link or entry comment."""
+
+    __slots__ = (
+        'id', 'date', 'body', 'author', 'author_avatar', 'author_group',
+        'author_sex', 'vote_count', 'vote_count_plus', 'vote_count_minus',
+        'parent_id', 'entry_id', 'link', 'status', 'type', 'embed',
+        'blocked', 'deleted', 'favorite', 'can_vote', 'user_vote', 'app',
+        'original', 'violation_url',
+    )
+    nested = {
+        'author': Author.convert,
+        'link': Link.convert,
+        'embed': wrap,
+    }
+
+
+class Entry(Model):
+    """Microblog entry (wpis)."""
+
+    __slots__ = (
+        'id', 'date', 'body', 'author', 'author_avatar', 'author_group',
+        'author_sex', 'receiver', 'url', 'vote_count', 'comments_count',
+        'comments', 'status', 'embed', 'survey', 'blocked', 'favorite',
+        'can_comment', 'user_vote', 'app', 'original', 'violation_url',
+    )
+    nested = {
+        'author': Author.convert,
+        'receiver': Author.convert,
+        'comments': Comment.convert,
+        'embed': wrap,
+        'survey': wrap,
+    }
+
+
+class Notification(Model):
+    """Notification."""
+
+    __slots__ = (
+        'id', 'date', 'body', 'type', 'author', 'author_avatar',
+        'author_group', 'author_sex', 'item_id', 'subitem_id', 'url',
+        'new', 'link', 'entry', 'comment',
+    )
+    nested = {
+        'author': Author.convert,
+        'link': Link.convert,
+        'entry': Entry.convert,
+        'comment': Comment.convert,
+    }
+
+
+class TypedWrapper(object):
+    """
+    Response wrapper building `model` objects from payload: v2 `data`,
+    v1 paged `items`, v1 list or v1 object. Error responses are wrapped
+    as usual.
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def __call__(self, response):
+        if type(response) is list:
+            return self.model.convert(response)
+        if type(response) is not dict:
+            return response
+        # errors are left for parser to raise
+        if 'error' in response:
+            return WykopAPIResponse(response)
+        for key in ('data', 'items'):
+            if key in response:
+                response = WykopAPIResponse(response)
+                dict.__setitem__(response, key, self.model.convert(
+                    dict.__getitem__(response, key)))
+                return response
+        return self.model.from_dict(response)
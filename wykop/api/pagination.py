@@ -0,0 +1,54 @@
+"""Wykop API pagination module."""
+from wykop.api.timeouts import clock, get_deadline, with_deadline
+
+
+def paginate(fetch_page, get_items, has_next_page, page=1, max_items=None,
+             prefetch=False, deadline=None):
+    """
+    Yields items of consecutive pages fetched with `fetch_page(page)`.
+
+    Stops on empty or last page, or after `max_items` items. With
+    `prefetch` next page is fetched in background thread while items of
+    current one are consumed. Pages are fetched within `deadline`
+    seconds from first item request (and deadline current then).
+    """
+    until = get_deadline()
+    if deadline is not None:
+        until = min(until or float('inf'), clock() + deadline)
+    if until is not None:
+        fetch_page = with_deadline(fetch_page, until)
+
+    pool = None
+    if prefetch:
+        # multiprocessing is slow to import
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(1)
+    pending = None
+    count = 0
+    try:
+        response = fetch_page(page)
+        while True:
+            items = get_items(response)
+            if max_items is not None:
+                items = items[:max_items - count]
+            count += len(items)
+
+            has_next = bool(items) and has_next_page(response) and \
+                (max_items is None or count < max_items)
+            if has_next and pool is not None:
+                pending = pool.apply_async(fetch_page, (page + 1, ))
+
+            for item in items:
+                yield item
+
+            if not has_next:
+                return
+
+            page += 1
+            if pending is not None:
+                response, pending = pending.get(), None
+            else:
+                response = fetch_page(page)
+    finally:
+        if pool is not None:
+            pool.close()
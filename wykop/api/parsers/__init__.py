@@ -1,9 +1,28 @@
 """Wykop API parsers module."""
 from wykop.api.exceptions import default_exception_resolver
 from wykop.api.parsers.json import JSONParser
-from wykop.api.models import WykopAPIResponse
+from wykop.api.models import TypedWrapper, wrap
 
 default_parser = JSONParser(
     default_exception_resolver,
-    object_hook=WykopAPIResponse,
+    wrapper=wrap,
 )
+
+# decodes response items on first access
+lazy_parser = JSONParser(
+    default_exception_resolver,
+    wrapper=wrap,
+    lazy=True,
+)
+
+
+def get_model_parser(model, lazy=False):
+    """
+    Gets parser building typed `model` objects (ie. `Entry`) from
+    responses. With `lazy` set, items are built on first access.
+    """
+    return JSONParser(
+        default_exception_resolver,
+        wrapper=TypedWrapper(model),
+        lazy=lazy,
+    )
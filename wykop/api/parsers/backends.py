@@ -0,0 +1,21 @@
+"""Wykop API JSON backends module."""
+from importlib import import_module
+
+# fastest first
+JSON_BACKENDS = ('orjson', 'ujson', 'simplejson', 'json')
+
+
+def get_json_loads(backend=None):
+    """
+    Gets `loads` function of JSON `backend` module, or of the fastest
+    installed one.
+    """
+    backends = JSON_BACKENDS if backend is None else (backend, )
+    for name in backends:
+        try:
+            module = import_module(name)
+        except ImportError:
+            continue
+        return module.loads
+
+    raise ImportError("JSON backend %s not installed" % backend)
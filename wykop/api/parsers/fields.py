@@ -0,0 +1,51 @@
+"""Wykop API parser fields projection module."""
+
+
+def compile_fields(fields):
+    """
+    Compiles fields (dotted paths, ie. `author.login`) into projection
+    tree. Field selected as a whole takes precedence over its subfields.
+    """
+    tree = {}
+    for field in fields:
+        names = field.split('.')
+        node = tree
+        for name in names[:-1]:
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[names[-1]] = None
+    return tree
+
+
+def project(value, tree):
+    """
+    Keeps only fields of projection `tree` in object (or list of
+    objects). Missing fields are skipped.
+    """
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return dict(
+        (name, value[name] if subtree is None else
+         project(value[name], subtree))
+        for name, subtree in tree.items() if name in value
+    )
+
+
+def project_response(response, tree):
+    """
+    Projects items of decoded response: v2 `data`, v1 paged `items`,
+    v1 list or v1 object. Error responses are left intact.
+    """
+    if type(response) is list:
+        return project(response, tree)
+    if type(response) is not dict or 'error' in response:
+        return response
+    for key in ('data', 'items'):
+        if key in response:
+            response[key] = project(response[key], tree)
+            return response
+    return project(response, tree)
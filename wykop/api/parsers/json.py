@@ -4,18 +4,139 @@ try:
     import simplejson as json
 except ImportError:
     import json
+from copy import copy
 
+from wykop.api.exceptions import WykopAPIError
+from wykop.api.models import LazyWykopAPIResponseList, WykopAPIResponse
+from wykop.api.parsers.backends import get_json_loads
 from wykop.api.parsers.base import BaseParser, Error
+from wykop.api.parsers.fields import (
+    compile_fields, project, project_response,
+)
+from wykop.api.parsers.stream import JSONStreamDecoder
+
+# first characters of responses decoded lazily
+LAZY_STARTS = (u'{', u'[', b'{', b'[')
 
 
 class JSONParser(BaseParser):
+    """
+    JSON parser. Decodes with `backend` (JSON module name or `loads`
+    callable), the fastest installed one by default, and passes decoded
+    response through `wrapper`. Keyword arguments are passed to stdlib
+    `json.loads`, which is used then.
+
+    With `lazy` set, items of `data` (v2) or `items` (v1) array or of
+    v1 list are kept as JSON text and each is decoded (and wrapped) on
+    first access; rest of response is decoded as usual. With `fields`
+    (dotted paths, ie. `author.login`) set, only these fields of
+    response items are kept.
+    """
 
-    def __init__(self, exception_resolver, **json_kwargs):
+    def __init__(self, exception_resolver, backend=None, wrapper=None,
+                 lazy=False, fields=None, **json_kwargs):
         super(JSONParser, self).__init__(exception_resolver)
         self.json_kwargs = json_kwargs
+        self.wrapper = wrapper
+        self.lazy = lazy
+        self.fields = fields
+        self._projection = fields and compile_fields(fields)
+        self._projected = {}
+        self.loads = None
+        if callable(backend):
+            self.loads = backend
+        elif not json_kwargs:
+            self.loads = get_json_loads(backend)
+
+    def project(self, fields):
+        """
+        Gets parser keeping only `fields` of response items. Parsers are
+        reused for same fields (so identical requests still share one
+        call).
+        """
+        fields = tuple(fields)
+        parser = self._projected.get(fields)
+        if parser is None:
+            parser = copy(self)
+            parser.fields = fields
+            parser._projection = compile_fields(fields)
+            parser._projected = {}
+            parser = self._projected.setdefault(fields, parser)
+        return parser
+
+    def parse_stream(self, chunks):
+        """
+        Parses response read in `chunks` (bytes or text) incrementally.
+        Yields items of its `data` (v2) or `items` (v1) array or of v1
+        list as soon as they're read; response without array yields its
+        single object. API errors are raised once reached.
+        """
+        stream = JSONStreamDecoder(
+            chunks, json.JSONDecoder(**self.json_kwargs))
+        for item in stream:
+            yield self._get_item(item)
+
+        members = stream.members
+        error = self._get_error(members)
+        if error:
+            raise self._resolve_exception(
+                error.code, error.message, WykopAPIError)
+
+        if stream.array or not members:
+            return
+
+        item = members.get('data', members)
+        if item is not None:
+            yield self._get_item(item)
+
+    def _get_item(self, item):
+        if self._projection:
+            item = project(item, self._projection)
+        if self.wrapper is not None:
+            item = self.wrapper(item)
+        return item
 
     def _get_response(self, data):
-        return json.loads(data, **self.json_kwargs)
+        # scalar responses (ie. v1 `true`) have no items
+        if self.lazy and data[:64].lstrip()[:1] in LAZY_STARTS:
+            return self._get_lazy_response(data)
+
+        response = self._loads(data)
+        if self._projection:
+            response = project_response(response, self._projection)
+        if self.wrapper is not None:
+            response = self.wrapper(response)
+        return response
+
+    def _get_lazy_response(self, data):
+        stream = JSONStreamDecoder(
+            (data, ), json.JSONDecoder(**self.json_kwargs), raw=True)
+        items = LazyWykopAPIResponseList(stream, self._decode_item)
+        if stream.array and stream.key is None:
+            return items
+
+        response = stream.members
+        if not stream.array:
+            # single object
+            if self._projection:
+                response = project_response(response, self._projection)
+            if self.wrapper is not None:
+                response = self.wrapper(response)
+            return response
+
+        # items are wrapped on access, so only envelope is wrapped here
+        if self.wrapper is not None:
+            response = WykopAPIResponse(response)
+        response[stream.key] = items
+        return response
+
+    def _decode_item(self, raw):
+        return self._get_item(self._loads(raw))
+
+    def _loads(self, data):
+        if self.loads is None:
+            return json.loads(data, **self.json_kwargs)
+        return self.loads(data)
 
     def _get_error(self, response):
         if not isinstance(response, dict):
@@ -0,0 +1,152 @@
+"""Wykop API parser streaming module."""
+import codecs
+import re
+
+import six
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# rest of number split at chunk boundary, ie. after `.`, `e` or sign
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')
+
+ITEMS_KEYS = ('data', 'items')
+
+
+class JSONStreamDecoder(object):
+    """
+    Incremental decoder of JSON response read in `chunks` (bytes or
+    text). Iterating over it yields items of top-level array (v1) or of
+    `data` (v2) or `items` (v1 paged) array of top-level object as soon
+    as they're read; other members of object are kept in `members`.
+    With `raw` set, items are yielded as their JSON text instead.
+
+    Only part of response not decoded yet is buffered.
+    """
+
+    def __init__(self, chunks, decoder, raw=False):
+        self.chunks = iter(chunks)
+        self.decoder = decoder
+        self.raw = raw
+        self.members = {}
+        # whether items array was found
+        self.array = False
+        # member holding items array (None for top-level one)
+        self.key = None
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = u''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        if self._peek() == '[':
+            self.array = True
+            for item in self._iter_array():
+                yield item
+            return
+
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._decode()
+            if not isinstance(key, six.string_types):
+                raise ValueError("Expecting property name: %r" % (key, ))
+            self._expect(':')
+            if key in ITEMS_KEYS and not self.array and \
+                    self._peek() == '[':
+                self.array = True
+                self.key = key
+                for item in self._iter_array():
+                    yield item
+            else:
+                self.members[key] = self._decode()
+
+            if self._peek() != ',':
+                break
+            self._pos += 1
+        self._expect('}')
+
+    def _iter_array(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode(self.raw)
+            if self._peek() != ',':
+                break
+            self._pos += 1
+        self._expect(']')
+
+    def _decode(self, raw=False):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # incomplete value
+                if not self._read_more():
+                    raise
+                continue
+
+            # numbers and literals may continue in next chunk
+            if self._is_split(value, end) and self._read():
+                continue
+
+            if raw:
+                value = self._buffer[self._pos:end]
+            self._pos = end
+            return value
+
+    def _is_split(self, value, end):
+        if end == len(self._buffer):
+            return True
+        return isinstance(value, (six.integer_types, float)) and \
+            not isinstance(value, bool) and \
+            NUMBER_TAIL.match(self._buffer, end) is not None
+
+    def _peek(self):
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ''
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError("Expecting %r at %d" % (char, self._pos))
+        self._pos += 1
+
+    def _read_more(self):
+        # reads until buffered text doubles, so values spanning many
+        # chunks are decoded again only few times
+        size = len(self._buffer) - self._pos
+        if not self._read():
+            return False
+        while len(self._buffer) < 2 * size and self._read():
+            pass
+        return True
+
+    def _read(self):
+        if self._eof:
+            return False
+
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self._eof = True
+            text = self._text_decoder.decode(b'', True)
+        else:
+            if isinstance(chunk, six.text_type):
+                text = chunk
+            else:
+                text = self._text_decoder.decode(chunk)
+
+        # drop decoded part of buffer
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
@@ -0,0 +1,111 @@
+"""Wykop API quotas module."""
+import time
+from datetime import date, datetime, timedelta
+
+from wykop.api.sqlite import SQLiteStore
+
+
+def today():
+    return date.today()
+
+
+def get_reset_time():
+    """
+    Gets timestamp of next daily limits reset (local midnight).
+    """
+    tomorrow = today() + timedelta(days=1)
+    return time.mktime(
+        datetime.combine(tomorrow, datetime.min.time()).timetuple())
+
+
+class QuotaLedger(SQLiteStore):
+    """
+    Ledger of requests made with each appkey per day. Backed by SQLite
+    database file, so it's shared between threads and processes.
+
+    Days (and daily limit resets) follow local time.
+    """
+
+    def __init__(self, path, daily_limit=None, timeout=30):
+        self.daily_limit = daily_limit
+        super(QuotaLedger, self).__init__(path, timeout=timeout)
+
+    def __getstate__(self):
+        return {
+            'path': self.path,
+            'daily_limit': self.daily_limit,
+            'timeout': self.timeout,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def record(self, appkey, count=1):
+        """
+        Records requests made with appkey.
+        """
+        day = today().isoformat()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR IGNORE INTO quota (appkey, day) VALUES (?, ?)",
+                (appkey, day))
+            cursor.execute(
+                "UPDATE quota SET used = used + ? "
+                "WHERE appkey = ? AND day = ?",
+                (count, appkey, day))
+
+    def mark_exhausted(self, appkey, until=None):
+        """
+        Marks appkey as exhausted until `until` timestamp (daily reset
+        by default).
+        """
+        if until is None:
+            until = get_reset_time()
+        day = today().isoformat()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR IGNORE INTO quota (appkey, day) VALUES (?, ?)",
+                (appkey, day))
+            cursor.execute(
+                "UPDATE quota SET exhausted_until = ? "
+                "WHERE appkey = ? AND day = ?",
+                (until, appkey, day))
+
+    def get_usage(self, appkeys):
+        """
+        Gets today's `(used, exhausted_until)` pairs of appkeys, where
+        `exhausted_until` is timestamp appkey is exhausted until (0 if
+        it wasn't marked).
+        """
+        usage = dict((appkey, (0, 0)) for appkey in appkeys)
+        cursor = self.connection.execute(
+            "SELECT appkey, used, exhausted_until FROM quota WHERE day = ?",
+            (today().isoformat(), ))
+        for appkey, used, exhausted_until in cursor:
+            if appkey in usage:
+                usage[appkey] = (used, exhausted_until)
+        return usage
+
+    def get_reset_time(self):
+        """
+        Gets timestamp of next daily reset.
+        """
+        return get_reset_time()
+
+    def clear(self):
+        """
+        Removes entries older than today.
+        """
+        with self._transaction() as cursor:
+            cursor.execute(
+                "DELETE FROM quota WHERE day < ?", (today().isoformat(), ))
+
+    def _create_tables(self):
+        with self._transaction() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS quota ("
+                "appkey TEXT NOT NULL, "
+                "day TEXT NOT NULL, "
+                "used INTEGER NOT NULL DEFAULT 0, "
+                "exhausted_until REAL NOT NULL DEFAULT 0, "
+                "PRIMARY KEY (appkey, day))")
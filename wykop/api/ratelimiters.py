@@ -0,0 +1,125 @@
+"""Wykop API rate limiters module."""
+import logging
+import threading
+import time
+
+from wykop.api.exceptions import DeadlineExceededError
+from wykop.api.timeouts import get_remaining
+
+log = logging.getLogger(__name__)
+
+clock = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """
+    Token bucket refilled with `rate` tokens per second, holding at most
+    `capacity` tokens.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Takes tokens from bucket. Returns delay (in seconds) caller has to
+        wait before using them; tokens are reserved either way.
+        """
+        with self._lock:
+            now = clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def release(self, tokens=1):
+        """
+        Gives back reserved tokens that weren't used.
+        """
+        with self._lock:
+            self.tokens += tokens
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiter. Keeps token bucket per appkey (`rate`
+    requests per `per` seconds) and per host (`host_rate` requests per
+    `host_per` seconds).
+    """
+
+    def __init__(self, rate=None, per=1.0, burst=1,
+                 host_rate=None, host_per=1.0, host_burst=1):
+        self.rate = rate
+        self.per = per
+        self.burst = burst
+        self.host_rate = host_rate
+        self.host_per = host_per
+        self.host_burst = host_burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            'rate': self.rate,
+            'per': self.per,
+            'burst': self.burst,
+            'host_rate': self.host_rate,
+            'host_per': self.host_per,
+            'host_burst': self.host_burst,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def reserve(self, appkey, host):
+        """
+        Reserves request slot. Returns delay (in seconds) caller has to
+        wait before making request. Raises `DeadlineExceededError`
+        (without reserving slot) if delay exceeds time remaining to
+        current deadline.
+        """
+        buckets = []
+
+        if self.rate:
+            buckets.append(self._get_bucket(
+                ('appkey', appkey), self.rate / self.per, self.burst))
+
+        if self.host_rate:
+            buckets.append(self._get_bucket(
+                ('host', host), self.host_rate / self.host_per,
+                self.host_burst))
+
+        delay = max([0.0] + [bucket.reserve() for bucket in buckets])
+
+        remaining = get_remaining()
+        if delay > 0 and remaining is not None and delay > remaining:
+            for bucket in buckets:
+                bucket.release()
+            raise DeadlineExceededError(0, 'Deadline exceeded')
+
+        return delay
+
+    def acquire(self, appkey, host):
+        """
+        Blocks until request slot is available (see `reserve`).
+        """
+        delay = self.reserve(appkey, host)
+
+        if delay > 0:
+            log.debug("Rate limited; waiting %.3fs", delay)
+            time.sleep(delay)
+
+    def _get_bucket(self, key, rate, capacity):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            return bucket
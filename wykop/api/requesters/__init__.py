@@ -1,9 +1,33 @@
-# try requests module
-try:
-    import requests
+"""Wykop API requesters module."""
+from wykop.utils import lazy_attributes, once
 
-    from wykop.api.requesters.requests import RequestsRequester as Requester
-except ImportError:
-    from wykop.api.requesters.urllib import UrllibRequester as Requester
 
-default_requester = Requester()
+def get_requester_class():
+    """
+    Gets requests requester class if requests module is installed,
+    urllib one otherwise.
+    """
+    # try requests module
+    try:
+        import requests
+
+        from wykop.api.requesters.requests import (
+            RequestsRequester as Requester,
+        )
+    except ImportError:
+        from wykop.api.requesters.urllib import UrllibRequester as Requester
+    return Requester
+
+
+@once
+def get_default_requester():
+    """
+    Gets shared default requester, created on first use.
+    """
+    return get_requester_class()()
+
+
+__getattr__ = lazy_attributes(__name__, {
+    'Requester': get_requester_class,
+    'default_requester': get_default_requester,
+})
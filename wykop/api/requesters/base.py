@@ -2,7 +2,35 @@
 class BaseRequester(object):
     """Base Wykop API reqeuster"""
 
-    def make_request(self, url, data=None, headers=None, files=None):
+    timeout = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def make_request(self, url, data=None, headers=None, files=None,
+                     timeout=None):
+        """
+        Makes request and returns response body bytes (passed to parser
+        as they are).
+        """
         raise NotImplementedError(
             "%s: `make_request` method must be implemented" %
             self.__class__.__name__)
+
+    def stream_request(self, url, data=None, headers=None, files=None,
+                       timeout=None):
+        """
+        Makes request and iterates over response body chunks as they're
+        downloaded. Whole body is a single chunk by default.
+        """
+        yield self.make_request(
+            url, data=data, headers=headers, files=files, timeout=timeout)
+
+    def close(self):
+        """
+        Releases resources (ie. pooled connections) held by requester.
+        """
+        pass
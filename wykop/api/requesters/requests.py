@@ -1,13 +1,23 @@
 """Wykop API requests requester module."""
 from __future__ import absolute_import
 import logging
+import os
+import threading
+from contextlib import contextmanager
 
-from requests import request
-from requests.exceptions import RequestException
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import (
+    ConnectionError, HTTPError, RequestException, Timeout,
+)
+from six.moves.http_cookiejar import DefaultCookiePolicy
 
-from wykop.api.exceptions import WykopAPIError
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, HTTPStatusError,
+)
 from wykop.api.requesters.base import BaseRequester
-from wykop.utils import dictmap, mimetype, force_text
+from wykop.api.timeouts import cap_timeout
+from wykop.utils import dictmap, mimetype
 
 log = logging.getLogger(__name__)
 
@@ -15,25 +25,130 @@ log = logging.getLogger(__name__)
 class RequestsRequester(BaseRequester):
     """
     Requests Wtkop API requester. Uses reqeusts module.
+
+    Keeps long-lived session with pooled keep-alive connections
+    shared between threads (of one process). Default `timeout` is
+    number of seconds or `(connect, read)` pair.
     """
 
     METHOD_GET = 'GET'
     METHOD_POST = 'POST'
 
-    def make_request(self, url, data=None, headers=None, files=None):
+    chunk_size = 64 * 1024
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, keep_alive=True, timeout=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'pool_block': self.pool_block,
+            'keep_alive': self.keep_alive,
+            'timeout': self.timeout,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def session(self):
+        """
+        Gets shared session. Creates one on first use and after fork, so
+        processes don't share connections.
+        """
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._session = self._create_session()
+                    self._pid = pid
+        return self._session
+
+    def make_request(self, url, data=None, headers=None, files=None,
+                     timeout=None):
         log.debug(
             " Fetching url: `%s` (data: %s, headers: `%s`)",
             str(url), str(data), str(headers),
         )
-        try:
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        with self._handle_errors():
             files = self._get_files(files)
             method = self._get_method(data, files)
-            resp = request(method, url, data=data, headers=headers, files=files)
+            resp = self.session.request(
+                method, url, data=data, headers=headers, files=files,
+                timeout=timeout)
             resp.raise_for_status()
-            return force_text(resp.content)
+            return resp.content
+
+    def stream_request(self, url, data=None, headers=None, files=None,
+                       timeout=None):
+        log.debug(
+            " Streaming url: `%s` (data: %s, headers: `%s`)",
+            str(url), str(data), str(headers),
+        )
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        with self._handle_errors():
+            files = self._get_files(files)
+            method = self._get_method(data, files)
+            resp = self.session.request(
+                method, url, data=data, headers=headers, files=files,
+                timeout=timeout, stream=True)
+            # connection is released once body is read or on close
+            try:
+                resp.raise_for_status()
+                for chunk in resp.iter_content(self.chunk_size):
+                    yield chunk
+            finally:
+                resp.close()
+
+    @contextmanager
+    def _handle_errors(self):
+        try:
+            yield
+        except Timeout as ex:
+            raise APITimeoutError(0, str(ex))
+        except HTTPError as ex:
+            raise HTTPStatusError(ex.response.status_code, str(ex))
+        except ConnectionError as ex:
+            raise APIConnectionError(0, str(ex))
         except RequestException as ex:
             raise WykopAPIError(0, str(ex))
 
+    def close(self):
+        with self._lock:
+            session, self._session = self._session, None
+            pid, self._pid = self._pid, None
+
+        # session of parent process is left to it
+        if session is not None and pid == os.getpid():
+            session.close()
+
+    def _create_session(self):
+        session = Session()
+        # API is stateless; don't carry cookies between requests
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _get_files(self, files):
         return dictmap(lambda x: (x.name, x, mimetype(x.name)), files)
 
@@ -1,43 +1,267 @@
 """wykop API urllib requester module."""
-import contextlib
 import logging
+import os
+import socket
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 
-from six.moves.urllib.error import HTTPError, URLError
-from six.moves.urllib.parse import urlencode
-from six.moves.urllib.request import Request, urlopen
+from six.moves import http_client
+from six.moves.http_client import (
+    HTTPConnection, HTTPSConnection, HTTPException, BadStatusLine,
+)
+from six.moves.urllib.parse import urlencode, urlsplit, urlunsplit
 
-from wykop.api.exceptions import WykopAPIError
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, HTTPStatusError,
+)
 from wykop.api.requesters.base import BaseRequester
-from wykop.utils import force_bytes, force_text
+from wykop.api.timeouts import cap_timeout, split_timeout
+from wykop.utils import force_bytes
 
 log = logging.getLogger(__name__)
 
+# server closed connection before sending any response byte
+RemoteDisconnected = getattr(
+    http_client, 'RemoteDisconnected', BadStatusLine)
+
+
+class ConnectionPool(object):
+    """
+    Per-host pool of persistent HTTP connections.
+    """
+
+    connection_classes = {
+        'http': HTTPConnection,
+        'https': HTTPSConnection,
+    }
+
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def get(self, scheme, netloc):
+        """
+        Gets idle connection to host or new one. Second item says whether
+        connection was reused.
+        """
+        with self._lock:
+            idle = self._idle[(scheme, netloc)]
+            if idle:
+                return idle.pop(), True
+
+        return self.connect(scheme, netloc), False
+
+    def put(self, scheme, netloc, conn):
+        """
+        Returns connection to pool. Closes it if pool is full.
+        """
+        with self._lock:
+            idle = self._idle[(scheme, netloc)]
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+
+        conn.close()
+
+    def clear(self):
+        """
+        Closes all idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, defaultdict(list)
+
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def connect(self, scheme, netloc):
+        """
+        Creates new connection to host.
+        """
+        try:
+            connection_class = self.connection_classes[scheme]
+        except KeyError:
+            raise WykopAPIError(0, 'Unsupported url scheme %s' % scheme)
+        return connection_class(netloc)
+
 
 class UrllibRequester(BaseRequester):
     """
-    Urllib Wykop API requester. Uses urllib module.
+    Urllib Wykop API requester. Uses http.client module with per-host
+    pool of keep-alive connections (per process). Default `timeout` is
+    number of seconds or `(connect, read)` pair.
     """
 
-    def make_request(self, url, data=None, headers=None, files=None):
+    METHOD_GET = 'GET'
+    METHOD_POST = 'POST'
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, pool_maxsize=10, timeout=None):
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            'pool_maxsize': self.pool_maxsize,
+            'timeout': self.timeout,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def pool(self):
+        """
+        Gets connection pool. Creates one on first use and after fork, so
+        processes don't share connections.
+        """
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._pool = ConnectionPool(self.pool_maxsize)
+                    self._pid = pid
+        return self._pool
+
+    def make_request(self, url, data=None, headers=None, files=None,
+                     timeout=None):
         log.debug(
             " Fetching url: `%s` (data: %s, headers: `%s`)",
             str(url), str(data), str(headers),
         )
 
+        method, body, headers = self._prepare(data, headers, files)
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        with self._handle_errors():
+            status, content = self._urlopen(
+                method, url, body, headers, timeout)
+
+        if status >= 400:
+            raise HTTPStatusError(status)
+
+        return content
+
+    def stream_request(self, url, data=None, headers=None, files=None,
+                       timeout=None):
+        log.debug(
+            " Streaming url: `%s` (data: %s, headers: `%s`)",
+            str(url), str(data), str(headers),
+        )
+
+        method, body, headers = self._prepare(data, headers, files)
+        timeout = cap_timeout(self.timeout if timeout is None else timeout)
+        with self._handle_errors():
+            scheme, netloc, conn, resp = self._open(
+                method, url, body, headers, timeout)
+            # connection is reused only if whole body was read
+            done = False
+            try:
+                if resp.status >= 400:
+                    raise HTTPStatusError(resp.status)
+
+                while True:
+                    chunk = resp.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+                done = True
+            finally:
+                if done and not resp.will_close:
+                    self.pool.put(scheme, netloc, conn)
+                else:
+                    conn.close()
+
+    def close(self):
+        self.pool.clear()
+
+    def _prepare(self, data, headers, files):
         if files:
             raise NotImplementedError(
                 "Install requests package to send files.")
 
-        if headers is None:
-            headers = {}
+        headers = dict(headers or {})
+        body = force_bytes(urlencode(data)) if data else None
+        method = self.METHOD_POST if body else self.METHOD_GET
+
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+        return method, body, headers
 
-        data_bytes = force_bytes(urlencode(data)) if data else None
-        req = Request(url, data=data_bytes, headers=headers)
+    @contextmanager
+    def _handle_errors(self):
+        try:
+            yield
+        except socket.timeout as ex:
+            raise APITimeoutError(0, str(ex))
+        except (HTTPException, socket.error) as ex:
+            raise APIConnectionError(0, str(ex))
+
+    def _urlopen(self, method, url, body, headers, timeout=None):
+        scheme, netloc, conn, resp = self._open(
+            method, url, body, headers, timeout)
 
         try:
-            with contextlib.closing(urlopen(req)) as resp:
-                return force_text(resp.read())
-        except HTTPError as ex:
-            raise WykopAPIError(0, str(ex.code))
-        except URLError as ex:
-            raise WykopAPIError(0, str(ex.reason))
+            content = resp.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self.pool.put(scheme, netloc, conn)
+
+        return resp.status, content
+
+    def _open(self, method, url, body, headers, timeout=None):
+        scheme, netloc, path, query, _ = urlsplit(url)
+        path = urlunsplit(('', '', path or '/', query, ''))
+
+        conn, reused = self.pool.get(scheme, netloc)
+        while True:
+            sent = False
+            try:
+                self._send(conn, method, path, body, headers, timeout)
+                sent = True
+                resp = conn.getresponse()
+                break
+            except Exception as ex:
+                conn.close()
+                if not reused or not self._is_stale(ex, method, sent):
+                    raise
+                # server closed idle connection; retry on fresh one
+                log.debug(" Reconnecting stale connection to `%s`", netloc)
+                conn, reused = self.pool.connect(scheme, netloc), False
+
+        return scheme, netloc, conn, resp
+
+    def _is_stale(self, ex, method, sent):
+        # reused connection was closed by server if request couldn't be
+        # sent or no response byte came; timed out requests and sent
+        # POSTs (which could be processed) are never sent again
+        if isinstance(ex, socket.timeout):
+            return False
+        if not sent:
+            return isinstance(ex, socket.error)
+        return isinstance(ex, RemoteDisconnected) and \
+            method != self.METHOD_POST
+
+    def _send(self, conn, method, path, body, headers, timeout=None):
+        connect_timeout, read_timeout = split_timeout(timeout)
+        default_timeout = socket.getdefaulttimeout()
+
+        if conn.sock is None:
+            conn.timeout = default_timeout if connect_timeout is None \
+                else connect_timeout
+            conn.connect()
+
+        conn.sock.settimeout(
+            default_timeout if read_timeout is None else read_timeout)
+        conn.request(method, path, body, headers)
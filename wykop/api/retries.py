@@ -0,0 +1,117 @@
+"""Wykop API retries module."""
+import logging
+import random
+import time
+
+from wykop.api.exceptions import (
+    WykopAPIError, APIConnectionError, APITimeoutError, DeadlineExceededError,
+    HTTPStatusError, UnreachableAPIError,
+)
+from wykop.api.timeouts import clock, get_remaining
+
+log = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """
+    Retry policy for transient failures: connection errors, timeouts,
+    HTTP `statuses` (5xx and 429 by default) and unreachable API error.
+
+    Attempt `n` is retried after random delay up to
+    `min(max_backoff, backoff * 2 ** n)` seconds (exactly that without
+    `jitter`), at most `max_retries` times and as long as total time
+    spent stays within `deadline` seconds (if set) and current deadline
+    (see :func:`wykop.api.timeouts.deadline`). Requests with post
+    parameters are retried only with `retry_mutating` as they might
+    have reached the API.
+
+    `on_retry` callback gets error, retry number and delay before
+    each retry.
+    """
+
+    transient_errors = (
+        APIConnectionError, APITimeoutError, UnreachableAPIError)
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30,
+                 jitter=True, deadline=None,
+                 statuses=(429, 500, 502, 503, 504), retry_mutating=False,
+                 on_retry=None):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.statuses = statuses
+        self.retry_mutating = retry_mutating
+        self.on_retry = on_retry
+
+    def is_transient(self, error):
+        """
+        Checks whether error is worth retrying.
+        """
+        if isinstance(error, DeadlineExceededError):
+            return False
+        if isinstance(error, HTTPStatusError):
+            return error.status in self.statuses
+        return isinstance(error, self.transient_errors)
+
+    def get_backoff(self, retries):
+        """
+        Gets delay before retry number `retries` (counting from 0).
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** retries)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def get_delay(self, error, retries, started, mutating=False):
+        """
+        Gets delay before next retry of failed request started at
+        `started` (clock time) and retried `retries` times so far.
+        Returns None if request shouldn't be retried.
+        """
+        if retries >= self.max_retries or not self.is_transient(error):
+            return None
+
+        if mutating and not self.retry_mutating:
+            return None
+
+        delay = self.get_backoff(retries)
+
+        if self.deadline is not None and \
+                clock() - started + delay > self.deadline:
+            return None
+
+        remaining = get_remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        return delay
+
+    def call(self, func, mutating=False):
+        """
+        Calls `func` (callable without arguments) retrying transient
+        failures. Raised Wykop API error has `retries` attribute set.
+        """
+        started = clock()
+        retries = 0
+        while True:
+            try:
+                return func()
+            except WykopAPIError as ex:
+                delay = self.get_delay(
+                    ex, retries, started, mutating=mutating)
+                if delay is None:
+                    ex.retries = retries
+                    raise
+                self._notify(ex, retries, delay)
+
+            time.sleep(delay)
+            retries += 1
+
+    def _notify(self, error, retries, delay):
+        log.debug(
+            "Retrying request in %.2fs (retry %d) after: %r",
+            delay, retries + 1, error)
+        if self.on_retry is not None:
+            self.on_retry(error, retries + 1, delay)
@@ -0,0 +1,78 @@
+"""Wykop API single-flight module."""
+import threading
+
+from wykop.api.exceptions import APITimeoutError, DeadlineExceededError
+from wykop.api.timeouts import get_deadline, get_remaining
+
+
+class Flight(object):
+    """In-flight call shared by concurrent callers."""
+
+    def __init__(self, deadline=None):
+        self.done = threading.Event()
+        self.deadline = deadline
+        self.result = None
+        self.error = None
+
+
+def outlives(error, deadline):
+    """
+    Checks if caller has more time left than leader whose call failed
+    with `error` under `deadline`. Leader's timeout is not shared then,
+    caller makes the call again.
+    """
+    if not isinstance(error, APITimeoutError) or deadline is None:
+        return False
+    current = get_deadline()
+    return current is None or current > deadline
+
+
+class SingleFlight(object):
+    """
+    Runs one call per key at once. Concurrent callers with the same key
+    wait for call in flight and share its result (or error).
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._flights)
+
+    def call(self, key, func):
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = Flight(get_deadline())
+
+            if leader:
+                return self._run(key, flight, func)
+
+            self._wait(flight)
+            if outlives(flight.error, flight.deadline):
+                continue
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+    def _run(self, key, flight, func):
+        try:
+            flight.result = func()
+        except Exception as ex:
+            flight.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def _wait(self, flight):
+        # waiter is still bounded by its own deadline
+        remaining = get_remaining()
+        if not flight.done.wait(
+                None if remaining is None else max(remaining, 0)):
+            raise DeadlineExceededError(0, 'Deadline exceeded')
@@ -0,0 +1,47 @@
+"""Wykop API SQLite stores module."""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class SQLiteStore(object):
+    """
+    Base store backed by SQLite database file, shared between threads and
+    processes. Each thread (and process) uses own connection.
+    """
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._create_tables()
+
+    @property
+    def connection(self):
+        """
+        Gets connection of current thread (and process).
+        """
+        pid = os.getpid()
+        if getattr(self._local, 'pid', None) != pid:
+            self._local.connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None)
+            self._local.pid = pid
+        return self._local.connection
+
+    def _create_tables(self):
+        raise NotImplementedError(
+            "%s: `_create_tables` method must be implemented" %
+            self.__class__.__name__)
+
+    @contextmanager
+    def _transaction(self):
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection.cursor()
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
@@ -0,0 +1,127 @@
+"""Wykop API timeouts module."""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from wykop.api.exceptions import DeadlineExceededError
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+clock = getattr(time, 'monotonic', time.time)
+
+
+class LocalDeadline(threading.local):
+    """Thread local deadline (for Python without context variables)."""
+
+    value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        previous, self.value = self.value, value
+        return previous
+
+    def reset(self, token):
+        self.value = token
+
+
+if ContextVar is not None:
+    # context variables are also task local in asyncio
+    _deadline = ContextVar('wykop_deadline', default=None)
+else:
+    _deadline = LocalDeadline()
+
+
+def get_deadline():
+    """
+    Gets current deadline (clock time) or None.
+    """
+    return _deadline.get()
+
+
+def get_remaining():
+    """
+    Gets seconds remaining to current deadline or None.
+    """
+    until = _deadline.get()
+    if until is None:
+        return None
+    return until - clock()
+
+
+@contextmanager
+def deadline_at(until):
+    """
+    Bounds requests made within block by `until` clock time. Outer
+    deadline still applies if it's earlier.
+    """
+    current = _deadline.get()
+    if current is not None and (until is None or current < until):
+        until = current
+    token = _deadline.set(until)
+    try:
+        yield until
+    finally:
+        _deadline.reset(token)
+
+
+def deadline(timeout):
+    """
+    Bounds requests made within block (including retries and
+    re-authentication) to `timeout` seconds in total.
+    """
+    return deadline_at(clock() + timeout)
+
+
+def with_deadline(func, until):
+    """
+    Wraps `func` to run with `until` deadline, also when it's called in
+    other thread.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with deadline_at(until):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def check_deadline():
+    """
+    Raises `DeadlineExceededError` if current deadline passed.
+    """
+    remaining = get_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError(0, 'Deadline exceeded')
+
+
+def cap_timeout(timeout):
+    """
+    Caps request timeout (seconds or `(connect, read)` pair) by time
+    remaining to current deadline.
+    """
+    remaining = get_remaining()
+    if remaining is None:
+        return timeout
+
+    remaining = max(remaining, 0)
+    if isinstance(timeout, tuple):
+        return tuple(
+            remaining if value is None else min(value, remaining)
+            for value in timeout)
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+def split_timeout(timeout):
+    """
+    Splits request timeout into `(connect, read)` pair.
+    """
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
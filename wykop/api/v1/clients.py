@@ -3,15 +3,14 @@ import base64
 import hashlib
 import logging
 from datetime import date, timedelta
-from itertools import cycle
 
 from six.moves.urllib.parse import urlunparse, quote_plus
 
-from wykop.api.clients import BaseWykopAPI
+from wykop.api.clients import CLIENT_PARSER, BaseWykopAPI
 from wykop.api.decorators import login_required
 from wykop.api.exceptions import WykopAPIError, DailtyRequestLimitError
+from wykop.api.keys import KeyScheduler
 from wykop.api.parsers import default_parser
-from wykop.api.requesters import default_requester
 from wykop.utils import (
     dictmap,
     paramsencode,
@@ -29,35 +28,65 @@ class BaseWykopAPIv1(BaseWykopAPI):
     _protocol = 'https'
     _domain = 'a.wykop.pl'
 
+    def get_page_items(self, response):
+        """
+        Gets list of items from paged response.
+        """
+        if isinstance(response, dict):
+            return response.get('items') or []
+        return response or []
+
     def request(self, rtype, rmethod, rmethod_params=None,
                 api_params=None, post_params=None, file_params=None,
-                parser=default_parser, requester=default_requester):
+                parser=CLIENT_PARSER, requester=None, timeout=None,
+                fields=None, stream=False, keys=None):
         """
-        Makes request.
+        Makes request. Optional `timeout` (seconds or `(connect, read)`
+        pair) overrides requester's one; client's parser is used unless
+        `parser` is given. With `fields` (ie. `['id', 'author.login']`)
+        set, only these fields of response items are kept. With `stream`
+        set, returns iterator over response items parsed as they're
+        downloaded. Request is signed with `keys` (`(appkey, secretkey)`
+        pair) if given, client's ones otherwise.
         """
+        appkey, secretkey = keys or (None, None)
         log.debug('Making request')
 
+        if parser is CLIENT_PARSER:
+            parser = self.parser
+        if fields and parser is not None:
+            parser = parser.project(fields)
+
         rmethod_params = rmethod_params or []
         api_params = api_params or {}
         post_params = post_params or {}
         file_params = file_params or {}
+        requester = requester or self.requester
 
         # sanitize data
         rtype = force_text(rtype)
         rmethod = force_text(rmethod)
         post_params = dictmap(force_bytes, post_params)
         api_params = dictmap(force_text, api_params)
+        if appkey is not None:
+            # endpoint methods pass client's appkey
+            api_params['appkey'] = force_text(appkey)
 
         url = self.construct_url(rtype, rmethod, *rmethod_params, **api_params)
-        headers = self.get_headers(url, **post_params)
+        if secretkey is None:
+            headers = self.get_headers(url, **post_params)
+        else:
+            headers = self._get_headers(url, post_params, secretkey)
 
-        response = requester.make_request(
-            url, post_params, headers, file_params)
+        if stream:
+            return self.send_stream(
+                url, post_params, headers, file_params, parser, requester,
+                timeout=timeout, appkey=appkey)
 
-        if parser is None:
-            return response
-
-        return parser.parse(response)
+        return self.send(
+            url, post_params, headers, file_params, parser, requester,
+            timeout=timeout, endpoint='/'.join([rtype, rmethod]),
+            appkey=appkey)
 
     def construct_url(self, rtype, rmethod, *rmethod_params, **api_params):
         """
@@ -101,10 +130,15 @@ class WykopAPIv1(BaseWykopAPIv1):
     """Wykop API version 1."""
 
     def __init__(self, appkey, secretkey, login=None, accountkey=None,
-                 password=None, output='', response_format='json'):
+                 password=None, output='', response_format='json',
+                 requester=None, rate_limiter=None, retry_policy=None,
+                 cache=None, coalesce=True, parser=None):
         super(WykopAPIv1, self).__init__(
             appkey, secretkey, login=login, accountkey=accountkey,
-            password=password, output=output, response_format=response_format)
+            password=password, output=output, response_format=response_format,
+            requester=requester, rate_limiter=rate_limiter,
+            retry_policy=retry_policy, cache=cache, coalesce=coalesce,
+            parser=parser)
 
         if self.login and (self.accountkey or self.password):
             self.authenticate()
@@ -129,7 +163,8 @@ class WykopAPIv1(BaseWykopAPIv1):
         if password:
             post_params['password'] = password
 
-        return self.request('user', 'login', post_params=post_params)
+        return self.request('user', 'login', post_params=post_params,
+                            parser=default_parser)
 
     # Connect
 
@@ -223,11 +258,17 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('links', 'promoted',
                             api_params=api_params)
 
+    def iter_links_promoted(self, **kwargs):
+        return self.paginate(self.get_links_promoted, **kwargs)
+
     def get_links_upcoming(self, page=1, sort='date'):
         api_params = {'appkey': self.appkey, 'page': page, 'sort': sort}
         return self.request('links', 'upcoming',
                             api_params=api_params)
 
+    def iter_links_upcoming(self, **kwargs):
+        return self.paginate(self.get_links_upcoming, **kwargs)
+
     # MyWykop
 
     @login_required
@@ -237,6 +278,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('mywykop', 'index',
                             api_params=api_params)
 
+    def iter_mywykop(self, **kwargs):
+        return self.paginate(self.get_mywykop, **kwargs)
+
     @login_required
     def get_mywykop_tags(self, page=1):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey,
@@ -244,6 +288,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('mywykop', 'tags',
                             api_params=api_params)
 
+    def iter_mywykop_tags(self, **kwargs):
+        return self.paginate(self.get_mywykop_tags, **kwargs)
+
     @login_required
     def get_mywykop_users(self, page=1):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey,
@@ -251,6 +298,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('mywykop', 'users',
                             api_params=api_params)
 
+    def iter_mywykop_users(self, **kwargs):
+        return self.paginate(self.get_mywykop_users, **kwargs)
+
     @login_required
     def get_notifications(self, page=1):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey,
@@ -258,6 +308,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('mywykop', 'notifications',
                             api_params=api_params)
 
+    def iter_notifications(self, **kwargs):
+        return self.paginate(self.get_notifications, **kwargs)
+
     @login_required
     def get_notifications_count(self):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey}
@@ -271,6 +324,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('mywykop', 'hashtagsnotifications',
                             api_params=api_params)
 
+    def iter_hashtags_notifications(self, **kwargs):
+        return self.paginate(self.get_hashtags_notifications, **kwargs)
+
     @login_required
     def get_hashtags_notifications_count(self):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey}
@@ -314,26 +370,41 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('profile', 'added', [username],
                             api_params=api_params)
 
+    def iter_profile_links(self, username, **kwargs):
+        return self.paginate(self.get_profile_links, username, **kwargs)
+
     def get_profile_published(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'published', [username],
                             api_params=api_params)
 
+    def iter_profile_published(self, username, **kwargs):
+        return self.paginate(self.get_profile_published, username, **kwargs)
+
     def get_profile_commented(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'commented', [username],
                             api_params=api_params)
 
+    def iter_profile_commented(self, username, **kwargs):
+        return self.paginate(self.get_profile_commented, username, **kwargs)
+
     def get_profile_comments(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'comments', [username],
                             api_params=api_params)
 
+    def iter_profile_comments(self, username, **kwargs):
+        return self.paginate(self.get_profile_comments, username, **kwargs)
+
     def get_profile_digged(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'digged', [username],
                             api_params=api_params)
 
+    def iter_profile_digged(self, username, **kwargs):
+        return self.paginate(self.get_profile_digged, username, **kwargs)
+
     @login_required
     def get_profile_buried(self, username, page=1):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey,
@@ -341,6 +412,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('profile', 'buried', [username],
                             api_params=api_params)
 
+    def iter_profile_buried(self, username, **kwargs):
+        return self.paginate(self.get_profile_buried, username, **kwargs)
+
     @login_required
     def observe_profile(self, username):
         return self.request('profile', 'observe', [username])
@@ -363,22 +437,34 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('profile', 'followers', [username],
                             api_params=api_params)
 
+    def iter_profile_followers(self, username, **kwargs):
+        return self.paginate(self.get_profile_followers, username, **kwargs)
+
     def get_profile_followed(self, username, page=1):
         api_params = {'appkey': self.appkey, 'userkey': self.userkey,
                       'page': page}
         return self.request('profile', 'followed', [username],
                             api_params=api_params)
 
+    def iter_profile_followed(self, username, **kwargs):
+        return self.paginate(self.get_profile_followed, username, **kwargs)
+
     def get_profile_favorites(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'favorites', [username],
                             api_params=api_params)
 
+    def iter_profile_favorites(self, username, **kwargs):
+        return self.paginate(self.get_profile_favorites, username, **kwargs)
+
     def get_profile_entries(self, username, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         return self.request('profile', 'entries', [username],
                             api_params=api_params)
 
+    def iter_profile_entries(self, username, **kwargs):
+        return self.paginate(self.get_profile_entries, username, **kwargs)
+
     # Search
 
     def search(self, q, page=1):
@@ -388,6 +474,9 @@ class WykopAPIv1(BaseWykopAPIv1):
                             api_params=api_params,
                             post_params=post_params)
 
+    def iter_search(self, q, **kwargs):
+        return self.paginate(self.search, q, **kwargs)
+
     def search_links(self, q, page=1, what='all', sort='best',
                      when='all', date_from=None, date_to=None, votes=0):
         date_from = date_to or (date.today() - timedelta(days=30))
@@ -400,6 +489,9 @@ class WykopAPIv1(BaseWykopAPIv1):
                             api_params=api_params,
                             post_params=post_params)
 
+    def iter_search_links(self, q, **kwargs):
+        return self.paginate(self.search_links, q, **kwargs)
+
     def search_entries(self, q, page=1):
         api_params = {'appkey': self.appkey, 'page': page}
         post_params = {'q': q}
@@ -407,6 +499,9 @@ class WykopAPIv1(BaseWykopAPIv1):
                             api_params=api_params,
                             post_params=post_params)
 
+    def iter_search_entries(self, q, **kwargs):
+        return self.paginate(self.search_entries, q, **kwargs)
+
     def search_profiles(self, query):
         post_params = {'q': query}
         return self.request('search', 'entries',
@@ -433,6 +528,9 @@ class WykopAPIv1(BaseWykopAPIv1):
         return self.request('top', 'date', [year, month],
                             post_params=post_params)
 
+    def iter_top_date(self, year, month, **kwargs):
+        return self.paginate(self.get_top_date, year, month, **kwargs)
+
     # Related
 
     @login_required
@@ -553,15 +651,25 @@ class WykopAPIv1(BaseWykopAPIv1):
     def get_stream(self, page=1):
         return self.request('stream', 'index', [page])
 
+    def iter_stream(self, **kwargs):
+        return self.paginate(self.get_stream, **kwargs)
+
     def get_stream_hot(self, page=1):
         return self.request('stream', 'hot', [page])
 
+    def iter_stream_hot(self, **kwargs):
+        return self.paginate(self.get_stream_hot, **kwargs)
+
     # Tag
 
     def tag(self, tag_name, page=1):
         return self.request('tag', 'index',
                             [tag_name],
                             {'page': page})
+
+    def iter_tag(self, tag_name, **kwargs):
+        return self.paginate(self.tag, tag_name, **kwargs)
+
     # PM
 
     @login_required
@@ -595,30 +703,42 @@ class WykopAPIv1(BaseWykopAPIv1):
 class RotatingKeysWykopAPI(WykopAPIv1):
     """
     Rotating Keys Wykop API class
+
+    Key pair for each request is chosen by key `strategy` (current key
+    until exhausted by default). Exhausted key is put on `cooldown`
+    seconds (until daily limits reset by default). With quota `ledger`
+    sent requests are counted per key across processes. Raises
+    `KeysExhaustedError` when no key pair is available.
     """
 
-    def __init__(self, key_pairs=[(None, None)], **kwargs):
-        self.keys_iter = self._create_keys_iterator(*key_pairs)
-        keys = next(self.keys_iter)
+    def __init__(self, key_pairs=[(None, None)], ledger=None, strategy=None,
+                 cooldown=None, **kwargs):
+        self.scheduler = KeyScheduler(
+            key_pairs, strategy=strategy, cooldown=cooldown, ledger=ledger)
+        keys = key_pairs[0]
 
         super(RotatingKeysWykopAPI, self).__init__(*keys, **kwargs)
 
     def __getstate__(self):
         state = super(RotatingKeysWykopAPI, self).__getstate__()
-        state['keys_iter'] = self.keys_iter
+        state['scheduler'] = self.scheduler
         return state
 
     def __setstate__(self, state):
         super(RotatingKeysWykopAPI, self).__setstate__(state)
-        self.keys_iter = state['keys_iter']
-
-    def _create_keys_iterator(self, *key_pairs):
-        return cycle(key_pairs)
+        self.scheduler = state['scheduler']
 
     def request(self, *args, **kwargs):
-        try:
-            return super(RotatingKeysWykopAPI, self).request(*args, **kwargs)
-        except DailtyRequestLimitError:
-            log.debug("Using next key pair")
-            self.appkey, self.secretkey = next(self.keys_iter)
-            return self.request(*args, **kwargs)
+        while True:
+            # client is shared by concurrent requests; keys are passed
+            # down instead of set on it
+            keys = self.scheduler.acquire()
+            try:
+                return super(RotatingKeysWykopAPI, self).request(
+                    *args, keys=keys, **kwargs)
+            except DailtyRequestLimitError:
+                log.debug("Key pair %s exhausted", keys[0])
+                self.scheduler.mark_exhausted(keys[0])
+
+    def _record_request(self, appkey):
+        self.scheduler.record(appkey)
@@ -4,11 +4,10 @@ from collections import OrderedDict
 
 from six.moves.urllib.parse import urlunparse, quote_plus
 
-from wykop.api.clients import BaseWykopAPI
+from wykop.api.clients import CLIENT_PARSER, BaseWykopAPI
 from wykop.api.decorators import login_required
 from wykop.api.exceptions import WykopAPIError
 from wykop.api.parsers import default_parser
-from wykop.api.requesters import default_requester
 from wykop.utils import (
     dictmap,
     paramsencode,
@@ -28,15 +27,27 @@ class BaseWykopAPIv2(BaseWykopAPI):
 
     def request(self, rtype, rmethod=None,
                 api_params=None, post_params=None, file_params=None,
-                parser=default_parser, requester=default_requester):
+                parser=CLIENT_PARSER, requester=None, timeout=None,
+                fields=None, stream=False):
         """
-        Makes request.
+        Makes request. Optional `timeout` (seconds or `(connect, read)`
+        pair) overrides requester's one; client's parser is used unless
+        `parser` is given. With `fields` (ie. `['id', 'author.login']`)
+        set, only these fields of response items are kept. With `stream`
+        set, returns iterator over response items parsed as they're
+        downloaded.
         """
         log.debug('Making request')
 
+        if parser is CLIENT_PARSER:
+            parser = self.parser
+        if fields and parser is not None:
+            parser = parser.project(fields)
+
         api_params = api_params or {}
         post_params = post_params or {}
         file_params = file_params or {}
+        requester = requester or self.requester
 
         # sanitize data
         rtype = force_text(rtype)
@@ -47,13 +58,31 @@ class BaseWykopAPIv2(BaseWykopAPI):
         url = self.construct_url(rtype, rmethod, **api_params)
         headers = self.get_headers(url, **post_params)
 
-        response = requester.make_request(
-            url, post_params, headers, file_params)
+        if stream:
+            return self.send_stream(
+                url, post_params, headers, file_params, parser, requester,
+                timeout=timeout)
+
+        endpoint = rtype if rmethod is None else '/'.join([rtype, rmethod])
+        return self.send(
+            url, post_params, headers, file_params, parser, requester,
+            timeout=timeout, endpoint=endpoint)
 
-        if parser is None:
-            return response
+    def get_page_items(self, response):
+        """
+        Gets list of items from paged response.
+        """
+        return response.get('data') or []
 
-        return parser.parse(response)
+    def has_next_page(self, response):
+        """
+        Checks whether paged response is followed by next page.
+        """
+        pagination = response.get('pagination')
+        # no pagination info; stop on empty page
+        if pagination is None:
+            return True
+        return bool(pagination.get('next'))
 
     def construct_url(self, rtype, rmethod=None, **api_params):
         """
@@ -123,7 +152,8 @@ class WykopAPIv2(BaseWykopAPIv2):
         if password:
             post_params['password'] = password
 
-        return self.request('login', post_params=post_params)
+        return self.request('login', post_params=post_params,
+                            parser=default_parser)
 
     # Connect
 
@@ -149,6 +179,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('entries', 'stream', api_params=api_params)
 
+    def iter_stream_entries(self, **kwargs):
+        return self.paginate(self.get_stream_entries, **kwargs)
+
     def get_hot_entries(self, period=12, page=1):
         assert period in [6, 12, 24]
         api_params = {
@@ -157,6 +190,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('entries', 'hot', api_params=api_params)
 
+    def iter_hot_entries(self, **kwargs):
+        return self.paginate(self.get_hot_entries, **kwargs)
+
     # links
 
     def get_links_promoted(self, page=1):
@@ -165,6 +201,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('links', 'promoted', api_params=api_params)
 
+    def iter_links_promoted(self, **kwargs):
+        return self.paginate(self.get_links_promoted, **kwargs)
+
     def get_links_upcoming(self, sort='active', page=1):
         assert sort in ['active', 'date', 'votes', 'comments']
         api_params = {
@@ -173,6 +212,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('links', 'upcoming', api_params=api_params)
 
+    def iter_links_upcoming(self, **kwargs):
+        return self.paginate(self.get_links_upcoming, **kwargs)
+
     def get_link_comments(self, link_id, sort='old'):
         assert sort in ['old', 'new', 'best']
         api_params = {
@@ -208,6 +250,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('mywykop', api_params=api_params)
 
+    def iter_mywykop(self, **kwargs):
+        return self.paginate(self.get_mywykop, **kwargs)
+
     @login_required
     def get_mywykop_tags(self, page=1):
         api_params = {
@@ -215,6 +260,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('mywykop', 'tags', api_params=api_params)
 
+    def iter_mywykop_tags(self, **kwargs):
+        return self.paginate(self.get_mywykop_tags, **kwargs)
+
     @login_required
     def get_mywykop_users(self, page=1):
         api_params = {
@@ -222,6 +270,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('mywykop', 'users', api_params=api_params)
 
+    def iter_mywykop_users(self, **kwargs):
+        return self.paginate(self.get_mywykop_users, **kwargs)
+
     @login_required
     def get_moj(self, page=1):
         api_params = {
@@ -229,6 +280,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('moj', api_params=api_params)
 
+    def iter_moj(self, **kwargs):
+        return self.paginate(self.get_moj, **kwargs)
+
     @login_required
     def get_moj_tagi(self, page=1):
         api_params = {
@@ -236,6 +290,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('moj', 'tagi', api_params=api_params)
 
+    def iter_moj_tagi(self, **kwargs):
+        return self.paginate(self.get_moj_tagi, **kwargs)
+
     # profiles
 
     def get_profile(self, username):
@@ -278,6 +335,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('hits', 'month', api_params=api_params)
 
+    def iter_hits_month(self, year, month, **kwargs):
+        return self.paginate(self.get_hits_month, year, month, **kwargs)
+
     def get_hits_popular(self):
         return self.request('hits', 'popular')
 
@@ -295,12 +355,18 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('notifications', api_params=api_params)
 
+    def iter_notifications(self, **kwargs):
+        return self.paginate(self.get_notifications, **kwargs)
+
     def get_hashtags_notifications(self, page=1):
         api_params = {
             'page': page,
         }
         return self.request('notifications', 'hashtags', api_params=api_params)
 
+    def iter_hashtags_notifications(self, **kwargs):
+        return self.paginate(self.get_hashtags_notifications, **kwargs)
+
     @login_required
     def get_notifications_count(self):
         return self.request('notifications', 'totalcount')
@@ -317,6 +383,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('search', 'entries', post_params=post_params)
 
+    def iter_search_entries(self, query, **kwargs):
+        return self.paginate(self.search_entries, query, **kwargs)
+
     def search_links(self, query, page=1):
         post_params = {
             'q': query,
@@ -324,6 +393,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('search', 'links', post_params=post_params)
 
+    def iter_search_links(self, query, **kwargs):
+        return self.paginate(self.search_links, query, **kwargs)
+
     def search_profiles(self, query):
         post_params = {
             'q': query,
@@ -338,6 +410,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('tags', name, api_params=api_params)
 
+    def iter_tag(self, name, **kwargs):
+        return self.paginate(self.get_tag, name, **kwargs)
+
     @login_required
     def get_tags_observed(self):
         return self.request('tags', 'observed')
@@ -349,6 +424,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('tags', api_params=api_params)
 
+    def iter_tag_entries(self, name, **kwargs):
+        return self.paginate(self.get_tag_entries, name, **kwargs)
+
     def get_tag_links(self, name, page=1):
         api_params = {
             'links': name,
@@ -356,6 +434,9 @@ class WykopAPIv2(BaseWykopAPIv2):
         }
         return self.request('tags', api_params=api_params)
 
+    def iter_tag_links(self, name, **kwargs):
+        return self.paginate(self.get_tag_links, name, **kwargs)
+
     # tagi
 
     def get_tagi(self, name, page=1):
@@ -363,3 +444,6 @@ class WykopAPIv2(BaseWykopAPIv2):
             'page': page,
         }
         return self.request('tags', name, api_params=api_params)
+
+    def iter_tagi(self, name, **kwargs):
+        return self.paginate(self.get_tagi, name, **kwargs)
@@ -1,9 +1,10 @@
 """Wykop utils module."""
-import mimetypes
-from pkg_resources import get_distribution, DistributionNotFound
+import sys
+import threading
+from functools import wraps
+from importlib import import_module
 
 from six import b, u, PY3, text_type, string_types
-from six.moves.urllib.request import pathname2url
 
 
 def paramsencode(d):
@@ -15,6 +16,9 @@ def dictmap(f, d):
 
 
 def mimetype(filename):
+    # mimetypes and urllib.request are slow to import
+    import mimetypes
+    from six.moves.urllib.request import pathname2url
     return mimetypes.guess_type(pathname2url(filename))[0]
 
 
@@ -60,6 +64,76 @@ def force_text(s, encoding='utf-8', errors='strict'):
     return s
 
 
+def once(func):
+    """
+    Calls `func` (without arguments) once, thread-safely, and returns
+    its result afterwards. Result is dropped with `clear`.
+    """
+    lock = threading.Lock()
+    results = []
+
+    @wraps(func)
+    def wrapper():
+        if not results:
+            with lock:
+                if not results:
+                    results.append(func())
+        return results[0]
+
+    def clear():
+        del results[:]
+
+    wrapper.clear = clear
+    return wrapper
+
+
+def lazy_attributes(module_name, attributes):
+    """
+    Gets module `__getattr__` which loads `attributes` on first access.
+    Attributes map names to ``'module:name'`` paths or getters. Python
+    without module `__getattr__` support (< 3.7) loads them at once.
+    """
+    def __getattr__(name):
+        try:
+            attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                "module %r has no attribute %r" % (module_name, name))
+        if callable(attribute):
+            return attribute()
+        path, attribute_name = attribute.split(':')
+        return getattr(import_module(path), attribute_name)
+
+    if sys.version_info < (3, 7):
+        module = sys.modules[module_name]
+        for name in attributes:
+            setattr(module, name, __getattr__(name))
+    return __getattr__
+
+
+class DistributionNotFound(Exception):
+    """Distribution not installed."""
+
+
+def get_distribution(name):
+    # importlib.metadata is much faster to import than pkg_resources;
+    # both are imported when needed
+    try:
+        from importlib.metadata import distribution, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        import pkg_resources
+        from pkg_resources import (
+            DistributionNotFound as PackageNotFoundError,
+        )
+        distribution = pkg_resources.get_distribution
+
+    try:
+        return distribution(name)
+    except PackageNotFoundError:
+        raise DistributionNotFound(name)
+
+
+@once
 def get_version():
     try:
         return get_distribution('wykop').version